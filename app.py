@@ -1,10 +1,15 @@
+import os
+import time
 import streamlit as st
-import pandas as pd
 from datetime import datetime, timedelta
 
 # Import modul lokal
-from scraper import fetch_rss, filter_by_date, scrape_all_articles
-from nlp_pipeline import process_nlp
+from jobs import ACTIVE_STATUSES, get_job, get_job_articles, submit_search_job
+from result_store import (HEAVY_COLUMNS, build_table, export_path, export_results, has_export, has_results,
+                          read_export_bytes, read_result_row, read_results, read_results_bytes,
+                          result_columns, results_path)
+from nlp_router import ROUTE_PROFILES
+from entity_tagger import ENTITY_SEPARATOR
 
 
 # ============================================================
@@ -100,6 +105,66 @@ jalankan_nlp = st.sidebar.toggle(
     help="Summarization, Sentiment Analysis, dan Topic Modelling. Butuh lebih lama."
 )
 
+# --- Backend NLP (lokal / Groq / hybrid per task) ---
+LABEL_BACKEND = {
+    "local": "Lokal (BART/RoBERTa/TF-IDF)",
+    "llm": "Groq (LLM)",
+    "hybrid": "Hybrid (ringkasan artikel panjang ke LLM)",
+}
+backend_nlp = st.sidebar.radio(
+    "🔌 Backend NLP",
+    options=list(ROUTE_PROFILES),
+    index=0,
+    format_func=LABEL_BACKEND.get,
+    disabled=not jalankan_nlp,
+    help="Hybrid: sentimen & topik dihitung lokal (batch), hanya ringkasan artikel panjang yang dikirim ke Groq "
+         "selama budget call/token belum habis. Tanpa GROQ_API_KEY semua task otomatis lokal."
+)
+
+# --- Mode ringkasan ---
+mode_ringkasan = st.sidebar.radio(
+    "📝 Mode Ringkasan",
+    options=["abstractive", "extractive"],
+    format_func=lambda m: "Abstraktif (BART, lambat)" if m == "abstractive" else "Ekstraktif (TextRank, cepat)",
+    disabled=not jalankan_nlp,
+    help="Ekstraktif memilih 2-3 kalimat terpenting dari artikel; cukup untuk monitoring rutin dan jauh lebih cepat di CPU."
+)
+
+# --- Jumlah worker NLP (multi-proses) ---
+nlp_workers = st.sidebar.selectbox(
+    "⚡ Worker NLP",
+    options=[1, 2, 4, 8],
+    index=0,
+    disabled=not jalankan_nlp,
+    help="Jumlah proses paralel untuk NLP. 1 = tanpa process pool. Model di-load sekali per worker."
+)
+
+# --- Incremental: artikel yang sudah pernah diproses untuk keyword ini diambil dari store ---
+hanya_artikel_baru = st.sidebar.toggle(
+    "♻️ Hanya Proses Artikel Baru",
+    value=True,
+    help="Artikel yang sudah pernah di-scrape & dianalisis untuk keyword yang sama diambil dari hasil "
+         "sebelumnya; hanya artikel baru yang di-scrape dan dianalisis."
+)
+
+# --- Relevansi: hanya artikel dengan judul paling relevan yang di-scrape ---
+top_n = st.sidebar.number_input(
+    "🎯 Scrape N Artikel Teratas",
+    min_value=0,
+    max_value=100,
+    value=0,
+    step=5,
+    help="Artikel diurutkan berdasarkan relevansi judul & media terhadap keyword (BM25). 0 = semua artikel."
+)
+min_relevansi = st.sidebar.slider(
+    "Skor Relevansi Minimum",
+    min_value=0.0,
+    max_value=1.0,
+    value=0.0,
+    step=0.05,
+    help="Skor 1.0 = artikel paling relevan di hasil pencarian. Artikel di bawah skor ini tidak di-scrape."
+)
+
 # --- Tombol Cari ---
 cari_btn = st.sidebar.button("🔍 Cari Berita", use_container_width=True, type="primary")
 
@@ -111,19 +176,31 @@ cari_btn = st.sidebar.button("🔍 Cari Berita", use_container_width=True, type=
 st.title("📰 News Scraper & Analisis Berita")
 st.caption("Mengambil berita dari Google News, scraping full text, dan analisis NLP.")
 
-# --- State Management: simpan hasil di session_state ---
+# --- State Management: job aktif disimpan di URL (?job=...) supaya bisa reattach setelah reload ---
 if "df_result" not in st.session_state:
     st.session_state["df_result"] = None
+    st.session_state["df_job"] = None
+
+JOB_POLL_SECONDS = 1.5
+FORMAT_TANGGAL = "DD MMM YYYY, HH:mm"
+
+
+@st.cache_data(max_entries=4, show_spinner=False)
+def _isi_file_download(job_id: str, fmt: str, mtime: float) -> bytes:
+    """Isi file download dibaca sekali per file (key: job, format, waktu modifikasi), bukan setiap rerun."""
+    return read_results_bytes(job_id) if fmt == "parquet" else read_export_bytes(job_id, fmt)
+
+
+def isi_file_download(job_id: str, fmt: str) -> bytes:
+    path = results_path(job_id) if fmt == "parquet" else export_path(job_id, fmt)
+    return _isi_file_download(job_id, fmt, os.path.getmtime(path))
 
 
 # ============================================================
-# Logika Utama — Triggered saat tombol Cari diklik
+# Logika Utama — Tombol Cari men-submit job ke background
 # ============================================================
 
 if cari_btn:
-    # Reset
-    st.session_state["df_result"] = None
-
     # Validasi input
     if not keyword.strip():
         st.warning("⚠️ Tolong masukkan keyword terlebih dahulu.")
@@ -133,82 +210,99 @@ if cari_btn:
         st.error("⚠️ Perbaiki filter tanggal dulu.")
         st.stop()
 
-    # ---------------------------------------------------------
-    # STEP 1: Fetch dari Google News RSS
-    # ---------------------------------------------------------
-    with st.status("🔄 Mengambil berita dari Google News...", expanded=True) as status:
-
-        rss_result = fetch_rss(keyword)
-
-        if rss_result["error"]:
-            st.error(rss_result["error"])
-            st.stop()
-
-        articles_raw = rss_result["articles"]
-        st.write(f"   ✔️ Ditemukan **{len(articles_raw)} artikel** dari RSS.")
-
-        # ---------------------------------------------------------
-        # STEP 2: Filter berdasarkan tanggal
-        # ---------------------------------------------------------
-        articles_filtered = filter_by_date(articles_raw, from_date, to_date)
-        st.write(f"   ✔️ Setelah filter tanggal: **{len(articles_filtered)} artikel**.")
-
-        if len(articles_filtered) == 0:
-            status.update(label="Selesai", state="error")
-            st.info("ℹ️ Tidak ada berita yang sesuai dengan keyword dan filter tanggal. Coba ubah keyword atau perluas rentang tanggal.")
-            st.stop()
-
-        # ---------------------------------------------------------
-        # STEP 3: Scraping full text dari setiap URL
-        # ---------------------------------------------------------
-        st.write("   🕐 Scraping full text dari setiap artikel...")
-        articles_scraped = scrape_all_articles(articles_filtered, delay=1.0)
-
-        # Hitung berapa yang berhasil di-scrape
-        berhasil = sum(1 for a in articles_scraped if a["content"] and not a["content"].startswith("["))
-        st.write(f"   ✔️ Full text berhasil di-extract dari **{berhasil}/{len(articles_scraped)} artikel**.")
-
-        status.update(label="✅ Pengambilan data selesai!", state="complete")
-
-    # ---------------------------------------------------------
-    # STEP 4: NLP Pipeline (Opsional)
-    # ---------------------------------------------------------
-    if jalankan_nlp:
-        st.info("🧠 Menjalankan analisis NLP... Ini mungkin membutuhkan beberapa menit untuk pertama kali (download model).")
-        progress_bar = st.progress(0, text="Mempersiapkan NLP pipeline...")
-
-        articles_final = process_nlp(articles_scraped, streamlit_progress=progress_bar)
-        st.success("✅ Analisis NLP selesai!")
-    else:
-        articles_final = articles_scraped
+    job_id = submit_search_job({
+        "keyword": keyword,
+        "from_date": from_date.isoformat(),
+        "to_date": to_date.isoformat(),
+        "nlp": jalankan_nlp,
+        "backend": backend_nlp,
+        "summary_mode": mode_ringkasan,
+        "workers": nlp_workers,
+        "incremental": hanya_artikel_baru,
+        "top_n": int(top_n),
+        "min_relevance": float(min_relevansi),
+    })
+    st.query_params["job"] = job_id
+
+job_id = st.query_params.get("job")
+job = get_job(job_id) if job_id else None
+
+if job_id and job is None:
+    st.warning("⚠️ Job pencarian tidak ditemukan (mungkin sudah kedaluwarsa).")
+    del st.query_params["job"]
+
+if job is not None:
+    params = job["params"]
+    info = job["info"]
 
     # ---------------------------------------------------------
-    # STEP 5: Bangun DataFrame untuk ditampilkan
+    # Status job (fetch → filter → scrape → NLP)
     # ---------------------------------------------------------
-    rows = []
-    for article in articles_final:
-        tanggal = article.get("date")
-        tanggal_str = tanggal.strftime("%d %b %Y, %H:%M") if tanggal else "-"
-
-        row = {
-            "Tanggal": tanggal_str,
-            "Nama Media": article.get("source", "-"),
-            "Judul Berita": article.get("title", "-"),
-            "URL": article.get("url", "-"),
-            "Jurnalis": article.get("journalist", "-") or "-",
-            "Isi Berita": article.get("content", "-"),
-        }
-
-        # Tambahkan kolom NLP kalau sudah dijalankan
-        if jalankan_nlp:
-            row["Ringkasan"] = article.get("summary", "-")
-            row["Topik/Isu"] = article.get("topics", "-")
-            row["Sentimen"] = article.get("sentiment", "-")
-
-        rows.append(row)
-
-    df = pd.DataFrame(rows)
-    st.session_state["df_result"] = df
+    with st.status(f"🔎 Pencarian \"{params['keyword']}\" — {job['message']}",
+                   expanded=job["status"] in ACTIVE_STATUSES,
+                   state="running" if job["status"] in ACTIVE_STATUSES
+                   else ("complete" if job["status"] == "done" else "error")):
+        for line in info["log"]:
+            st.write(f"   ✔️ {line}")
+        st.caption(f"Job ID: `{job['job_id']}` — buka ulang URL ini untuk kembali ke hasil pencarian.")
+
+    if job["status"] in ACTIVE_STATUSES:
+        st.progress(job["progress"], text=job["message"])
+
+        # Hasil parsial (artikel yang sudah selesai di-scrape)
+        partial = get_job_articles(job["job_id"])
+        if partial:
+            st.subheader(f"⏳ Hasil Sementara: {len(partial)} Artikel")
+            st.dataframe(
+                build_table(partial, with_nlp=False).select(["Tanggal", "Nama Media", "Judul Berita", "URL"]).to_pandas(),
+                use_container_width=True,
+                hide_index=True,
+                column_config={
+                    "Tanggal": st.column_config.DatetimeColumn("Tanggal", format=FORMAT_TANGGAL),
+                    "URL": st.column_config.LinkColumn("URL"),
+                }
+            )
+
+        # Polling: jalankan ulang script sampai job selesai
+        time.sleep(JOB_POLL_SECONDS)
+        st.rerun()
+
+    elif job["status"] == "error":
+        st.error(job["message"])
+
+    elif job["status"] == "interrupted":
+        st.warning(f"⚠️ {job['message']}")
+        if st.button("🔁 Jalankan ulang pencarian ini"):
+            st.query_params["job"] = submit_search_job(params)
+            st.rerun()
+
+    elif not has_results(job["job_id"]):
+        st.session_state["df_result"] = None
+        st.info("ℹ️ Tidak ada berita yang sesuai dengan keyword dan filter tanggal. Coba ubah keyword atau perluas rentang tanggal.")
+
+    elif st.session_state["df_job"] != job["job_id"]:
+        # Tabel ringkas: kolom besar (isi berita, jurnalis) tidak dibaca dari Parquet
+        kolom_ringkas = [c for c in result_columns(job["job_id"]) if c not in HEAVY_COLUMNS]
+        st.session_state["df_result"] = read_results(job["job_id"], columns=kolom_ringkas)
+        st.session_state["df_job"] = job["job_id"]
+        # Entitas pilihan job sebelumnya belum tentu ada di hasil baru
+        st.session_state.pop("filter_entitas", None)
+
+    if job["status"] == "done" and params["nlp"]:
+        route_stats = info.get("route_stats", {})
+        if route_stats.get("llm_unavailable"):
+            st.warning("⚠️ GROQ_API_KEY belum di-set di file .env, semua task dijalankan dengan model lokal.")
+        elif route_stats.get("llm_articles"):
+            stats = info["compression"]
+            st.caption(
+                f"Routing: {route_stats['llm_articles']} artikel ke LLM (~{route_stats['llm_calls_est']} request, "
+                f"~{route_stats['llm_tokens_est']:,} token), {route_stats['local_articles']} artikel lokal. "
+                f"Kompresi konten: {stats['tokens_before']:,} → {stats['tokens_after']:,} token "
+                f"(hemat {stats['saved_pct']}%)."
+            )
+else:
+    st.session_state["df_result"] = None
+    st.session_state["df_job"] = None
 
 
 # ============================================================
@@ -222,74 +316,155 @@ if df is not None and len(df) > 0:
     st.divider()
     st.subheader(f"📋 Hasil: {len(df)} Berita Ditemukan")
 
+    # --- Filter Entitas (wilayah / kementerian / lembaga dari gazetteer) ---
+    if "Entitas" in df.columns:
+        frekuensi_entitas = (
+            df["Entitas"].astype(str).str.split(ENTITY_SEPARATOR).explode()
+            .loc[lambda s: s != "-"].value_counts()
+        )
+        pilihan_entitas = st.multiselect(
+            "🏷️ Filter Entitas",
+            options=frekuensi_entitas.index.tolist(),
+            format_func=lambda e: f"{e} ({frekuensi_entitas[e]})",
+            key="filter_entitas",
+            placeholder="Semua artikel; pilih kota/kabupaten, provinsi, kementerian, atau lembaga...",
+            help="Artikel yang menyebut salah satu entitas terpilih"
+        )
+        if pilihan_entitas:
+            dipilih = set(pilihan_entitas)
+            df = df[df["Entitas"].astype(str).map(lambda v: not dipilih.isdisjoint(v.split(ENTITY_SEPARATOR)))]
+
+    job_id_hasil = st.session_state["df_job"]
+
     # --- Kolom untuk tampilan ringkas dan download ---
-    col_info, col_dl1, col_dl2 = st.columns([3, 1, 1])
+    col_info, col_dl1, col_dl2, col_dl3 = st.columns([3, 1, 1, 1])
 
     col_info.write(f"Menampilkan **{len(df)}** artikel.")
 
-    # Download CSV
-    col_dl1.download_button(
-        label="⬇️ Download CSV",
-        data=df.to_csv(index=False, encoding="utf-8-sig"),  # utf-8-sig agar Excel baca UTF-8 dengan benar
-        file_name="hasil_berita.csv",
-        mime="text/csv",
-        use_container_width=True
+    # File CSV/Excel baru dibuat saat diminta (bukan setiap rerun), di-stream
+    # dari Parquet job ke disk dan di-reuse selama job yang sama ditampilkan
+    def tombol_download(kolom, fmt, label, mime):
+        if has_export(job_id_hasil, fmt):
+            kolom.download_button(
+                label=f"⬇️ Download {label}",
+                data=isi_file_download(job_id_hasil, fmt),
+                file_name=f"hasil_berita.{fmt}",
+                mime=mime,
+                use_container_width=True
+            )
+        elif kolom.button(f"📦 Siapkan {label}", key=f"siapkan_{fmt}", use_container_width=True):
+            with st.spinner(f"Menyiapkan file {label}..."):
+                export_results(job_id_hasil, fmt)
+            st.rerun()
+
+    tombol_download(col_dl1, "csv", "CSV", "text/csv")
+    tombol_download(
+        col_dl2, "xlsx", "Excel",
+        "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
     )
 
-    # Download Excel
-    # to_excel() butuh writer (file/buffer), bukan langsung return bytes.
-    # Pakai BytesIO sebagai buffer di memory.
-    from io import BytesIO
-
-    @st.cache_data
-    def convert_df_to_xlsx(dataframe):
-        buffer = BytesIO()
-        dataframe.to_excel(buffer, index=False, engine="openpyxl")
-        return buffer.getvalue()  # return bytes dari buffer
-
-    col_dl2.download_button(
-        label="⬇️ Download Excel",
-        data=convert_df_to_xlsx(df),
-        file_name="hasil_berita.xlsx",
-        mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-        use_container_width=True
-    )
+    # Download Parquet (file hasil job apa adanya, sudah terkompresi); file
+    # baru dibaca ke memory setelah diminta, seperti CSV/Excel
+    if st.session_state.get("parquet_siap") == job_id_hasil:
+        col_dl3.download_button(
+            label="⬇️ Download Parquet",
+            data=isi_file_download(job_id_hasil, "parquet"),
+            file_name="hasil_berita.parquet",
+            mime="application/vnd.apache.parquet",
+            use_container_width=True
+        )
+    elif col_dl3.button("📦 Siapkan Parquet", key="siapkan_parquet", use_container_width=True):
+        st.session_state["parquet_siap"] = job_id_hasil
+        st.rerun()
 
     st.divider()
 
     # --- Tabel Utama (kolom ringkas) ---
     # Pilih kolom yang ditampilkan di tabel utama agar tidak terlalu lebar
     if "Ringkasan" in df.columns:
-        kolom_tampil = ["Tanggal", "Nama Media", "Judul Berita", "Ringkasan", "Topik/Isu", "Sentimen", "URL"]
+        kolom_tampil = ["Relevansi", "Tanggal", "Nama Media", "Bahasa", "Judul Berita", "Ringkasan", "Topik/Isu", "Klaster Isu", "Sentimen", "Entitas", "URL"]
     else:
-        kolom_tampil = ["Tanggal", "Nama Media", "Judul Berita", "URL"]
+        kolom_tampil = ["Relevansi", "Tanggal", "Nama Media", "Bahasa", "Judul Berita", "URL"]
+    # Hasil job lama belum punya kolom Relevansi / Bahasa / Entitas
+    kolom_tampil = [c for c in kolom_tampil if c in df.columns]
 
     st.dataframe(
         df[kolom_tampil],
         use_container_width=True,
         hide_index=True,
         column_config={
+            "Tanggal": st.column_config.DatetimeColumn("Tanggal", format=FORMAT_TANGGAL),
             "URL": st.column_config.LinkColumn("URL", help="Klik untuk buka artikel"),
             "Ringkasan": st.column_config.TextColumn("Ringkasan", width="large"),
-            "Isi Berita": st.column_config.TextColumn("Isi Berita", width="large"),
+            "Relevansi": st.column_config.ProgressColumn("Relevansi", min_value=0.0, max_value=1.0, format="%.2f"),
         }
     )
 
+    # --- Klaster Isu dari Waktu ke Waktu ---
+    if "Klaster Isu" in df.columns:
+        df_klaster = df[df["Klaster Isu"] != "-"]
+        if len(df_klaster) > 0:
+            st.divider()
+            st.subheader("📈 Klaster Isu dari Waktu ke Waktu")
+
+            hari = df_klaster["Tanggal"].dt.date
+            ukuran_klaster = (
+                df_klaster.assign(Hari=hari)
+                .dropna(subset=["Hari"])
+                .groupby(["Hari", "Klaster Isu"])
+                .size()
+                .unstack(fill_value=0)
+            )
+
+            col_chart, col_total = st.columns([3, 1])
+            col_chart.bar_chart(ukuran_klaster)
+            col_total.dataframe(
+                df_klaster["Klaster Isu"].value_counts().rename("Jumlah Artikel"),
+                use_container_width=True
+            )
+
     # --- Detail per Artikel (Expander) ---
     st.divider()
     st.subheader("📄 Detail Artikel")
 
-    for i, row in df.iterrows():
-        with st.expander(f"{row['Tanggal']}  |  {row['Nama Media']}  |  {row['Judul Berita']}", expanded=False):
+    # Hanya artikel di halaman aktif yang dibuat widget-nya; isi berita
+    # (kolom besar) dibaca dari Parquet per artikel saat diminta
+    col_cari, col_ukuran = st.columns([3, 1])
+    cari_detail = col_cari.text_input(
+        "🔎 Cari Judul / Media",
+        key="cari_detail",
+        placeholder="Filter artikel di bawah..."
+    )
+    ukuran_halaman = col_ukuran.selectbox("Artikel per Halaman", options=[10, 20, 50], key="ukuran_halaman")
+
+    df_detail = df
+    if cari_detail:
+        cocok = (
+            df["Judul Berita"].str.contains(cari_detail, case=False, regex=False)
+            | df["Nama Media"].astype(str).str.contains(cari_detail, case=False, regex=False)
+        )
+        df_detail = df[cocok]
+
+    jumlah_halaman = max(1, -(-len(df_detail) // ukuran_halaman))
+    col_hal, col_hal_info = st.columns([1, 3])
+    halaman = col_hal.number_input("Halaman", min_value=1, max_value=jumlah_halaman, value=1, key="halaman_detail")
+    halaman = min(halaman, jumlah_halaman)
+    col_hal_info.caption(f"Halaman {halaman} dari {jumlah_halaman} ({len(df_detail)} artikel).")
+
+    mulai = (halaman - 1) * ukuran_halaman
+    df_halaman = df_detail.iloc[mulai:mulai + ukuran_halaman]
+    tanggal_str = df_halaman["Tanggal"].dt.strftime("%d %b %Y, %H:%M").fillna("-")
+
+    for i, row in df_halaman.iterrows():
+        tanggal = tanggal_str[i]
+        with st.expander(f"{tanggal}  |  {row['Nama Media']}  |  {row['Judul Berita']}", expanded=False):
 
             col1, col2 = st.columns([2, 1])
 
             with col1:
                 st.markdown(f"**📰 Judul:** {row['Judul Berita']}")
                 st.markdown(f"**🗞️ Media:** {row['Nama Media']}")
-                st.markdown(f"**📅 Tanggal:** {row['Tanggal']}")
-                if row.get("Jurnalis", "-") != "-":
-                    st.markdown(f"**✍️ Jurnalis:** {row['Jurnalis']}")
+                st.markdown(f"**📅 Tanggal:** {tanggal}")
                 st.markdown(f"**🔗 URL:** [{row['URL']}]({row['URL']})")
 
             with col2:
@@ -299,6 +474,10 @@ if df is not None and len(df) > 0:
                     st.markdown(f"**Sentimen:** {emoji} {sentimen}")
                 if "Topik/Isu" in row:
                     st.markdown(f"**Topik:** {row['Topik/Isu']}")
+                if "Klaster Isu" in row and row["Klaster Isu"] != "-":
+                    st.markdown(f"**Klaster Isu:** {row['Klaster Isu']}")
+                if "Entitas" in row and row["Entitas"] != "-":
+                    st.markdown(f"**Entitas:** {row['Entitas']}")
 
             st.divider()
 
@@ -306,8 +485,12 @@ if df is not None and len(df) > 0:
                 st.markdown("📝 **Ringkasan:**")
                 st.write(row["Ringkasan"])
 
-            st.markdown("📖 **Isi Berita (Full):**")
-            st.write(row["Isi Berita"])
+            # Index df = nomor baris di file Parquet job
+            if st.toggle("📖 Tampilkan Isi Berita (Full)", key=f"isi_{job_id_hasil}_{i}"):
+                detail = read_result_row(job_id_hasil, int(i), columns=list(HEAVY_COLUMNS))
+                if detail.get("Jurnalis", "-") != "-":
+                    st.markdown(f"**✍️ Jurnalis:** {detail['Jurnalis']}")
+                st.write(detail["Isi Berita"])
 
 else:
     # Tampilan awal sebelum pencarian
@@ -0,0 +1,220 @@
+"""
+Record artikel ringkas (`__slots__`) yang dipakai di seluruh alur
+fetch → scrape → NLP → hasil.
+
+Sebelumnya artikel berupa dict biasa yang dimutasi di setiap tahap, dan
+kegagalan scraping ditandai string di `content` (mis. "[Konten tidak ...]")
+yang dicek ulang dengan `startswith` di banyak tempat. Di sini:
+
+- `ArticleRecord` menyimpan field tetap di `__slots__` (tanpa `__dict__` per
+  artikel); nama media, sentimen, dan klaster di-intern supaya ratusan artikel
+  dari media yang sama berbagi satu string.
+- Hasil scraping dicatat di `status` (`ArticleStatus`), `content` tetap kosong
+  kalau gagal. Pesan untuk ditampilkan diambil dari `status_message`.
+- Record tetap bisa dipakai seperti dict (`get`, `[]`, `in`, `update`,
+  `setdefault`, `pop`), jadi kode lama yang memakai dict tetap jalan.
+- `records_to_frame` / `records_from_frame` mengonversi ke/dari DataFrame per
+  kolom, bukan per baris.
+"""
+
+import sys
+from enum import Enum
+
+import pandas as pd
+
+
+class ArticleStatus(str, Enum):
+    """Status scraping artikel."""
+    PENDING = "pending"                # belum di-scrape
+    OK = "ok"                          # full text berhasil di-extract
+    UNRESOLVED = "unresolved"          # URL Google News tidak berhasil di-resolve
+    SOCIAL_MEDIA = "social_media"      # URL sosial media, tidak di-scrape
+    EXTRACT_FAILED = "extract_failed"  # halaman terbuka tapi konten tidak ter-extract
+
+
+STATUS_MESSAGES = {
+    ArticleStatus.PENDING: "[Belum di-scrape]",
+    ArticleStatus.OK: "",
+    ArticleStatus.UNRESOLVED: "[URL tidak berhasil di-resolve]",
+    ArticleStatus.SOCIAL_MEDIA: "[Konten dari media sosial - tidak di-scrape]",
+    ArticleStatus.EXTRACT_FAILED: "[Konten tidak berhasil di-extract]",
+}
+
+# Pesan lama di `content` (data tersimpan sebelum ada status) → status. Dicocokkan utuh,
+# jadi isi berita yang kebetulan diawali "[VIDEO]" atau "[FOTO]" tetap dianggap OK.
+_LEGACY_MESSAGES = {
+    "[URL tidak berhasil di-resolve]": ArticleStatus.UNRESOLVED,
+    "[Konten dari media sosial - tidak di-scrape]": ArticleStatus.SOCIAL_MEDIA,
+    "[Konten tidak berhasil di-extract]": ArticleStatus.EXTRACT_FAILED,
+}
+
+# Field dengan sedikit nilai unik → di-intern
+_INTERNED_FIELDS = frozenset({"source", "sentiment", "topic_cluster", "keyword", "language"})
+
+
+def status_message(status) -> str:
+    return STATUS_MESSAGES.get(ArticleStatus(status), "")
+
+
+class ArticleRecord:
+    """
+    Satu artikel. Field yang belum diisi bernilai None dan dianggap tidak ada
+    (`"summary" in record` → False, `record.get("summary", "-")` → "-").
+    """
+
+    FIELDS = (
+        "title", "date", "url", "rss_url", "source", "journalist", "content", "status", "quality",
+        "relevance", "language", "summary", "sentiment", "sentiment_score", "topics", "topic_id", "topic_cluster", "keyword",
+        "entities",
+    )
+    __slots__ = FIELDS
+
+    def __init__(self, title: str = "", date=None, url: str = "", source: str = "",
+                 content: str = "", journalist: str = "", status=ArticleStatus.PENDING, **fields):
+        self.title = title
+        self.date = date
+        self.url = url
+        self.source = sys.intern(source) if source else source
+        self.content = content
+        self.journalist = journalist
+        self.status = ArticleStatus(status)
+        for name in ("rss_url", "quality", "relevance", "language", "summary", "sentiment", "sentiment_score",
+                     "topics", "topic_id", "topic_cluster", "keyword", "entities"):
+            setattr(self, name, None)
+        for key, value in fields.items():
+            self[key] = value
+
+    # --------------------------------------------------------
+    # Konversi
+    # --------------------------------------------------------
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "ArticleRecord":
+        """Dict (mis. JSON tersimpan) → record. Pesan error lama di `content` diubah jadi status."""
+        if isinstance(data, cls):
+            return data
+        data = {k: v for k, v in data.items() if k in cls.__slots__}
+        content = data.get("content") or ""
+        if "status" not in data:
+            if not content:
+                data["status"] = ArticleStatus.PENDING
+            else:
+                legacy = _LEGACY_MESSAGES.get(content.strip())
+                if legacy is None:
+                    data["status"] = ArticleStatus.OK
+                else:
+                    data["status"], data["content"] = legacy, ""
+        return cls(**data)
+
+    def to_dict(self) -> dict:
+        """Record → dict (hanya field yang terisi; status sebagai string)."""
+        data = {name: getattr(self, name) for name in self.FIELDS if getattr(self, name) is not None}
+        data["status"] = self.status.value
+        return data
+
+    @property
+    def is_scraped(self) -> bool:
+        return self.status is ArticleStatus.OK and bool(self.content)
+
+    # --------------------------------------------------------
+    # Kompatibilitas dict
+    # --------------------------------------------------------
+
+    def __getitem__(self, key: str):
+        if key not in self.__slots__:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __setitem__(self, key: str, value) -> None:
+        if key not in self.__slots__:
+            raise KeyError(f"Field artikel tidak dikenal: {key}")
+        if key == "status":
+            value = ArticleStatus(value)
+        elif key in _INTERNED_FIELDS and isinstance(value, str):
+            value = sys.intern(value)
+        setattr(self, key, value)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.__slots__ and getattr(self, key) is not None
+
+    def get(self, key: str, default=None):
+        value = getattr(self, key, None) if key in self.__slots__ else None
+        return default if value is None else value
+
+    def setdefault(self, key: str, default=None):
+        if key not in self:
+            self[key] = default
+        return self[key]
+
+    def pop(self, key: str, default=None):
+        value = self.get(key, default)
+        if key in self:
+            setattr(self, key, None)
+        return value
+
+    def update(self, fields: dict) -> None:
+        for key, value in fields.items():
+            self[key] = value
+
+    def keys(self) -> list[str]:
+        return [name for name in self.FIELDS if getattr(self, name) is not None]
+
+    def items(self) -> list[tuple]:
+        return [(name, getattr(self, name)) for name in self.keys()]
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, ArticleRecord):
+            return self.to_dict() == other.to_dict()
+        return NotImplemented
+
+    # Record bisa diubah (seperti dict), jadi tidak hashable
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f"ArticleRecord(title={self.title[:40]!r}, source={self.source!r}, status={self.status.value})"
+
+    # Pickle (process pool) tanpa __dict__
+    def __getstate__(self):
+        return tuple(getattr(self, name) for name in self.FIELDS)
+
+    def __setstate__(self, state):
+        for name, value in zip(self.FIELDS, state):
+            setattr(self, name, value)
+
+
+def is_scraped(article) -> bool:
+    """Artikel punya full text hasil scraping (record atau dict tanpa status, mis. korpus benchmark)."""
+    if isinstance(article, ArticleRecord):
+        return article.is_scraped
+    return article.get("status", ArticleStatus.OK) == ArticleStatus.OK and bool(article.get("content"))
+
+
+def to_records(articles: list) -> list[ArticleRecord]:
+    return [ArticleRecord.from_dict(a) for a in articles]
+
+
+# ============================================================
+# Konversi massal ke/dari DataFrame
+# ============================================================
+
+def records_to_frame(records: list[ArticleRecord], fields: tuple | None = None) -> pd.DataFrame:
+    """Record → DataFrame, dibangun per kolom. Status ditulis sebagai string."""
+    fields = fields or ArticleRecord.FIELDS
+    columns = {}
+    for name in fields:
+        values = [getattr(r, name) for r in records]
+        if name == "status":
+            values = [s.value for s in values]
+        columns[name] = values
+    frame = pd.DataFrame(columns, columns=list(fields))
+    return frame.dropna(axis=1, how="all") if fields is ArticleRecord.FIELDS else frame
+
+
+def records_from_frame(frame: pd.DataFrame) -> list[ArticleRecord]:
+    """Kebalikan records_to_frame (kolom yang tidak dikenal diabaikan)."""
+    names = [c for c in frame.columns if c in ArticleRecord.__slots__]
+    columns = [frame[c].astype(object).where(frame[c].notna(), None).tolist() for c in names]
+    records = []
+    for values in zip(*columns):
+        records.append(ArticleRecord.from_dict(dict(zip(names, values))))
+    return records
@@ -0,0 +1,370 @@
+"""
+Penyimpanan artikel persisten dengan full-text search (SQLite FTS5).
+
+Sebelumnya hasil pencarian hanya ada di `st.session_state["df_result"]` dan
+file CSV yang di-download, jadi tidak ada riwayat yang terkumpul. Di sini
+setiap artikel hasil scrape + NLP disimpan ke satu tabel SQLite:
+
+- Upsert berdasarkan URL kanonik (skema/host lowercase, tanpa www, fragment,
+  dan parameter tracking), dalam satu transaksi per batch. Upsert tidak
+  pernah menimpa data bagus: konten hasil scraping yang berhasil tidak
+  diganti hasil scraping yang gagal, dan placeholder NLP ("-", pesan error,
+  hasil default artikel yang tidak bisa dianalisis) tidak menimpa hasil asli.
+- Keyword pencarian disimpan di tabel relasi (satu artikel bisa ditemukan
+  lewat banyak keyword).
+- Index FTS5 (external content) atas judul, isi, dan ringkasan, disinkronkan
+  lewat trigger.
+- `search_articles` memfilter teks, media, tanggal, sentimen, dan keyword
+  dalam hitungan milidetik tanpa scraping ulang.
+"""
+
+import os
+import re
+import sqlite3
+import threading
+import time
+from datetime import datetime
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from article_record import ArticleRecord, ArticleStatus, is_scraped
+from content_validation import is_usable
+
+
+ARTICLE_DB_PATH = os.environ.get("ARTICLE_DB_PATH", os.path.join(".cache", "articles.sqlite3"))
+
+# Parameter query yang hanya untuk tracking (tidak mengubah isi halaman)
+TRACKING_PARAMS = {"fbclid", "gclid", "dclid", "msclkid", "igshid", "ref", "ref_src", "amp", "_ga", "mc_cid", "mc_eid"}
+
+COLUMNS = (
+    "canonical_url", "url", "rss_url", "title", "source", "date", "journalist", "content", "status",
+    "summary", "sentiment", "sentiment_score", "topics", "topic_cluster",
+)
+NLP_COLUMNS = ("summary", "sentiment", "sentiment_score", "topics", "topic_cluster")
+# Nilai pengganti untuk artikel yang tidak bisa dianalisis (bukan hasil NLP sungguhan)
+NLP_PLACEHOLDERS = {"", "-"}
+# Konten lebih pendek dari ini tidak dianalisis NLP (batas yang sama dengan nlp_pipeline/v2)
+MIN_NLP_CHARS = 100
+# Pemisah keyword di hasil group_concat (tidak mungkin muncul di keyword)
+_KEYWORD_SEPARATOR = "\x1f"
+
+_FTS_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+
+def canonical_url(url: str) -> str:
+    """Normalisasi URL supaya artikel yang sama dari RSS/redirect berbeda tetap satu record."""
+    if not url:
+        return ""
+    parts = urlsplit(url.strip())
+    host = parts.netloc.lower()
+    if host.startswith("www."):
+        host = host[4:]
+    query = [
+        (k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+        if not k.lower().startswith("utm_") and k.lower() not in TRACKING_PARAMS
+    ]
+    path = parts.path.rstrip("/") or "/"
+    return urlunsplit((parts.scheme.lower() or "https", host, path, urlencode(sorted(query)), ""))
+
+
+def fts_query(text: str) -> str:
+    """
+    Ubah input bebas user jadi query FTS5 yang aman: setiap kata di-quote
+    (AND), kata terakhir jadi prefix supaya cocok saat user masih mengetik.
+    """
+    tokens = _FTS_TOKEN_RE.findall(text.lower())
+    if not tokens:
+        return ""
+    quoted = [f'"{t}"' for t in tokens]
+    quoted[-1] += "*"
+    return " ".join(quoted)
+
+
+class ArticleStore:
+    """Tabel artikel + index FTS5 (judul, isi, ringkasan)."""
+
+    def __init__(self, path: str = ARTICLE_DB_PATH):
+        self.path = path
+        self._lock = threading.Lock()
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._conn = sqlite3.connect(path, check_same_thread=False, timeout=30)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript("""
+            CREATE TABLE IF NOT EXISTS articles (
+                id              INTEGER PRIMARY KEY,
+                canonical_url   TEXT NOT NULL UNIQUE,
+                url             TEXT,
+                rss_url         TEXT,
+                title           TEXT,
+                source          TEXT,
+                date            TEXT,
+                journalist      TEXT,
+                content         TEXT,
+                status          TEXT,
+                summary         TEXT,
+                sentiment       TEXT,
+                sentiment_score REAL,
+                topics          TEXT,
+                topic_cluster   TEXT,
+                first_seen      REAL NOT NULL,
+                last_seen       REAL NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_articles_date ON articles (date);
+            CREATE INDEX IF NOT EXISTS idx_articles_source ON articles (source);
+            CREATE INDEX IF NOT EXISTS idx_articles_sentiment ON articles (sentiment);
+
+            CREATE VIRTUAL TABLE IF NOT EXISTS articles_fts USING fts5(
+                title, content, summary,
+                content='articles', content_rowid='id',
+                tokenize='unicode61 remove_diacritics 2'
+            );
+
+            CREATE TRIGGER IF NOT EXISTS articles_ai AFTER INSERT ON articles BEGIN
+                INSERT INTO articles_fts (rowid, title, content, summary)
+                VALUES (new.id, new.title, new.content, new.summary);
+            END;
+            CREATE TRIGGER IF NOT EXISTS articles_ad AFTER DELETE ON articles BEGIN
+                INSERT INTO articles_fts (articles_fts, rowid, title, content, summary)
+                VALUES ('delete', old.id, old.title, old.content, old.summary);
+            END;
+            CREATE TRIGGER IF NOT EXISTS articles_au AFTER UPDATE OF title, content, summary ON articles BEGIN
+                INSERT INTO articles_fts (articles_fts, rowid, title, content, summary)
+                VALUES ('delete', old.id, old.title, old.content, old.summary);
+                INSERT INTO articles_fts (rowid, title, content, summary)
+                VALUES (new.id, new.title, new.content, new.summary);
+            END;
+        """)
+        self._migrate()
+        self._conn.commit()
+
+    def _migrate(self) -> None:
+        """Database lama: tambah kolom status dan pindahkan kolom keyword ke tabel relasi."""
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(articles)")}
+        has_links = self._conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'article_keywords'"
+        ).fetchone()
+
+        self._conn.executescript("""
+            CREATE TABLE IF NOT EXISTS article_keywords (
+                keyword    TEXT NOT NULL,
+                article_id INTEGER NOT NULL,
+                PRIMARY KEY (keyword, article_id)
+            ) WITHOUT ROWID;
+            CREATE INDEX IF NOT EXISTS idx_article_keywords_article ON article_keywords (article_id);
+        """)
+        if "keyword" in columns and not has_links:
+            self._conn.execute(
+                "INSERT OR IGNORE INTO article_keywords SELECT keyword, id FROM articles WHERE keyword IS NOT NULL"
+            )
+
+        if "status" not in columns:
+            self._conn.execute("ALTER TABLE articles ADD COLUMN status TEXT")
+            # Baris lama: status dari isi (pesan error lama di content → status gagal)
+            rows = self._conn.execute("SELECT id, content FROM articles").fetchall()
+            updates = []
+            for article_id, content in rows:
+                status = ArticleRecord.from_dict({"content": content or ""}).status
+                updates.append((status.value, "" if status is not ArticleStatus.OK else content, article_id))
+            self._conn.executemany("UPDATE articles SET status = ?, content = ? WHERE id = ?", updates)
+
+    # --------------------------------------------------------
+    # Tulis
+    # --------------------------------------------------------
+
+    @staticmethod
+    def _to_row(article: dict) -> tuple:
+        """
+        Artikel → baris tabel. Kolom yang tidak boleh menimpa nilai tersimpan
+        dikirim sebagai NULL: konten/jurnalis artikel yang gagal di-scrape, dan
+        field NLP artikel yang tidak bisa dianalisis atau masih placeholder.
+        """
+        date = article.get("date")
+        scraped = is_scraped(article)
+        status = ArticleStatus.OK if scraped else ArticleStatus(article.get("status") or ArticleStatus.PENDING)
+        # Artikel yang tidak dianalisis hanya membawa hasil default (mis. Netral/0.0)
+        analyzed = scraped and is_usable(article) and len(article.get("content") or "") >= MIN_NLP_CHARS
+        values = {
+            "canonical_url": canonical_url(article.get("url") or article.get("rss_url", "")),
+            "url": article.get("url"),
+            "rss_url": article.get("rss_url"),
+            "title": article.get("title"),
+            "source": article.get("source"),
+            "date": date.isoformat() if isinstance(date, datetime) else date,
+            "journalist": (article.get("journalist") or None) if scraped else None,
+            "content": article.get("content") if scraped else None,
+            "status": status.value,
+        }
+        for column in NLP_COLUMNS:
+            value = article.get(column) if analyzed else None
+            if isinstance(value, str) and (value.strip() in NLP_PLACEHOLDERS or value.startswith("[")):
+                value = None
+            values[column] = value
+        return tuple(values[c] for c in COLUMNS)
+
+    def upsert(self, articles: list[dict], keyword: str | None = None) -> int:
+        """
+        Simpan/perbarui artikel dalam satu transaksi (key: URL kanonik).
+        Nilai NULL di baris baru tidak menghapus nilai tersimpan; status "ok"
+        tersimpan tidak turun jadi gagal. `keyword` (atau field `keyword`
+        artikel) ditambahkan ke daftar keyword artikel, tidak menggantikannya.
+        Return: jumlah artikel yang ditulis.
+        """
+        now = time.time()
+        rows, links = [], []
+        for article in articles:
+            row = self._to_row(article)
+            if not row[0]:
+                continue
+            rows.append(row + (now, now))
+            article_keyword = keyword if keyword is not None else article.get("keyword")
+            if article_keyword:
+                links.append((article_keyword, row[0]))
+        if not rows:
+            return 0
+
+        assignments = []
+        for c in COLUMNS:
+            if c == "canonical_url":
+                continue
+            if c == "status":
+                assignments.append(
+                    "status = CASE WHEN excluded.status = 'ok' OR articles.status IS NOT 'ok' "
+                    "THEN excluded.status ELSE articles.status END"
+                )
+            else:
+                assignments.append(f"{c} = COALESCE(excluded.{c}, articles.{c})")
+        placeholders = ", ".join("?" * (len(COLUMNS) + 2))
+        with self._lock:
+            with self._conn:
+                self._conn.executemany(
+                    f"INSERT INTO articles ({', '.join(COLUMNS)}, first_seen, last_seen) VALUES ({placeholders}) "
+                    f"ON CONFLICT(canonical_url) DO UPDATE SET {', '.join(assignments)}, "
+                    f"last_seen = excluded.last_seen",
+                    rows
+                )
+                self._conn.executemany(
+                    "INSERT OR IGNORE INTO article_keywords (keyword, article_id) "
+                    "SELECT ?, id FROM articles WHERE canonical_url = ?",
+                    links
+                )
+        return len(rows)
+
+    # --------------------------------------------------------
+    # Baca
+    # --------------------------------------------------------
+
+    def search(self, text: str = "", sources: list[str] | None = None,
+               date_from: datetime | None = None, date_to: datetime | None = None,
+               sentiments: list[str] | None = None, keyword: str | None = None,
+               limit: int = 200) -> list[dict]:
+        """
+        Cari artikel. `text` dicari di judul/isi/ringkasan (FTS5, urut relevansi bm25);
+        tanpa `text` hasil diurutkan dari tanggal terbaru. Setiap artikel membawa
+        `keywords` (list semua keyword yang pernah menemukannya).
+        """
+        where, args = [], []
+        select = (
+            f"SELECT a.id, {', '.join('a.' + c for c in COLUMNS)}, a.first_seen, a.last_seen, "
+            f"(SELECT group_concat(k.keyword, '{_KEYWORD_SEPARATOR}') FROM article_keywords k "
+            f"WHERE k.article_id = a.id) AS keywords"
+        )
+        match = fts_query(text) if text else ""
+        if match:
+            sql = f"{select} FROM articles_fts JOIN articles a ON a.id = articles_fts.rowid WHERE articles_fts MATCH ?"
+            args.append(match)
+            # Bobot kolom: judul > ringkasan > isi
+            order = "bm25(articles_fts, 10.0, 1.0, 4.0)"
+        else:
+            sql = f"{select} FROM articles a WHERE 1 = 1"
+            order = "a.date DESC"
+
+        if sources:
+            where.append(f"a.source IN ({', '.join('?' * len(sources))})")
+            args.extend(sources)
+        if sentiments:
+            where.append(f"a.sentiment IN ({', '.join('?' * len(sentiments))})")
+            args.extend(sentiments)
+        if date_from is not None:
+            where.append("a.date >= ?")
+            args.append(date_from.isoformat())
+        if date_to is not None:
+            where.append("a.date <= ?")
+            args.append(date_to.isoformat())
+        if keyword:
+            where.append("a.id IN (SELECT article_id FROM article_keywords WHERE keyword = ?)")
+            args.append(keyword)
+
+        for clause in where:
+            sql += f" AND {clause}"
+        sql += f" ORDER BY {order} LIMIT ?"
+        args.append(int(limit))
+
+        with self._lock:
+            cursor = self._conn.execute(sql, args)
+            names = [d[0] for d in cursor.description]
+            rows = cursor.fetchall()
+
+        articles = []
+        for row in rows:
+            article = dict(zip(names, row))
+            if article.get("date"):
+                article["date"] = datetime.fromisoformat(article["date"])
+            article["keywords"] = sorted(article["keywords"].split(_KEYWORD_SEPARATOR)) if article["keywords"] else []
+            articles.append(article)
+        return articles
+
+    def sources(self) -> list[str]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT DISTINCT source FROM articles WHERE source IS NOT NULL ORDER BY source"
+            ).fetchall()
+        return [r[0] for r in rows]
+
+    def keywords(self) -> list[str]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT DISTINCT keyword FROM article_keywords ORDER BY keyword"
+            ).fetchall()
+        return [r[0] for r in rows]
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM articles").fetchone()[0]
+
+    def revision(self) -> tuple:
+        """
+        Penanda versi isi store. Setiap upsert memperbarui last_seen baris yang
+        ditulis (termasuk yang hanya mendapat hasil NLP atau keyword baru), jadi
+        nilai ini berubah setiap kali ada yang disimpan.
+        """
+        with self._lock:
+            return tuple(self._conn.execute("SELECT COUNT(*), MAX(last_seen) FROM articles").fetchone())
+
+
+# ============================================================
+# Store di-reuse lintas rerun Streamlit
+# ============================================================
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def get_article_store() -> ArticleStore:
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = ArticleStore()
+    return _store
+
+
+def save_articles(articles: list[dict], keyword: str | None = None) -> int:
+    """Simpan hasil pencarian/crawl ke store artikel."""
+    return get_article_store().upsert(articles, keyword=keyword)
+
+
+def search_articles(**filters) -> list[dict]:
+    """Cari riwayat artikel (lihat ArticleStore.search untuk filter yang tersedia)."""
+    return get_article_store().search(**filters)
@@ -0,0 +1,92 @@
+"""
+Skenario jalur Groq (nlp_pipelinev2) terhadap mock server lokal.
+
+Jalankan dari root repo:
+    python -m benchmarks.bench_groq_concurrency --articles 40 --rpm 60 --latency 0.5
+
+Yang dicek:
+- Semua artikel mendapat hasil (tidak ada "[API Error ...]") walaupun server
+  sengaja menolak request di atas kuota (429) → retry + backoff bekerja.
+- Wall time concurrency 1 vs N (rate limiter yang menentukan laju, bukan sleep tetap).
+- Dengan --batch: beberapa artikel per request; --drop-rate membuat mock server
+  menghilangkan sebagian item supaya jalur validasi + split-retry ikut teruji.
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+
+from benchmarks.corpus import make_corpus
+from benchmarks.mock_groq_server import MockGroqServer
+
+
+def run_scenario(nlp, n_articles: int, concurrency: int, server: MockGroqServer, batch_mode: bool = False) -> dict:
+    articles = make_corpus(n_articles, "medium", seed=concurrency)
+    before = dict(server.stats)
+
+    t0 = time.perf_counter()
+    nlp.process_nlp(articles, use_cache=False, concurrency=concurrency, batch_mode=batch_mode)
+    elapsed = time.perf_counter() - t0
+
+    failed = [a for a in articles if a["summary"].startswith("[")]
+    row = {
+        "batch_mode": batch_mode,
+        "concurrency": concurrency,
+        "articles": n_articles,
+        "wall_s": round(elapsed, 2),
+        "articles_per_s": round(n_articles / elapsed, 3),
+        "requests": server.stats["requests"] - before["requests"],
+        "tokens": server.stats["tokens"] - before["tokens"],
+        "rate_limited": server.stats["rate_limited"] - before["rate_limited"],
+        "failed": len(failed),
+    }
+    print(f"batch={str(batch_mode):<5} concurrency={concurrency:<2} wall={row['wall_s']:>7.2f}s  "
+          f"{row['articles_per_s']:.2f} artikel/s  requests={row['requests']}  tokens={row['tokens']}  "
+          f"429={row['rate_limited']}  gagal={row['failed']}")
+    return row
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--articles", type=int, default=40)
+    parser.add_argument("--concurrency", default="1,4,8")
+    parser.add_argument("--rpm", type=int, default=120, help="Kuota RPM di mock server")
+    parser.add_argument("--tpm", type=int, default=200000, help="Kuota TPM di mock server")
+    parser.add_argument("--client-rpm", type=int, help="RPM yang dipakai limiter klien (default: sama dengan server)")
+    parser.add_argument("--latency", type=float, default=0.5)
+    parser.add_argument("--batch", action="store_true", help="Ukur juga mode batch (beberapa artikel per request)")
+    parser.add_argument("--drop-rate", type=float, default=0.0, help="Peluang mock server menghilangkan item batch")
+    parser.add_argument("--json", help="Simpan hasil ke file JSON")
+    args = parser.parse_args()
+
+    server = MockGroqServer(rpm=args.rpm, tpm=args.tpm, latency=args.latency, drop_rate=args.drop_rate).start()
+
+    # Harus di-set sebelum nlp_pipelinev2 di-import (konstanta dibaca saat import)
+    os.environ["GROQ_BASE_URL"] = server.base_url
+    os.environ["GROQ_API_KEY"] = "mock-key"
+    os.environ["GROQ_RPM"] = str(args.client_rpm or args.rpm)
+    os.environ["GROQ_TPM"] = str(args.tpm)
+    import nlp_pipelinev2 as nlp
+
+    try:
+        modes = [False, True] if args.batch else [False]
+        results = [
+            run_scenario(nlp, args.articles, int(c), server, batch_mode=mode)
+            for mode in modes
+            for c in args.concurrency.split(",") if c.strip()
+        ]
+    finally:
+        server.stop()
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=2)
+
+    if any(r["failed"] for r in results):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,313 @@
+"""
+Benchmark biaya setiap tahap NLP (ringkasan, sentimen, topik) per backend.
+
+Jalankan dari root repo:
+    python -m benchmarks.bench_nlp --articles 20 --json hasil_nlp.json
+    python -m benchmarks.bench_nlp --only summary:extractive,topics:local
+    python -m benchmarks.bench_nlp --corpus hasil.jsonl --history benchmarks/results/nlp.jsonl
+
+Konfigurasi (tahap:backend):
+- summary:extractive, summary:abstractive (BART), sentiment:local (RoBERTa),
+  topics:local (TF-IDF)
+- summary/sentiment/topics:groq-mock: nlp_pipelinev2 terhadap
+  mock_groq_server (latency diatur --llm-latency, kuota tidak membatasi)
+
+Setiap konfigurasi dijalankan di subprocess sendiri, jadi waktu load model
+adalah cold start dan peak RSS hanya milik tahap itu. Untuk setiap panjang
+artikel (short/medium/long, korpus sintetis atau rekaman --corpus) diukur:
+latency per artikel (fungsi satu artikel, mean/p50/p95), throughput batch
+(fungsi batch: analyze_sentiment_batch, extract_topics_batch,
+process_nlp dengan concurrency), dan RSS.
+
+Output JSON (--json, atau satu baris per run di --history untuk dilacak dari
+waktu ke waktu) berisi metadata run (commit, versi Python & library, jumlah
+core) dan satu baris per tahap × backend × panjang. Konfigurasi yang butuh
+dependensi tidak terpasang (mis. torch) dicatat dengan field "error".
+"""
+
+import argparse
+import copy
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+
+from benchmarks.corpus import LENGTHS, load_recorded_corpus, make_corpus
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+CONFIGS = (
+    "summary:extractive",
+    "summary:abstractive",
+    "sentiment:local",
+    "topics:local",
+    "summary:groq-mock",
+    "sentiment:groq-mock",
+    "topics:groq-mock",
+)
+LIBRARIES = ("transformers", "torch", "sklearn", "numpy", "groq")
+
+
+# ============================================================
+# BAGIAN 1: Pengukuran (di dalam subprocess)
+# ============================================================
+
+def rss_mb() -> float | None:
+    """RSS proses saat ini (Linux, dari /proc), atau None."""
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return round(int(line.split()[1]) / 1024, 1)
+    except OSError:
+        pass
+    return None
+
+
+def peak_rss_mb() -> float | None:
+    """Peak RSS proses sejak mulai (ru_maxrss: KB di Linux, byte di macOS)."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return round(peak / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
+
+
+def latency_stats(timings: list[float]) -> dict:
+    timings_sorted = sorted(timings)
+    return {
+        "mean_ms": round(statistics.mean(timings), 3),
+        "p50_ms": round(timings_sorted[len(timings) // 2], 3),
+        "p95_ms": round(timings_sorted[min(len(timings) - 1, int(len(timings) * 0.95))], 3),
+    }
+
+
+def _start_groq_mock(latency: float):
+    """Mock server + env Groq; harus sebelum nlp_pipelinev2 di-import."""
+    from benchmarks.mock_groq_server import MockGroqServer
+
+    server = MockGroqServer(rpm=100000, tpm=100_000_000, latency=latency).start()
+    os.environ["GROQ_BASE_URL"] = server.base_url
+    os.environ["GROQ_API_KEY"] = "mock-key"
+    os.environ["GROQ_RPM"] = "100000"
+    os.environ["GROQ_TPM"] = "100000000"
+    return server
+
+
+def load_stage(stage: str, backend: str, args) -> dict:
+    """
+    Load model/backend (yang diukur sebagai waktu load) lalu kembalikan
+    fungsi per artikel (`single(doc, article)`) dan per batch (`batch(docs, articles)`).
+    """
+    if backend == "groq-mock":
+        _start_groq_mock(args.llm_latency)
+        import nlp_pipelinev2
+
+        nlp_pipelinev2.get_groq_client()
+        tasks = (stage,)
+        return {
+            "single": lambda doc, article: nlp_pipelinev2.process_single_article(article["content"], tasks=tasks),
+            "batch": lambda docs, articles: nlp_pipelinev2.process_nlp(
+                copy.deepcopy(articles), use_cache=False, concurrency=args.concurrency, tasks=tasks),
+        }
+
+    import nlp_pipeline
+
+    if (stage, backend) == ("summary", "extractive"):
+        single = nlp_pipeline.summarize_extractive
+        return {"single": lambda doc, article: single(doc),
+                "batch": lambda docs, articles: [single(d) for d in docs]}
+    if (stage, backend) == ("summary", "abstractive"):
+        nlp_pipeline.load_summarizer()
+        single = nlp_pipeline.summarize_text
+        return {"single": lambda doc, article: single(doc),
+                "batch": lambda docs, articles: [single(d) for d in docs]}
+    if (stage, backend) == ("sentiment", "local"):
+        nlp_pipeline.load_sentiment_analyzer()
+        return {"single": lambda doc, article: nlp_pipeline.analyze_sentiment(doc),
+                "batch": lambda docs, articles: nlp_pipeline.analyze_sentiment_batch(docs, batch_size=args.batch_size)}
+    if (stage, backend) == ("topics", "local"):
+        return {"single": lambda doc, article: nlp_pipeline.extract_topics(doc),
+                "batch": lambda docs, articles: nlp_pipeline.extract_topics_batch(docs)}
+    raise ValueError(f"Konfigurasi tidak dikenal: {stage}:{backend}")
+
+
+def corpus_for(length: str, args) -> list[dict]:
+    if args.corpus:
+        return load_recorded_corpus(args.corpus)[length][:args.articles]
+    return make_corpus(args.articles, length, seed=args.seed)
+
+
+def run_config(config: str, args) -> dict:
+    """Satu tahap × backend untuk semua panjang artikel (dipanggil di subprocess)."""
+    stage, backend = config.split(":")
+    report = {"stage": stage, "backend": backend, "rss_start_mb": rss_mb()}
+
+    # Waktu load termasuk import modul (transformers, sklearn, groq)
+    t0 = time.perf_counter()
+    try:
+        fns = load_stage(stage, backend, args)
+    except Exception as e:
+        first_line = str(e).strip().splitlines()[:1] or [""]
+        report["error"] = f"{type(e).__name__}: {first_line[0]}"
+        return report
+    report["load_s"] = round(time.perf_counter() - t0, 3)
+    report["rss_loaded_mb"] = rss_mb()
+
+    from nlp_pipeline import PreparedText
+
+    rows = []
+    for length in args.lengths:
+        articles = corpus_for(length, args)
+        if not articles:
+            continue
+        docs = [PreparedText(a["content"]) for a in articles]
+
+        # Warm-up satu artikel (lazy init, cache tokenizer) tidak ikut diukur
+        fns["single"](docs[0], articles[0])
+        timings = []
+        for doc, article in zip(docs, articles):
+            t0 = time.perf_counter()
+            fns["single"](doc, article)
+            timings.append((time.perf_counter() - t0) * 1000)
+
+        t0 = time.perf_counter()
+        fns["batch"](docs, articles)
+        batch_s = time.perf_counter() - t0
+
+        row = {
+            "length": length,
+            "articles": len(articles),
+            "mean_chars": round(statistics.mean(len(a["content"]) for a in articles)),
+            **latency_stats(timings),
+            "batch_s": round(batch_s, 3),
+            "batch_articles_per_s": round(len(articles) / batch_s, 3) if batch_s > 0 else None,
+            "rss_mb": rss_mb(),
+            "peak_rss_mb": peak_rss_mb(),
+        }
+        rows.append(row)
+    report["results"] = rows
+    report["peak_rss_mb"] = peak_rss_mb()
+    return report
+
+
+# ============================================================
+# BAGIAN 2: Orkestrasi & output
+# ============================================================
+
+def run_metadata(args) -> dict:
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True,
+                                text=True, timeout=10).stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        commit = None
+
+    versions = {}
+    for name in LIBRARIES:
+        try:
+            module = __import__(name)
+            versions[name] = getattr(module, "__version__", "?")
+        except ImportError:
+            versions[name] = None
+
+    return {
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "commit": commit,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "libraries": versions,
+        "config": {
+            "articles": args.articles, "lengths": args.lengths, "seed": args.seed,
+            "corpus": os.path.basename(args.corpus) if args.corpus else "synthetic",
+            "batch_size": args.batch_size, "concurrency": args.concurrency, "llm_latency": args.llm_latency,
+        },
+    }
+
+
+def child_command(config: str, args) -> list[str]:
+    cmd = [sys.executable, "-m", "benchmarks.bench_nlp", "--child", config,
+           "--articles", str(args.articles), "--lengths", ",".join(args.lengths), "--seed", str(args.seed),
+           "--batch-size", str(args.batch_size), "--concurrency", str(args.concurrency),
+           "--llm-latency", str(args.llm_latency)]
+    if args.corpus:
+        cmd += ["--corpus", args.corpus]
+    return cmd
+
+
+def run_in_subprocess(config: str, args) -> dict:
+    """Jalankan satu konfigurasi di proses baru; hasil dibaca dari baris terakhir stdout."""
+    stage, backend = config.split(":")
+    proc = subprocess.run(child_command(config, args), capture_output=True, text=True, timeout=args.timeout)
+    lines = [line for line in proc.stdout.splitlines() if line.strip()]
+    try:
+        return json.loads(lines[-1])
+    except (IndexError, json.JSONDecodeError):
+        tail = (proc.stderr or proc.stdout).strip().splitlines()[-1:] or [""]
+        return {"stage": stage, "backend": backend, "error": f"exit {proc.returncode}: {tail[0][:200]}"}
+
+
+def print_report(report: dict) -> None:
+    name = f"{report['stage']}:{report['backend']}"
+    if "error" in report:
+        print(f"{name:<22} dilewati ({report['error']})")
+        return
+    print(f"{name:<22} load={report['load_s']:>7.2f}s  peak RSS={report['peak_rss_mb']} MB")
+    for row in report["results"]:
+        print(f"{'':<22} {row['length']:<7} mean={row['mean_ms']:>9.2f}ms  p95={row['p95_ms']:>9.2f}ms  "
+              f"batch={row['batch_articles_per_s']} artikel/s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--articles", type=int, default=20, help="Artikel per kategori panjang")
+    parser.add_argument("--lengths", default=",".join(LENGTHS))
+    parser.add_argument("--only", help="Subset konfigurasi tahap:backend, dipisah koma")
+    parser.add_argument("--corpus", help="Korpus rekaman (.jsonl / .json) sebagai ganti korpus sintetis")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--batch-size", type=int, default=16, help="Batch size sentimen lokal")
+    parser.add_argument("--concurrency", type=int, default=4, help="Concurrency process_nlp Groq (mock)")
+    parser.add_argument("--llm-latency", type=float, default=0.2, help="Latency mock server Groq (detik)")
+    parser.add_argument("--timeout", type=int, default=3600, help="Batas waktu per konfigurasi (detik)")
+    parser.add_argument("--json", help="Simpan laporan lengkap ke file JSON")
+    parser.add_argument("--history", help="Tambahkan laporan sebagai satu baris ke file JSONL")
+    parser.add_argument("--child", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    args.lengths = [length for length in args.lengths.split(",") if length in LENGTHS]
+
+    if args.child:
+        print(json.dumps(run_config(args.child, args)))
+        return
+
+    configs = [c.strip() for c in args.only.split(",")] if args.only else list(CONFIGS)
+    unknown = [c for c in configs if c not in CONFIGS]
+    if unknown:
+        parser.error(f"konfigurasi tidak dikenal: {', '.join(unknown)} (pilihan: {', '.join(CONFIGS)})")
+
+    report = run_metadata(args)
+    report["stages"] = []
+    for config in configs:
+        stage_report = run_in_subprocess(config, args)
+        print_report(stage_report)
+        report["stages"].append(stage_report)
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(report, f, indent=2)
+    if args.history:
+        directory = os.path.dirname(args.history)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(args.history, "a") as f:
+            f.write(json.dumps(report) + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""
+Benchmark scaling NLP pipeline lokal dengan process pool (1/2/4/8 worker).
+
+Jalankan dari root repo:
+    python -m benchmarks.bench_nlp_workers --articles 32 --length medium
+
+Setiap konfigurasi worker memakai thread torch = jumlah core / worker.
+Pool di-warm-up dulu (model sudah ter-load) supaya yang diukur hanya throughput.
+Cache dimatikan supaya setiap run benar-benar menjalankan model.
+"""
+
+import argparse
+import json
+import time
+
+from benchmarks.corpus import make_corpus
+from nlp_workers import cpu_count, plan_threads, process_nlp_parallel, shutdown_worker_pool, warm_up_pool
+
+
+def run(worker_counts: list[int], n_articles: int, length: str) -> list[dict]:
+    results = []
+
+    for workers in worker_counts:
+        threads = plan_threads(workers)
+
+        t0 = time.perf_counter()
+        warm_up_pool(workers, threads)
+        load_time = time.perf_counter() - t0
+
+        articles = make_corpus(n_articles, length)
+        t0 = time.perf_counter()
+        process_nlp_parallel(articles, workers=workers, threads=threads, use_cache=False)
+        elapsed = time.perf_counter() - t0
+
+        row = {
+            "workers": workers,
+            "threads_per_worker": threads,
+            "articles": n_articles,
+            "load_s": round(load_time, 2),
+            "total_s": round(elapsed, 2),
+            "articles_per_s": round(n_articles / elapsed, 3),
+        }
+        results.append(row)
+        print(f"workers={workers:<2} threads={threads:<2} load={row['load_s']:>7.2f}s "
+              f"total={row['total_s']:>8.2f}s  {row['articles_per_s']:.3f} artikel/s")
+
+    shutdown_worker_pool()
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--workers", default="1,2,4,8", help="Daftar jumlah worker, dipisah koma")
+    parser.add_argument("--articles", type=int, default=32)
+    parser.add_argument("--length", choices=["short", "medium", "long"], default="medium")
+    parser.add_argument("--json", help="Simpan hasil ke file JSON")
+    args = parser.parse_args()
+
+    worker_counts = [int(w) for w in args.workers.split(",") if w.strip()]
+    print(f"Core tersedia: {cpu_count()}")
+    results = run(worker_counts, args.articles, args.length)
+
+    if results:
+        base = results[0]["articles_per_s"]
+        for row in results:
+            row["speedup"] = round(row["articles_per_s"] / base, 2) if base else None
+            print(f"workers={row['workers']:<2} speedup={row['speedup']}x")
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({"cpu_count": cpu_count(), "results": results}, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
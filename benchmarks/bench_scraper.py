@@ -0,0 +1,233 @@
+"""
+Benchmark scraper (scrape_full_text / scrape_all_articles) secara offline.
+
+Semua request (resolve Google News, download halaman media) dijawab
+mock_news_server lewat HTTP proxy lokal, jadi hasilnya bisa diulang tanpa
+internet. Fallback Selenium dimatikan (SCRAPER_USE_SELENIUM=0): yang diukur
+jalur requests + template media + newspaper3k.
+
+Jalankan dari root repo:
+    python -m benchmarks.bench_scraper --articles 60 --latency 0.05
+    python -m benchmarks.bench_scraper --save-baseline
+
+Skenario:
+- templates: hanya media yang punya template (detik, kompas, ...), termasuk
+  artikel multi-halaman dan noise "Baca juga".
+- generic:   situs tanpa template (heuristik newspaper3k).
+- mixed:     campuran realistis, termasuk host lambat, error 500, halaman
+             "Access Denied", link sosial media, dan link gagal di-resolve.
+- batch:     scrape_all_articles atas campuran yang sama (delay 0).
+
+Setiap skenario melaporkan throughput, latency p50/p95 per artikel, peak
+memory (tracemalloc), jumlah status & extractor, dan akurasi konten (isi
+sama persis dengan teks fixture: tanpa noise, semua halaman tersambung).
+Hasil dibandingkan dengan baseline yang di-commit (baselines/scraper.json,
+dibuat dengan --save-baseline dan konfigurasi default); regresi di atas
+toleransi → exit code 1. Baseline yang tidak ada dianggap error (exit code 2),
+kecuali dijalankan dengan --allow-missing-baseline.
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+import tracemalloc
+from collections import Counter
+
+from benchmarks.mock_news_server import KINDS, TEMPLATE_KINDS, MockNewsServer, build_fixtures, load_fixture_dir
+
+
+BASELINE_PATH = os.path.join(os.path.dirname(__file__), "baselines", "scraper.json")
+
+SCENARIOS = {
+    "templates": list(TEMPLATE_KINDS),
+    "generic": ["generic"],
+    "mixed": list(KINDS),
+    "batch": list(KINDS),
+}
+
+# Metrik yang dibandingkan dengan baseline: (nama, True kalau makin besar makin baik)
+REGRESSION_METRICS = (
+    ("articles_per_s", True),
+    ("p95_s", False),
+    ("peak_mem_kb", False),
+    ("content_match", True),
+)
+
+
+def percentile(values: list[float], q: float) -> float:
+    """Persentil dengan interpolasi linear (q dalam 0-100)."""
+    if not values:
+        return 0.0
+    values = sorted(values)
+    pos = (len(values) - 1) * q / 100
+    lower = int(pos)
+    upper = min(lower + 1, len(values) - 1)
+    return values[lower] + (values[upper] - values[lower]) * (pos - lower)
+
+
+def run_scenario(scraper, name: str, articles: list[dict], server: MockNewsServer) -> dict:
+    from article_record import ArticleRecord
+
+    latencies, results = [], []
+    before = dict(server.stats)
+
+    tracemalloc.reset_peak()
+    mem_before = tracemalloc.get_traced_memory()[0]
+    t0 = time.perf_counter()
+
+    if name == "batch":
+        records = [ArticleRecord(title=a["title"], url=a["url"], source=a["source"]) for a in articles]
+        last = [t0]
+
+        def on_article(done, total, article):
+            now = time.perf_counter()
+            latencies.append(now - last[0])
+            last[0] = now
+
+        scraper.scrape_all_articles(records, delay=0, on_article=on_article)
+        results = [{"content": r.content, "status": r.status, "extractor": None} for r in records]
+    else:
+        for article in articles:
+            start = time.perf_counter()
+            results.append(scraper.scrape_full_text(article["url"]))
+            latencies.append(time.perf_counter() - start)
+
+    elapsed = time.perf_counter() - t0
+    peak = tracemalloc.get_traced_memory()[1] - mem_before
+
+    expected = [(a, r) for a, r in zip(articles, results) if a["expected_content"]]
+    matched = sum(1 for a, r in expected if r["content"] == a["expected_content"])
+    statuses = Counter(r["status"].value for r in results)
+    extractors = Counter(r["extractor"] for r in results if r["extractor"])
+
+    row = {
+        "scenario": name,
+        "articles": len(articles),
+        "wall_s": round(elapsed, 3),
+        "articles_per_s": round(len(articles) / elapsed, 3),
+        "p50_s": round(percentile(latencies, 50), 4),
+        "p95_s": round(percentile(latencies, 95), 4),
+        "peak_mem_kb": round(peak / 1024, 1),
+        "content_match": round(matched / len(expected), 3) if expected else None,
+        "requests": server.stats["requests"] - before["requests"],
+        "statuses": dict(statuses),
+        "extractors": dict(extractors),
+    }
+    print(f"{name:<10} {row['articles']:>4} artikel  {row['articles_per_s']:>7.2f} artikel/s  "
+          f"p50={row['p50_s']:.3f}s  p95={row['p95_s']:.3f}s  peak={row['peak_mem_kb']:.0f} KB  "
+          f"konten cocok={row['content_match']}  requests={row['requests']}")
+    print(f"{'':<10} status={row['statuses']}  extractor={row['extractors'] or '-'}")
+    return row
+
+
+def compare_with_baseline(report: dict, baseline: dict, tolerance: float) -> list[str]:
+    """Daftar regresi dibanding baseline (kosong kalau aman atau konfigurasi berbeda)."""
+    if baseline.get("config") != report["config"]:
+        print("⚠️  Konfigurasi berbeda dengan baseline, perbandingan dilewati.")
+        return []
+
+    base_rows = {row["scenario"]: row for row in baseline["results"]}
+    regressions = []
+    for row in report["results"]:
+        base = base_rows.get(row["scenario"])
+        if base is None:
+            continue
+        for metric, higher_is_better in REGRESSION_METRICS:
+            new, old = row.get(metric), base.get(metric)
+            if new is None or not old:
+                continue
+            change = (new - old) / old
+            worse = -change if higher_is_better else change
+            print(f"  {row['scenario']:<10} {metric:<15} {old:>10} → {new:<10} ({change:+.1%})")
+            if worse > tolerance:
+                regressions.append(f"{row['scenario']}: {metric} {old} → {new} ({change:+.1%})")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--articles", type=int, default=60, help="Jumlah artikel per skenario")
+    parser.add_argument("--scenarios", default=",".join(SCENARIOS))
+    parser.add_argument("--latency", type=float, default=0.05, help="Latency setiap response mock server (detik)")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Tambahan latency acak 0..jitter (detik)")
+    parser.add_argument("--slow-latency", type=float, default=1.0, help="Latency ekstra host lambat (detik)")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--fixtures", help="Folder halaman rekaman tambahan (<host>/<path>.html)")
+    parser.add_argument("--baseline", default=BASELINE_PATH)
+    parser.add_argument("--save-baseline", action="store_true", help="Simpan hasil run ini sebagai baseline")
+    parser.add_argument("--allow-missing-baseline", action="store_true",
+                        help="Jangan gagal kalau file baseline tidak ada (perbandingan dilewati)")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="Batas regresi relatif (0.2 = 20%%)")
+    parser.add_argument("--json", help="Simpan hasil ke file JSON")
+    args = parser.parse_args()
+
+    names = [s.strip() for s in args.scenarios.split(",") if s.strip()]
+    fixtures, scenario_articles = {}, {}
+    for name in names:
+        built, articles = build_fixtures(args.articles, seed=args.seed, kinds=SCENARIOS[name],
+                                         slow_latency=args.slow_latency, prefix=name)
+        fixtures.update(built)
+        scenario_articles[name] = articles
+    if args.fixtures:
+        fixtures.update(load_fixture_dir(args.fixtures))
+
+    server = MockNewsServer(fixtures, latency=args.latency, jitter=args.jitter, seed=args.seed).start()
+
+    # Harus di-set sebelum scraper di-import (USE_SELENIUM dibaca saat import)
+    for key in ("HTTP_PROXY", "http_proxy"):
+        os.environ[key] = server.base_url
+    for key in ("NO_PROXY", "no_proxy"):
+        os.environ.pop(key, None)
+    os.environ["SCRAPER_USE_SELENIUM"] = "0"
+    import scraper
+
+    tracemalloc.start()
+    try:
+        results = [run_scenario(scraper, name, scenario_articles[name], server) for name in names]
+    finally:
+        tracemalloc.stop()
+        server.stop()
+
+    report = {
+        "config": {
+            "articles": args.articles, "latency": args.latency, "jitter": args.jitter,
+            "slow_latency": args.slow_latency, "seed": args.seed, "scenarios": names,
+        },
+        "results": results,
+    }
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(report, f, indent=2)
+
+    if args.save_baseline:
+        os.makedirs(os.path.dirname(args.baseline), exist_ok=True)
+        with open(args.baseline, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"Baseline disimpan ke {args.baseline}")
+        return
+
+    if not os.path.exists(args.baseline):
+        if args.allow_missing_baseline:
+            print(f"Belum ada baseline di {args.baseline}, perbandingan dilewati.")
+            return
+        print(f"❌ Baseline tidak ditemukan: {args.baseline} "
+              f"(buat dengan --save-baseline atau jalankan dengan --allow-missing-baseline).")
+        sys.exit(2)
+
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    print("\nPerbandingan dengan baseline:")
+    regressions = compare_with_baseline(report, baseline, args.tolerance)
+    if regressions:
+        print("\n❌ Regresi:")
+        for line in regressions:
+            print(f"  - {line}")
+        sys.exit(1)
+    print("✔ Tidak ada regresi di atas toleransi.")
+
+
+if __name__ == "__main__":
+    main()
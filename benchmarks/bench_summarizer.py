@@ -0,0 +1,65 @@
+"""
+Benchmark ringkasan ekstraktif (TextRank) vs abstraktif (BART).
+
+Jalankan dari root repo:
+    python -m benchmarks.bench_summarizer --articles 200
+    python -m benchmarks.bench_summarizer --articles 10 --abstractive   # ikut ukur BART (lambat)
+"""
+
+import argparse
+import json
+import statistics
+import time
+
+from benchmarks.corpus import LENGTHS, make_corpus
+from nlp_pipeline import PreparedText, load_summarizer, summarize_extractive, summarize_text
+
+
+def time_per_article(fn, docs: list) -> list[float]:
+    """Latency per artikel dalam milidetik."""
+    timings = []
+    for doc in docs:
+        t0 = time.perf_counter()
+        fn(doc)
+        timings.append((time.perf_counter() - t0) * 1000)
+    return timings
+
+
+def summarize_timings(name: str, length: str, timings: list[float]) -> dict:
+    timings_sorted = sorted(timings)
+    row = {
+        "mode": name,
+        "length": length,
+        "articles": len(timings),
+        "mean_ms": round(statistics.mean(timings), 3),
+        "p50_ms": round(timings_sorted[len(timings) // 2], 3),
+        "p95_ms": round(timings_sorted[min(len(timings) - 1, int(len(timings) * 0.95))], 3),
+    }
+    print(f"{name:<12} {length:<7} mean={row['mean_ms']:>9.3f}ms  p50={row['p50_ms']:>9.3f}ms  p95={row['p95_ms']:>9.3f}ms")
+    return row
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--articles", type=int, default=200)
+    parser.add_argument("--abstractive", action="store_true", help="Ikut ukur BART (butuh torch + download model)")
+    parser.add_argument("--json", help="Simpan hasil ke file JSON")
+    args = parser.parse_args()
+
+    if args.abstractive:
+        load_summarizer()  # Waktu load model tidak ikut diukur
+
+    results = []
+    for length in LENGTHS:
+        docs = [PreparedText(a["content"]) for a in make_corpus(args.articles, length)]
+        results.append(summarize_timings("extractive", length, time_per_article(summarize_extractive, docs)))
+        if args.abstractive:
+            results.append(summarize_timings("abstractive", length, time_per_article(summarize_text, docs)))
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
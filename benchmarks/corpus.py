@@ -0,0 +1,96 @@
+"""
+Korpus sintetis artikel berita Bahasa Indonesia untuk benchmark.
+
+Kalimat diambil acak (dengan seed tetap) dari kumpulan kalimat bergaya berita,
+jadi hasil benchmark bisa diulang dan dibandingkan antar perubahan. Artikel
+hasil crawl sungguhan bisa dipakai lewat `load_recorded_corpus`.
+"""
+
+import json
+import random
+
+
+SENTENCES = [
+    "Badan Pusat Statistik Kota Surabaya mencatat inflasi tahunan sebesar 2,8 persen pada bulan lalu.",
+    "Kenaikan harga beras dan cabai menjadi penyumbang utama inflasi di sejumlah daerah di Jawa Timur.",
+    "Pemerintah daerah menyiapkan operasi pasar untuk menstabilkan harga kebutuhan pokok menjelang hari raya.",
+    "Kepala dinas perdagangan menyatakan stok pangan dalam kondisi aman hingga akhir tahun.",
+    "Pelaku UMKM mengeluhkan turunnya daya beli masyarakat sejak awal kuartal ketiga.",
+    "Bank Indonesia memperkirakan pertumbuhan ekonomi regional tetap berada di kisaran lima persen.",
+    "Realisasi investasi di kawasan industri meningkat seiring masuknya sejumlah perusahaan manufaktur baru.",
+    "Warga mengeluhkan kemacetan panjang akibat proyek perbaikan jalan yang belum rampung.",
+    "Dinas kesehatan melaporkan penurunan kasus demam berdarah dibandingkan periode yang sama tahun lalu.",
+    "Angka pengangguran terbuka turun tipis menurut hasil survei angkatan kerja nasional terbaru.",
+    "Ekspor komoditas perkebunan mengalami kontraksi karena melemahnya permintaan dari pasar global.",
+    "Pemerintah kota berencana memperluas jaringan transportasi publik untuk mengurangi kepadatan lalu lintas.",
+    "Para petani berharap harga gabah kering panen tetap stabil pada musim panen mendatang.",
+    "Program bantuan sosial tunai kembali disalurkan kepada ribuan keluarga penerima manfaat.",
+    "DPRD meminta pemerintah daerah melakukan evaluasi menyeluruh terhadap penyerapan anggaran.",
+    "Nilai tukar petani naik didorong oleh kenaikan harga komoditas hortikultura.",
+    "Sejumlah sekolah mulai menerapkan kurikulum baru dengan pendampingan dari dinas pendidikan.",
+    "Tingkat hunian hotel berbintang meningkat selama libur panjang akhir pekan.",
+    "Kasus korupsi dana desa kembali menjadi sorotan setelah aparat penegak hukum menetapkan tersangka baru.",
+    "Banjir yang melanda sejumlah kecamatan menyebabkan ratusan rumah warga terendam.",
+]
+
+# Target jumlah kalimat per kategori panjang artikel
+LENGTHS = {
+    "short": 4,
+    "medium": 12,
+    "long": 40,
+}
+
+
+def make_article(n_sentences: int, rng: random.Random) -> str:
+    """Bangun satu artikel dari kalimat acak, dibagi ke beberapa paragraf."""
+    sentences = [rng.choice(SENTENCES) for _ in range(n_sentences)]
+    paragraphs = [" ".join(sentences[i:i + 4]) for i in range(0, len(sentences), 4)]
+    return "\n\n".join(paragraphs)
+
+
+def make_corpus(n_articles: int, length: str = "medium", seed: int = 42) -> list[dict]:
+    """Bangun list artikel (format dict sama seperti output scraper)."""
+    rng = random.Random(seed)
+    n_sentences = LENGTHS[length]
+    return [
+        {
+            "title": f"Artikel sintetis {i + 1}",
+            "date": None,
+            "url": f"https://contoh.local/artikel/{length}/{i + 1}",
+            "source": "Benchmark",
+            "content": make_article(n_sentences, rng),
+            "journalist": "",
+        }
+        for i in range(n_articles)
+    ]
+
+
+# Batas panjang konten (karakter) untuk mengelompokkan artikel rekaman
+RECORDED_LENGTH_LIMITS = {"short": 1500, "medium": 5000}
+
+
+def length_bucket(content: str) -> str:
+    for length, limit in RECORDED_LENGTH_LIMITS.items():
+        if len(content) < limit:
+            return length
+    return "long"
+
+
+def load_recorded_corpus(path: str) -> dict[str, list[dict]]:
+    """
+    Artikel rekaman (JSONL, mis. hasil `crawl.py --output hasil.jsonl`, atau list
+    JSON) dikelompokkan per kategori panjang seperti LENGTHS. Artikel tanpa
+    konten dilewati.
+    """
+    with open(path, encoding="utf-8") as f:
+        if path.endswith(".jsonl"):
+            articles = [json.loads(line) for line in f if line.strip()]
+        else:
+            articles = json.load(f)
+
+    buckets = {length: [] for length in LENGTHS}
+    for article in articles:
+        content = article.get("content") or ""
+        if content and not content.startswith("["):
+            buckets[length_bucket(content)].append(article)
+    return buckets
@@ -0,0 +1,194 @@
+"""
+Server HTTP lokal yang meniru endpoint chat completions Groq (format OpenAI).
+
+Dipakai untuk menguji/benchmark jalur Groq tanpa API key dan tanpa kuota:
+- Latency per request bisa diatur.
+- Rate limit RPM/TPM (sliding window 60 detik) ditegakkan di sisi server:
+  request yang melebihi kuota dijawab 429 + header retry-after.
+- Setiap response membawa header x-ratelimit-* seperti API aslinya.
+- Prompt batch (beberapa artikel, lihat nlp_pipelinev2.process_batch) dijawab
+  dengan {"results": [...]}; `drop_rate` sengaja menghilangkan sebagian item
+  untuk menguji validasi + retry per item.
+
+Pemakaian dari kode:
+    server = MockGroqServer(rpm=60, tpm=20000, latency=0.2).start()
+    os.environ["GROQ_BASE_URL"] = server.base_url
+    ...
+    server.stop()
+
+Atau standalone:
+    python -m benchmarks.mock_groq_server --port 8765 --rpm 30
+"""
+
+import argparse
+import json
+import random
+import threading
+import time
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+def _estimate_tokens(text: str) -> int:
+    return len(text) // 4 + 1
+
+
+def fake_analysis(text: str) -> dict:
+    """Jawaban JSON tiruan untuk satu artikel."""
+    snippet = " ".join(text.split()[:20])
+    return {"summary": f"Ringkasan: {snippet}", "sentiment": "Netral", "topic": "Topik uji"}
+
+
+class MockGroqServer:
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, rpm: int = 30,
+                 tpm: int = 12000, latency: float = 0.2, drop_rate: float = 0.0, seed: int = 0):
+        self.drop_rate = drop_rate
+        self.random = random.Random(seed)
+        self.rpm = rpm
+        self.tpm = tpm
+        self.latency = latency
+        self.lock = threading.Lock()
+        self.window = deque()  # (timestamp, tokens) request yang diterima 60 detik terakhir
+        self.stats = {"requests": 0, "ok": 0, "rate_limited": 0, "tokens": 0}
+        self.max_concurrent = 0
+        self._active = 0
+
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def do_POST(self):
+                body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+                server.handle(self, json.loads(body or b"{}"))
+
+        self.httpd = ThreadingHTTPServer((host, port), Handler)
+        self.httpd.daemon_threads = True
+        self._thread = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "MockGroqServer":
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    # --------------------------------------------------------
+
+    def _usage(self, now: float) -> tuple[int, int]:
+        while self.window and now - self.window[0][0] >= 60:
+            self.window.popleft()
+        return len(self.window), sum(t for _, t in self.window)
+
+    def _ratelimit_headers(self, now: float) -> dict:
+        used_requests, used_tokens = self._usage(now)
+        reset = 60 - (now - self.window[0][0]) if self.window else 0
+        return {
+            "x-ratelimit-limit-requests": str(self.rpm),
+            "x-ratelimit-limit-tokens": str(self.tpm),
+            "x-ratelimit-remaining-requests": str(max(0, self.rpm - used_requests)),
+            "x-ratelimit-remaining-tokens": str(max(0, self.tpm - used_tokens)),
+            "x-ratelimit-reset-requests": f"{reset:.2f}s",
+            "x-ratelimit-reset-tokens": f"{reset:.2f}s",
+        }
+
+    def build_content(self, request: dict) -> str:
+        """Isi jawaban model (JSON string). Bisa di-override untuk skenario lain."""
+        user_message = request.get("messages", [{}])[-1].get("content", "")
+
+        if "Daftar Artikel (JSON):" in user_message:
+            items = json.loads(user_message.split("Daftar Artikel (JSON):")[-1])
+            results = []
+            for item in items:
+                with self.lock:
+                    dropped = self.random.random() < self.drop_rate
+                if not dropped:
+                    results.append({"id": item["id"], **fake_analysis(item["text"])})
+            return json.dumps({"results": results}, ensure_ascii=False)
+
+        return json.dumps(fake_analysis(user_message.split("Teks Berita:")[-1]), ensure_ascii=False)
+
+    def handle(self, handler: BaseHTTPRequestHandler, request: dict):
+        prompt = "".join(m.get("content", "") for m in request.get("messages", []))
+        tokens = _estimate_tokens(prompt) + int(request.get("max_tokens") or 0)
+
+        with self.lock:
+            now = time.monotonic()
+            self.stats["requests"] += 1
+            used_requests, used_tokens = self._usage(now)
+
+            if used_requests + 1 > self.rpm or used_tokens + tokens > self.tpm:
+                self.stats["rate_limited"] += 1
+                retry_after = 60 - (now - self.window[0][0]) if self.window else 1
+                headers = self._ratelimit_headers(now)
+                headers["retry-after"] = f"{max(0.1, retry_after):.2f}"
+                self._send(handler, 429, {"error": {"message": "Rate limit reached", "type": "tokens"}}, headers)
+                return
+
+            self.window.append((now, tokens))
+            self.stats["tokens"] += tokens
+            self._active += 1
+            self.max_concurrent = max(self.max_concurrent, self._active)
+            headers = self._ratelimit_headers(now)
+
+        try:
+            time.sleep(self.latency)
+            body = {
+                "id": f"chatcmpl-mock-{self.stats['requests']}",
+                "object": "chat.completion",
+                "created": int(time.time()),
+                "model": request.get("model", "mock"),
+                "choices": [{
+                    "index": 0,
+                    "message": {"role": "assistant", "content": self.build_content(request)},
+                    "finish_reason": "stop",
+                }],
+                "usage": {"prompt_tokens": tokens, "completion_tokens": 50, "total_tokens": tokens + 50},
+            }
+            self._send(handler, 200, body, headers)
+            with self.lock:
+                self.stats["ok"] += 1
+        finally:
+            with self.lock:
+                self._active -= 1
+
+    @staticmethod
+    def _send(handler: BaseHTTPRequestHandler, status: int, body: dict, headers: dict):
+        payload = json.dumps(body).encode("utf-8")
+        handler.send_response(status)
+        handler.send_header("Content-Type", "application/json")
+        handler.send_header("Content-Length", str(len(payload)))
+        for key, value in headers.items():
+            handler.send_header(key, value)
+        handler.end_headers()
+        handler.wfile.write(payload)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Mock server Groq chat completions")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--rpm", type=int, default=30)
+    parser.add_argument("--tpm", type=int, default=12000)
+    parser.add_argument("--latency", type=float, default=0.2)
+    parser.add_argument("--drop-rate", type=float, default=0.0)
+    args = parser.parse_args()
+
+    server = MockGroqServer(port=args.port, rpm=args.rpm, tpm=args.tpm, latency=args.latency,
+                            drop_rate=args.drop_rate)
+    print(f"Mock Groq server di {server.base_url} (set GROQ_BASE_URL ke alamat ini)")
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,321 @@
+"""
+Server HTTP lokal pengganti Google News + situs media untuk benchmark scraper.
+
+Server berjalan sebagai HTTP proxy: set `HTTP_PROXY` ke alamat server, lalu
+semua request scraper (requests, newspaper3k) ke `http://news.google.com/...`,
+`http://news.detik.com/...`, dst. dijawab dari fixture lokal. Hostname tetap
+asli, jadi pemilihan template media (publisher_templates) ikut teruji.
+
+Fixture sintetis (`build_fixtures`, seed tetap → bisa diulang):
+- Link Google News (`/rss/articles/<id>`) → 302 ke URL media.
+- Halaman media dengan layout setiap template (detik, kompas, tribunnews,
+  cnnindonesia, liputan6, antaranews), termasuk noise "Baca juga" dan
+  artikel multi-halaman (`?page=all` / `?single=1` / link halaman berikutnya).
+- Situs tanpa template (jalur newspaper3k), host lambat, host error 500,
+  halaman "Access Denied", link ke sosial media, dan link yang tidak bisa
+  di-resolve (redirect ke consent.google.com).
+
+Halaman hasil rekaman bisa ditambahkan dengan `load_fixture_dir`: file
+`<dir>/<host>/<path>.html` dilayani di `http://<host>/<path>`.
+
+Pemakaian dari kode:
+    server = MockNewsServer(latency=0.05).start()
+    os.environ["HTTP_PROXY"] = server.base_url
+    ...
+    server.stop()
+
+Atau standalone:
+    python -m benchmarks.mock_news_server --port 8766 --articles 30
+"""
+
+import argparse
+import os
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qsl, urlsplit
+
+from benchmarks.corpus import SENTENCES
+
+
+GOOGLE_HOST = "news.google.com"
+
+# Jenis artikel → (host, bobot di campuran default)
+KINDS = {
+    "detik": ("news.detik.com", 3),
+    "kompas": ("regional.kompas.com", 3),
+    "tribunnews": ("surabaya.tribunnews.com", 3),
+    "cnnindonesia": ("www.cnnindonesia.com", 2),
+    "liputan6": ("www.liputan6.com", 2),
+    "antaranews": ("www.antaranews.com", 2),
+    "generic": ("www.beritadaerah.example", 2),
+    "slow": ("lambat.beritadaerah.example", 1),
+    "error": ("rusak.beritadaerah.example", 1),
+    "blocked": ("blokir.beritadaerah.example", 1),
+    "social": ("x.com", 1),
+    "unresolved": ("consent.google.com", 1),
+}
+TEMPLATE_KINDS = ("detik", "kompas", "tribunnews", "cnnindonesia", "liputan6", "antaranews")
+NOISE_PARAGRAPH = "Baca juga: Harga cabai rawit di pasar tradisional kembali turun"
+
+
+class Fixture:
+    """Satu response: status, body, header tambahan, dan latency ekstra."""
+
+    __slots__ = ("status", "body", "headers", "latency")
+
+    def __init__(self, body: str = "", status: int = 200, headers: dict | None = None, latency: float = 0.0):
+        self.status = status
+        self.body = body
+        self.headers = headers or {}
+        self.latency = latency
+
+
+# ============================================================
+# BAGIAN 1: Fixture sintetis
+# ============================================================
+
+def _paragraphs(rng: random.Random, n_paragraphs: int) -> list[str]:
+    return [" ".join(rng.choice(SENTENCES) for _ in range(4)) for _ in range(n_paragraphs)]
+
+
+def _p(paragraphs: list[str]) -> str:
+    return "".join(f"<p>{p}</p>" for p in paragraphs)
+
+
+def _page(head: str, body: str) -> str:
+    return (f"<!DOCTYPE html><html><head><meta charset='utf-8'>{head}</head><body>"
+            f"<header><nav><a href='/'>Beranda</a></nav></header>{body}"
+            f"<footer>Hak cipta dilindungi undang-undang.</footer></body></html>")
+
+
+def render_article(kind: str, i: int, title: str, paragraphs: list[str], page: int | None) -> str:
+    """
+    HTML artikel dengan layout media `kind`. `page=None` → semua halaman
+    (versi `?page=all`), selain itu hanya halaman itu (2 halaman per artikel).
+    """
+    half = len(paragraphs) // 2
+    shown = paragraphs if page is None else (paragraphs[:half] if page == 1 else paragraphs[half:])
+    with_noise = shown[:1] + [NOISE_PARAGRAPH] + shown[1:]
+    date = f"2025-01-{i % 28 + 1:02d}"
+    h1 = f"<h1>{title}</h1>"
+
+    if kind == "detik":
+        nav = "" if page != 1 else "<div class='detail__anchor-numb'><a class='next' href='?page=2'>2</a></div>"
+        return _page(
+            f"<meta name='publishdate' content='{date.replace('-', '/')} 10:00:00'>",
+            f"{h1}<div class='detail__author'>Jurnalis {i} - detikNews</div>"
+            f"<div class='detail__body-text'>{_p(with_noise)}"
+            f"<table class='linksisip'><tr><td>Artikel terkait</td></tr></table>{nav}</div>")
+    if kind == "kompas":
+        nav = "" if page != 1 else "<a class='paging__link--next' href='?page=2'>Berikutnya</a>"
+        return _page(
+            f"<meta name='content_PublishedDate' content='{date} 10:00:00'>",
+            f"{h1}<div class='read__credit__item'>Penulis: Jurnalis {i}</div>"
+            f"<div class='read__content'>{_p(with_noise)}"
+            f"<div class='inner-link-baca-juga'>Artikel lain</div></div>{nav}")
+    if kind == "tribunnews":
+        nav = "" if page != 1 else "<div class='paging'><a class='next' href='?page=2'>Next</a></div>"
+        return _page(
+            f"<meta name='publishdate' content='{date} 10:00:00'>",
+            f"{h1}<div id='penulis'><a href='#'>Jurnalis {i}</a></div>"
+            f"<div class='side-article txt-article'>{_p(with_noise)}</div>{nav}")
+    if kind == "cnnindonesia":
+        return _page(
+            f"<meta name='publishdate' content='{date} 10:00:00'><meta name='author' content='Jurnalis {i}'>",
+            f"{h1}<div class='detail-text'>{_p(with_noise)}<div class='inbetween_ads'>IKLAN</div></div>")
+    if kind == "liputan6":
+        items = "".join(
+            f"<div class='article-content-body__item-content'>{_p(paragraphs[j:j + 2])}</div>"
+            f"<div class='baca-juga-collections'>{NOISE_PARAGRAPH}</div>"
+            for j in range(0, len(paragraphs), 2)
+        )
+        return _page(
+            f"<meta property='article:published_time' content='{date}T10:00:00+07:00'>",
+            f"{h1}<span class='read-page--header--author__name'>Jurnalis {i}</span>{items}")
+    if kind == "antaranews":
+        return _page(
+            f"<meta property='article:published_time' content='{date}T10:00:00+07:00'>",
+            f"{h1}<div class='post-content'>{_p(with_noise)}"
+            f"<p class='text-muted'>Pewarta: Jurnalis {i} Editor: Redaksi</p></div>")
+    # Situs tanpa template: struktur <article> biasa untuk heuristik newspaper3k
+    return _page(
+        f"<meta name='author' content='Jurnalis {i}'>",
+        f"{h1}<article>{_p(paragraphs)}</article><aside>{NOISE_PARAGRAPH}</aside>")
+
+
+def build_fixtures(n_articles: int, seed: int = 42, kinds: list[str] | None = None,
+                   paragraphs: int = 8, slow_latency: float = 1.0, prefix: str = "berita") -> tuple[dict, list[dict]]:
+    """
+    Bangun fixture untuk `n_articles` artikel.
+    `kinds`: jenis artikel yang dipakai (default semua, dengan bobot KINDS).
+    `prefix` membedakan path antar set fixture yang dilayani server yang sama.
+    Return: (fixtures {"host/path?query": Fixture}, artikel seperti output fetch_rss).
+    """
+    rng = random.Random(seed)
+    kinds = kinds or list(KINDS)
+    weights = [KINDS[k][1] for k in kinds]
+    fixtures, articles = {}, []
+
+    for i in range(n_articles):
+        kind = rng.choices(kinds, weights)[0]
+        host = KINDS[kind][0]
+        title = f"Artikel benchmark {i + 1} ({kind})"
+        uid = f"{prefix}-{i + 1}"
+        path = f"/{prefix}/{i + 1}/artikel-benchmark-{i + 1}"
+        body = _paragraphs(rng, paragraphs)
+        target = f"http://{host}{path}"
+
+        if kind == "social":
+            target = f"http://x.com/akun/status/{uid}"
+        elif kind == "unresolved":
+            target = f"http://consent.google.com/ml?continue={uid}"
+            fixtures[f"consent.google.com/ml?continue={uid}"] = Fixture("<html>Before you continue</html>")
+        elif kind == "error":
+            fixtures[f"{host}{path}"] = Fixture("Internal Server Error", status=500)
+        elif kind == "blocked":
+            fixtures[f"{host}{path}"] = Fixture(_page("", "<h1>Access Denied</h1><p>403 Forbidden</p>"))
+        elif kind in ("detik", "kompas", "tribunnews"):
+            all_param = "single=1" if kind == "detik" else "page=all"
+            fixtures[f"{host}{path}"] = Fixture(render_article(kind, i, title, body, page=1))
+            fixtures[f"{host}{path}?page=2"] = Fixture(render_article(kind, i, title, body, page=2))
+            fixtures[f"{host}{path}?{all_param}"] = Fixture(render_article(kind, i, title, body, page=None))
+        else:
+            latency = slow_latency if kind == "slow" else 0.0
+            fixtures[f"{host}{path}"] = Fixture(render_article(kind, i, title, body, page=None), latency=latency)
+
+        fixtures[f"{GOOGLE_HOST}/rss/articles/{uid}"] = Fixture(status=302, headers={"Location": target})
+        articles.append({
+            "title": title,
+            "date": None,
+            "url": f"http://{GOOGLE_HOST}/rss/articles/{uid}",
+            "source": host,
+            "kind": kind,
+            "expected_content": "\n\n".join(body) if kind in TEMPLATE_KINDS + ("generic", "slow") else "",
+        })
+    return fixtures, articles
+
+
+def load_fixture_dir(path: str) -> dict:
+    """Halaman rekaman: <path>/<host>/<path>.html → fixture "host/path"."""
+    fixtures = {}
+    for root, _, files in os.walk(path):
+        for name in files:
+            if not name.endswith(".html"):
+                continue
+            file_path = os.path.join(root, name)
+            key = os.path.relpath(file_path, path)[:-len(".html")].replace(os.sep, "/")
+            with open(file_path, encoding="utf-8") as f:
+                fixtures[key] = Fixture(f.read())
+    return fixtures
+
+
+# ============================================================
+# BAGIAN 2: Server
+# ============================================================
+
+class MockNewsServer:
+    def __init__(self, fixtures: dict | None = None, host: str = "127.0.0.1", port: int = 0,
+                 latency: float = 0.05, jitter: float = 0.0, seed: int = 0):
+        self.fixtures = dict(fixtures or {})
+        self.latency = latency
+        self.jitter = jitter
+        self.random = random.Random(seed)
+        self.lock = threading.Lock()
+        self.stats = {"requests": 0, "not_found": 0, "errors": 0, "redirects": 0}
+        self.hosts = {}
+
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            # Header & body ditulis terpisah; tanpa ini keep-alive kena delay Nagle/delayed-ACK (~40 ms)
+            disable_nagle_algorithm = True
+
+            def log_message(self, *args):
+                pass
+
+            def do_GET(self):
+                server.handle(self)
+
+        self.httpd = ThreadingHTTPServer((host, port), Handler)
+        self.httpd.daemon_threads = True
+        self._thread = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "MockNewsServer":
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    # --------------------------------------------------------
+
+    def lookup(self, handler: BaseHTTPRequestHandler) -> Fixture | None:
+        """Cari fixture: path + query persis, lalu path tanpa query."""
+        # Request lewat proxy membawa URL absolut; request langsung hanya path + header Host
+        parts = urlsplit(handler.path)
+        host = (parts.hostname or handler.headers.get("Host", "").split(":")[0]).lower()
+        key = f"{host}{parts.path or '/'}"
+        query = "&".join(f"{k}={v}" for k, v in parse_qsl(parts.query, keep_blank_values=True))
+        with self.lock:
+            self.hosts[host] = self.hosts.get(host, 0) + 1
+        if query and f"{key}?{query}" in self.fixtures:
+            return self.fixtures[f"{key}?{query}"]
+        return self.fixtures.get(key)
+
+    def handle(self, handler: BaseHTTPRequestHandler):
+        fixture = self.lookup(handler)
+        with self.lock:
+            self.stats["requests"] += 1
+            delay = self.latency + (self.random.uniform(0, self.jitter) if self.jitter else 0.0)
+            if fixture is None:
+                self.stats["not_found"] += 1
+                fixture = Fixture("Not Found", status=404)
+            elif fixture.status >= 500:
+                self.stats["errors"] += 1
+            elif 300 <= fixture.status < 400:
+                self.stats["redirects"] += 1
+
+        time.sleep(delay + fixture.latency)
+        payload = fixture.body.encode("utf-8")
+        handler.send_response(fixture.status)
+        handler.send_header("Content-Type", "text/html; charset=utf-8")
+        handler.send_header("Content-Length", str(len(payload)))
+        for key, value in fixture.headers.items():
+            handler.send_header(key, value)
+        handler.end_headers()
+        handler.wfile.write(payload)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Mock Google News + situs media (HTTP proxy)")
+    parser.add_argument("--port", type=int, default=8766)
+    parser.add_argument("--articles", type=int, default=30)
+    parser.add_argument("--latency", type=float, default=0.05)
+    parser.add_argument("--fixtures", help="Folder halaman rekaman (<host>/<path>.html)")
+    args = parser.parse_args()
+
+    fixtures, articles = build_fixtures(args.articles)
+    if args.fixtures:
+        fixtures.update(load_fixture_dir(args.fixtures))
+    server = MockNewsServer(fixtures, port=args.port, latency=args.latency)
+    print(f"Mock news server di {server.base_url} (set HTTP_PROXY ke alamat ini)")
+    for article in articles[:5]:
+        print(f"  {article['url']}  ({article['kind']})")
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
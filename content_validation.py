@@ -0,0 +1,109 @@
+"""
+Validasi konten hasil scraping (halaman error/garbage, URL sosial media).
+
+Sebelumnya scraper dan nlp_pipelinev2 masing-masing punya daftar pattern
+sendiri, setiap pengecekan me-lowercase seluruh artikel lalu mencari tiap
+pattern satu per satu, dan URL sosial media dicek dengan substring (jadi
+`x.com` juga cocok dengan `box.com`). Di sini:
+
+- Pattern garbage hanya dicari di jendela awal + akhir teks (pesan error
+  halaman selalu ada di situ, bukan di tengah artikel panjang), dan jendela
+  itu di-lowercase sekali untuk semua pattern. Pencarian substring bawaan
+  str ternyata lebih cepat dari satu regex gabungan di CPython.
+- Domain dicocokkan per hostname (sama persis atau subdomain).
+- `validate_content` mengembalikan skor kualitas; scraper menyimpannya di
+  field `quality` artikel, jadi tahap berikutnya tidak mengecek ulang.
+"""
+
+from urllib.parse import urlsplit
+
+from article_record import is_scraped
+
+
+SOCIAL_MEDIA_DOMAINS = (
+    "twitter.com", "x.com", "facebook.com", "fb.com",
+    "instagram.com", "tiktok.com",
+)
+
+GARBAGE_CONTENT_PATTERNS = (
+    "javascript is not available",
+    "javascript is disabled",
+    "please enable javascript",
+    "switch to a supported browser",
+    "continue using x.com",
+    "continue using twitter.com",
+    "cookies are disabled",
+    "access denied",
+    "403 forbidden",
+    "halaman tidak ditemukan",
+    "page not found",
+    "404 not found",
+)
+
+# Konten lebih pendek dari ini bukan artikel
+MIN_CONTENT_CHARS = 50
+# Panjang konten yang dianggap artikel utuh (skor 1.0)
+FULL_CONTENT_CHARS = 1500
+# Jendela awal/akhir teks yang dicek
+HEAD_WINDOW = 4000
+TAIL_WINDOW = 1000
+
+
+def hostname(url: str) -> str:
+    """Hostname URL (lowercase, tanpa "www.")."""
+    host = urlsplit(url.strip()).hostname or ""
+    return host[4:] if host.startswith("www.") else host
+
+
+def host_matches(url: str, domains) -> bool:
+    """True kalau hostname URL sama dengan salah satu domain atau subdomain-nya."""
+    host = hostname(url)
+    return any(host == d or host.endswith("." + d) for d in domains)
+
+
+def is_social_media_url(url: str) -> bool:
+    """Cek apakah URL mengarah ke platform sosial media."""
+    return host_matches(url, SOCIAL_MEDIA_DOMAINS)
+
+
+def find_garbage(content: str) -> str | None:
+    """Pattern garbage pertama di awal/akhir konten, atau None."""
+    if len(content) > HEAD_WINDOW + TAIL_WINDOW:
+        content = content[:HEAD_WINDOW] + "\n" + content[-TAIL_WINDOW:]
+    window = content.lower()
+    for pattern in GARBAGE_CONTENT_PATTERNS:
+        if pattern in window:
+            return pattern
+    return None
+
+
+def validate_content(content: str) -> dict:
+    """
+    Nilai kualitas konten hasil scraping.
+    Return: ok (bool), score (0.0 = bukan artikel, 1.0 = artikel utuh),
+    reason (None kalau ok).
+    """
+    content = (content or "").strip()
+    if len(content) < MIN_CONTENT_CHARS:
+        return {"ok": False, "score": 0.0, "reason": "terlalu pendek"}
+    garbage = find_garbage(content)
+    if garbage is not None:
+        return {"ok": False, "score": 0.0, "reason": f"garbage: {garbage}"}
+    return {"ok": True, "score": round(min(1.0, len(content) / FULL_CONTENT_CHARS), 3), "reason": None}
+
+
+def article_quality(article) -> float:
+    """
+    Skor kualitas artikel. Dihitung sekali lalu disimpan di field `quality`
+    (scraper sudah mengisinya; artikel lama/dict dihitung saat pertama diminta).
+    """
+    quality = article.get("quality")
+    if quality is None:
+        quality = validate_content(article.get("content", ""))["score"] if is_scraped(article) else 0.0
+        article["quality"] = quality
+    return quality
+
+
+def is_usable(article) -> bool:
+    """Artikel berhasil di-scrape dan kontennya bukan garbage."""
+    return is_scraped(article) and article_quality(article) > 0.0
@@ -0,0 +1,400 @@
+"""
+Crawler batch headless (tanpa Streamlit) untuk crawl terjadwal, mis. nightly cron.
+
+Untuk setiap keyword di file keyword: fetch RSS → filter tanggal → scrape full
+text → NLP, memakai fungsi yang sama dengan app.py. Progress di-checkpoint ke
+SQLite setelah setiap artikel, jadi run yang terputus (Ctrl+C, crash, server
+restart) dilanjutkan dari artikel terakhir, bukan dari awal.
+
+Run dengan argumen yang sama = run yang sama (ID run dihitung dari keyword,
+rentang tanggal, dan opsi NLP), jadi cukup jalankan ulang perintahnya untuk
+melanjutkan. Pakai --fresh untuk mengulang dari awal.
+
+Jalankan:
+    python crawl.py keywords.txt --days 1 --output hasil.csv
+    python crawl.py keywords.txt --from 2025-01-01 --to 2025-01-31 --no-nlp
+    python crawl.py keywords.txt --days 1 --backend hybrid --summary-mode extractive
+    python crawl.py keywords.txt --days 1 --top-n 30
+
+File keyword: satu keyword per baris, baris kosong dan diawali '#' diabaikan.
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sqlite3
+import sys
+import time
+from collections import Counter
+from datetime import datetime, timedelta
+
+from article_record import is_scraped, records_to_frame
+from article_store import save_articles
+from relevance import rank_articles
+from jobs import decode_article, encode_article
+from watermarks import article_key, get_watermark_store, needs_scrape, split_new_articles
+
+
+CRAWL_DB_PATH = os.environ.get("CRAWL_DB_PATH", os.path.join(".cache", "crawl.sqlite3"))
+
+# Stage per artikel (urut)
+STAGE_FETCHED = "fetched"
+STAGE_SCRAPED = "scraped"
+STAGE_DONE = "done"
+
+
+# ============================================================
+# BAGIAN 1: Checkpoint Store
+# ============================================================
+
+class CrawlCheckpoint:
+    """Checkpoint run crawl: daftar artikel per keyword + stage terakhir setiap artikel."""
+
+    def __init__(self, path: str = CRAWL_DB_PATH):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._conn = sqlite3.connect(path, timeout=30)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS crawl_runs (
+                run_id   TEXT PRIMARY KEY,
+                params   TEXT NOT NULL,
+                status   TEXT NOT NULL,
+                created  REAL NOT NULL,
+                updated  REAL NOT NULL
+            )
+        """)
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS crawl_keywords (
+                run_id   TEXT NOT NULL,
+                keyword  TEXT NOT NULL,
+                fetched  INTEGER NOT NULL,
+                PRIMARY KEY (run_id, keyword)
+            )
+        """)
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS crawl_articles (
+                run_id   TEXT NOT NULL,
+                keyword  TEXT NOT NULL,
+                position INTEGER NOT NULL,
+                stage    TEXT NOT NULL,
+                article  TEXT NOT NULL,
+                PRIMARY KEY (run_id, keyword, position)
+            )
+        """)
+        self._conn.commit()
+
+    def start_run(self, run_id: str, params: dict, fresh: bool = False) -> bool:
+        """Daftarkan run. Return: True kalau melanjutkan run lama yang belum selesai."""
+        if fresh:
+            for table in ("crawl_articles", "crawl_keywords", "crawl_runs"):
+                self._conn.execute(f"DELETE FROM {table} WHERE run_id = ?", (run_id,))
+        row = self._conn.execute("SELECT status FROM crawl_runs WHERE run_id = ?", (run_id,)).fetchone()
+        now = time.time()
+        if row is None:
+            self._conn.execute(
+                "INSERT INTO crawl_runs VALUES (?, ?, 'running', ?, ?)",
+                (run_id, json.dumps(params, ensure_ascii=False), now, now)
+            )
+        else:
+            self._conn.execute("UPDATE crawl_runs SET status = 'running', updated = ? WHERE run_id = ?", (now, run_id))
+        self._conn.commit()
+        return row is not None
+
+    def finish_run(self, run_id: str) -> None:
+        self._conn.execute("UPDATE crawl_runs SET status = 'done', updated = ? WHERE run_id = ?", (time.time(), run_id))
+        self._conn.commit()
+
+    def is_fetched(self, run_id: str, keyword: str) -> bool:
+        row = self._conn.execute(
+            "SELECT fetched FROM crawl_keywords WHERE run_id = ? AND keyword = ?", (run_id, keyword)
+        ).fetchone()
+        return bool(row and row[0])
+
+    def save_fetched(self, run_id: str, keyword: str, rows: list[tuple[str, dict]]) -> None:
+        """
+        Simpan hasil fetch + filter sekaligus (satu transaksi), jadi resume tidak fetch ulang.
+        `rows`: list (stage awal, artikel); artikel lama dari watermark langsung STAGE_DONE.
+        """
+        self._conn.executemany(
+            "INSERT OR REPLACE INTO crawl_articles VALUES (?, ?, ?, ?, ?)",
+            [(run_id, keyword, i, stage, encode_article(a)) for i, (stage, a) in enumerate(rows)]
+        )
+        self._conn.execute("INSERT OR REPLACE INTO crawl_keywords VALUES (?, ?, 1)", (run_id, keyword))
+        self._conn.commit()
+
+    def save_article(self, run_id: str, keyword: str, position: int, stage: str, article: dict) -> None:
+        self._conn.execute(
+            "UPDATE crawl_articles SET stage = ?, article = ? WHERE run_id = ? AND keyword = ? AND position = ?",
+            (stage, encode_article(article), run_id, keyword, position)
+        )
+        self._conn.commit()
+
+    def articles(self, run_id: str, keyword: str | None = None) -> list[tuple[int, str, dict]]:
+        """Return: list (position, stage, article) urut posisi."""
+        query = "SELECT position, stage, article, keyword FROM crawl_articles WHERE run_id = ?"
+        args = [run_id]
+        if keyword is not None:
+            query += " AND keyword = ?"
+            args.append(keyword)
+        rows = self._conn.execute(query + " ORDER BY keyword, position", args).fetchall()
+        found = []
+        for pos, stage, raw, kw in rows:
+            article = decode_article(raw)
+            article["keyword"] = kw
+            found.append((pos, stage, article))
+        return found
+
+
+# ============================================================
+# BAGIAN 2: Statistik Throughput
+# ============================================================
+
+class CrawlStats:
+    """Hitungan & waktu per tahap untuk ringkasan throughput di akhir run."""
+
+    STAGES = ("fetch", "scrape", "nlp")
+
+    def __init__(self):
+        self.seconds = {stage: 0.0 for stage in self.STAGES}
+        self.counts = {stage: 0 for stage in self.STAGES}
+        self.resumed = 0
+        self.known = 0
+        self.scrape_ok = 0
+        # Extractor yang berhasil per artikel (template media, newspaper3k, Selenium)
+        self.extractors = Counter()
+        self.started = time.perf_counter()
+
+    def timed(self, stage: str, count: int, seconds: float):
+        self.seconds[stage] += seconds
+        self.counts[stage] += count
+
+    def report(self) -> str:
+        elapsed = time.perf_counter() - self.started
+        lines = ["", "=== Ringkasan Crawl ==="]
+        for stage in self.STAGES:
+            n, secs = self.counts[stage], self.seconds[stage]
+            rate = f"{n / secs * 60:.1f} artikel/menit" if secs > 0 and n else "-"
+            lines.append(f"{stage:<7} {n:>5} artikel  {secs:>8.1f} detik  {rate}")
+        lines.append(f"scrape berhasil: {self.scrape_ok}/{self.counts['scrape']}")
+        if self.extractors:
+            lines.append("extractor: " + ", ".join(f"{name} {n}" for name, n in self.extractors.most_common()))
+        lines.append(f"dilewati (sudah di checkpoint): {self.resumed}")
+        lines.append(f"diambil dari hasil sebelumnya (watermark): {self.known}")
+        lines.append(f"total waktu: {elapsed:.1f} detik")
+        return "\n".join(lines)
+
+
+# ============================================================
+# BAGIAN 3: Crawl
+# ============================================================
+
+def read_keywords(path: str) -> list[str]:
+    with open(path, encoding="utf-8") as f:
+        keywords = [line.strip() for line in f]
+    return list(dict.fromkeys(k for k in keywords if k and not k.startswith("#")))
+
+
+def make_run_id(params: dict) -> str:
+    raw = json.dumps(params, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha1(raw.encode("utf-8")).hexdigest()[:12]
+
+
+def crawl_keyword(store: CrawlCheckpoint, run_id: str, keyword: str, params: dict,
+                  stats: CrawlStats, delay: float) -> None:
+    from scraper import close_selenium_driver, fetch_rss, filter_by_date, scrape_full_text
+
+    config = None
+    if params["nlp"]:
+        from nlp_router import nlp_config
+        config = nlp_config(params["backend"], params["summary_mode"])
+
+    # STEP 1-2: Fetch + filter (sekali per run; hasil disimpan di checkpoint)
+    resuming = store.is_fetched(run_id, keyword)
+    if not resuming:
+        t0 = time.perf_counter()
+        rss_result = fetch_rss(keyword)
+        if rss_result["error"]:
+            print(f"  ✗ {rss_result['error']}", file=sys.stderr)
+            return
+        articles = filter_by_date(
+            rss_result["articles"],
+            datetime.fromisoformat(params["from_date"]),
+            datetime.fromisoformat(params["to_date"])
+        )
+        stats.timed("fetch", len(articles), time.perf_counter() - t0)
+        print(f"  ✔ {len(rss_result['articles'])} artikel dari RSS, {len(articles)} setelah filter tanggal")
+
+        # Hanya artikel dengan judul paling relevan yang di-scrape, urut dari yang paling relevan
+        articles, skipped = rank_articles(articles, keyword, top_n=params["top_n"],
+                                          min_relevance=params["min_relevance"])
+        if skipped:
+            print(f"  ✔ {len(articles)} artikel paling relevan dipilih, {len(skipped)} dilewati")
+
+        # Incremental: artikel yang sudah pernah diproses untuk keyword ini tidak di-scrape/NLP ulang
+        if params["incremental"]:
+            new, known = split_new_articles(get_watermark_store(), keyword, articles,
+                                            need_nlp=params["nlp"], nlp_config=config)
+            new_by_key = {article_key(a): a for a in new}
+            rows = []
+            for article in articles:
+                key = article_key(article)
+                if key in known:
+                    rows.append((STAGE_DONE, known[key]))
+                else:
+                    current = new_by_key.get(key, article)
+                    rows.append((STAGE_FETCHED if needs_scrape(current) else STAGE_SCRAPED, current))
+            stats.known += len(known)
+            print(f"  ✔ {len(new)} artikel baru, {len(known)} diambil dari hasil sebelumnya")
+        else:
+            rows = [(STAGE_FETCHED, a) for a in articles]
+        store.save_fetched(run_id, keyword, rows)
+
+    # STEP 3: Scrape; checkpoint setelah setiap artikel
+    rows = store.articles(run_id, keyword)
+    pending = [(pos, article) for pos, stage, article in rows if stage == STAGE_FETCHED]
+    if resuming:
+        stats.resumed += len(rows) - len(pending)
+    try:
+        for n, (pos, article) in enumerate(pending, 1):
+            t0 = time.perf_counter()
+            result = scrape_full_text(article["url"])
+            article["content"] = result["content"]
+            article["journalist"] = result["journalist"]
+            article["url"] = result["resolved_url"]
+            article["status"] = result["status"]
+            article["quality"] = result["quality"]
+            article["language"] = result["language"]
+            if article.get("date") is None and result["published"] is not None:
+                article["date"] = result["published"]
+            article.pop("keyword", None)
+            store.save_article(run_id, keyword, pos, STAGE_SCRAPED, article)
+            stats.timed("scrape", 1, time.perf_counter() - t0)
+            if is_scraped(article):
+                stats.scrape_ok += 1
+                stats.extractors[result["extractor"]] += 1
+            print(f"  · scrape {n}/{len(pending)}: {article.get('title', '')[:70]}")
+            if n < len(pending):
+                time.sleep(delay)
+    finally:
+        close_selenium_driver()
+
+    # STEP 4: NLP untuk artikel yang sudah di-scrape tapi belum dianalisis.
+    # Hasil per artikel juga masuk cache NLP (nlp_cache), jadi kalau run terputus
+    # di tengah NLP, artikel yang sudah selesai tidak dihitung ulang saat resume.
+    rows = store.articles(run_id, keyword)
+    to_analyze = [(pos, article) for pos, stage, article in rows if stage == STAGE_SCRAPED]
+    for _, article in to_analyze:
+        article.pop("keyword", None)
+
+    if to_analyze and params["nlp"]:
+        from nlp_router import process_nlp
+
+        t0 = time.perf_counter()
+        process_nlp([article for _, article in to_analyze], profile=params["backend"],
+                    summary_mode=params["summary_mode"], workers=params["workers"])
+        stats.timed("nlp", len(to_analyze), time.perf_counter() - t0)
+        print(f"  ✔ NLP selesai untuk {len(to_analyze)} artikel")
+
+    for pos, article in to_analyze:
+        store.save_article(run_id, keyword, pos, STAGE_DONE, article)
+
+    # Naikkan watermark keyword dengan artikel yang diproses di run ini
+    if params["incremental"] and to_analyze:
+        get_watermark_store().record(keyword, [article for _, article in to_analyze], nlp_config=config)
+
+    # Simpan ke riwayat artikel (upsert, jadi aman diulang saat resume)
+    save_articles([article for _, _, article in store.articles(run_id, keyword)], keyword=keyword)
+
+
+def export_results(articles: list[dict], path: str) -> None:
+    """Tulis hasil ke .parquet, .csv, atau .jsonl sesuai ekstensi file."""
+    if path.endswith(".parquet"):
+        from result_store import build_table, write_parquet
+        write_parquet(build_table(articles, with_nlp=any("summary" in a for a in articles)), path)
+    elif path.endswith(".jsonl"):
+        with open(path, "w", encoding="utf-8") as f:
+            for article in articles:
+                f.write(encode_article(article) + "\n")
+    else:
+        records_to_frame(articles).to_csv(path, index=False, encoding="utf-8-sig")
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Crawl berita headless dengan checkpoint & resume.")
+    parser.add_argument("keywords", help="File berisi satu keyword per baris")
+    parser.add_argument("--from", dest="from_date", help="Tanggal awal (YYYY-MM-DD)")
+    parser.add_argument("--to", dest="to_date", help="Tanggal akhir (YYYY-MM-DD), default hari ini")
+    parser.add_argument("--days", type=int, default=7, help="Rentang N hari terakhir kalau --from tidak diisi")
+    parser.add_argument("--no-nlp", action="store_true", help="Lewati analisis NLP")
+    parser.add_argument("--backend", default="local", choices=["local", "llm", "hybrid"])
+    parser.add_argument("--summary-mode", default="extractive", choices=["abstractive", "extractive"])
+    parser.add_argument("--workers", type=int, default=1, help="Jumlah proses NLP lokal")
+    parser.add_argument("--top-n", type=int, default=0,
+                        help="Hanya scrape N artikel dengan judul paling relevan per keyword (0 = semua)")
+    parser.add_argument("--min-relevance", type=float, default=0.0,
+                        help="Lewati artikel dengan skor relevansi judul di bawah ini (0-1)")
+    parser.add_argument("--delay", type=float, default=1.0, help="Jeda antar artikel saat scraping (detik)")
+    parser.add_argument("--output", help="Ekspor hasil ke .parquet / .csv / .jsonl setelah selesai")
+    parser.add_argument("--fresh", action="store_true", help="Abaikan checkpoint dan mulai dari awal")
+    parser.add_argument("--full", action="store_true",
+                        help="Proses ulang semua artikel di rentang tanggal (abaikan watermark keyword)")
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    args = parse_args(argv)
+
+    today = datetime.now()
+    to_date = datetime.strptime(args.to_date, "%Y-%m-%d") if args.to_date else today
+    from_date = (datetime.strptime(args.from_date, "%Y-%m-%d") if args.from_date
+                 else to_date - timedelta(days=args.days))
+    if from_date > to_date:
+        print("Tanggal --from tidak boleh lebih besar dari --to.", file=sys.stderr)
+        return 2
+
+    keywords = read_keywords(args.keywords)
+    if not keywords:
+        print(f"Tidak ada keyword di {args.keywords}.", file=sys.stderr)
+        return 2
+
+    params = {
+        "keywords": keywords,
+        "from_date": from_date.date().isoformat(),
+        "to_date": to_date.date().isoformat(),
+        "nlp": not args.no_nlp,
+        "backend": args.backend,
+        "summary_mode": args.summary_mode,
+        "workers": args.workers,
+        "incremental": not args.full,
+        "top_n": args.top_n,
+        "min_relevance": args.min_relevance,
+    }
+    run_id = make_run_id(params)
+
+    store = CrawlCheckpoint()
+    resumed = store.start_run(run_id, params, fresh=args.fresh)
+    print(f"Run {run_id} ({'lanjut dari checkpoint' if resumed else 'baru'}): "
+          f"{len(keywords)} keyword, {params['from_date']} s/d {params['to_date']}")
+
+    stats = CrawlStats()
+    for i, keyword in enumerate(keywords, 1):
+        print(f"[{i}/{len(keywords)}] {keyword}")
+        crawl_keyword(store, run_id, keyword, params, stats, args.delay)
+
+    store.finish_run(run_id)
+    print(stats.report())
+
+    if args.output:
+        articles = [article for _, _, article in store.articles(run_id)]
+        export_results(articles, args.output)
+        print(f"Hasil ({len(articles)} artikel) ditulis ke {args.output}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
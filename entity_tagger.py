@@ -0,0 +1,250 @@
+"""
+Tagging entitas (wilayah administratif & organisasi) dengan gazetteer.
+
+Analis memfilter hasil per kota/kabupaten, provinsi, kementerian, atau
+lembaga (BPS, BI, OJK, ...), dan sebelumnya harus membaca full text satu per
+satu. Di sini setiap artikel diberi daftar entitas dari gazetteer (lihat
+gazetteer.py):
+
+- Semua alias dikompilasi sekali menjadi automaton Aho-Corasick di level
+  token (kata), jadi satu kali lewat teks menemukan semua alias sekaligus,
+  linear terhadap panjang teks, berapa pun jumlah alias. Token yang tidak ada
+  di kosakata gazetteer langsung mengembalikan automaton ke root.
+- Pencocokan case-sensitive ("Malang" kota, "malang" bukan) dan berbasis
+  token, jadi "BI" tidak cocok di dalam kata lain. Kalau beberapa alias
+  tumpang tindih, yang terpanjang menang ("Bandung Barat" → Kabupaten
+  Bandung Barat, bukan Kota Bandung).
+- Alias berbagai bentuk dipetakan ke satu nama kanonik ("Jatim", "Pemprov
+  Jawa Timur" → "Provinsi Jawa Timur"; "Kemenkeu" → "Kementerian Keuangan").
+
+Hasil disimpan di field `entities` artikel (nama kanonik dipisah "; ",
+urut dari yang paling sering disebut). Gazetteer bisa ditambah lewat file
+TSV di ENTITY_GAZETTEER_PATH: `nama<TAB>jenis<TAB>alias1|alias2`.
+"""
+
+import os
+import re
+import threading
+from collections import Counter, deque
+
+import gazetteer
+
+
+GAZETTEER_PATH = os.environ.get("ENTITY_GAZETTEER_PATH", "")
+ENTITY_SEPARATOR = "; "
+# Maksimum entitas yang disimpan per artikel (yang paling sering disebut)
+MAX_ENTITIES = 20
+
+ENTITY_TYPES = ("provinsi", "kota", "kabupaten", "kementerian", "lembaga")
+
+_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+
+def tokenize(text: str) -> list[str]:
+    return _TOKEN_RE.findall(text or "")
+
+
+# ============================================================
+# BAGIAN 1: Gazetteer → (alias, nama kanonik, jenis)
+# ============================================================
+
+def _region_entries(names: dict, label: str, prefixes: tuple, prefix_only: set) -> list[tuple]:
+    entries = []
+    for name, aliases in names.items():
+        canonical = f"{label} {name}"
+        forms = [name, *aliases]
+        for form in forms:
+            entries += [(f"{p} {form}", canonical) for p in prefixes]
+            if name not in prefix_only:
+                entries.append((form, canonical))
+    return entries
+
+
+def builtin_entries() -> list[tuple[str, str, str]]:
+    """Semua alias bawaan: (alias, nama kanonik, jenis)."""
+    entries = []
+    for alias, canonical in _region_entries(
+            gazetteer.PROVINCES, "Provinsi",
+            ("Provinsi", "Prov", "Pemprov", "Pemerintah Provinsi"), set()):
+        entries.append((alias, canonical, "provinsi"))
+    for alias, canonical in _region_entries(
+            gazetteer.CITIES, "Kota",
+            ("Kota", "Pemkot", "Pemerintah Kota"), gazetteer.AMBIGUOUS_CITIES):
+        entries.append((alias, canonical, "kota"))
+
+    regencies = {**gazetteer.REGENCIES, **{name: [] for name in gazetteer.REGENCIES_SAME_AS_CITY}}
+    prefix_only = set(gazetteer.REGENCIES_SAME_AS_CITY) | gazetteer.AMBIGUOUS_REGENCIES
+    for alias, canonical in _region_entries(
+            regencies, "Kabupaten",
+            ("Kabupaten", "Kab", "Pemkab", "Pemerintah Kabupaten"), prefix_only):
+        entries.append((alias, canonical, "kabupaten"))
+
+    for kind, names in (("kementerian", gazetteer.MINISTRIES), ("lembaga", gazetteer.INSTITUTIONS)):
+        for canonical, aliases in names.items():
+            entries += [(form, canonical, kind) for form in (canonical, *aliases)]
+    return entries
+
+
+def load_gazetteer_file(path: str) -> list[tuple[str, str, str]]:
+    """Entri tambahan dari file TSV: nama<TAB>jenis<TAB>alias1|alias2 (baris '#' diabaikan)."""
+    entries = []
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            line = line.rstrip("\n")
+            if not line.strip() or line.startswith("#"):
+                continue
+            parts = line.split("\t")
+            canonical = parts[0].strip()
+            kind = parts[1].strip() if len(parts) > 1 and parts[1].strip() else "lembaga"
+            aliases = [a.strip() for a in parts[2].split("|")] if len(parts) > 2 else []
+            entries += [(form, canonical, kind) for form in (canonical, *aliases) if form]
+    return entries
+
+
+# ============================================================
+# BAGIAN 2: Automaton Aho-Corasick di level token
+# ============================================================
+
+class EntityIndex:
+    """
+    Automaton Aho-Corasick atas urutan token alias.
+    State disimpan sebagai list paralel (transisi, failure link, output);
+    output suatu state sudah termasuk output dari rantai failure-nya.
+    """
+
+    def __init__(self, entries: list[tuple[str, str, str]]):
+        self._goto: list[dict] = [{}]
+        self._fail: list[int] = [0]
+        self._out: list[list[tuple[int, str]]] = [[]]
+        self.types: dict[str, str] = {}
+        self.vocabulary: frozenset = frozenset()
+
+        vocabulary = set()
+        seen = set()
+        for alias, canonical, kind in entries:
+            tokens = tuple(tokenize(alias))
+            # Alias yang sama untuk dua entitas: entri pertama yang dipakai
+            if not tokens or tokens in seen:
+                continue
+            seen.add(tokens)
+            vocabulary.update(tokens)
+            self.types.setdefault(canonical, kind)
+            self._insert(tokens, canonical)
+        self.vocabulary = frozenset(vocabulary)
+        self._build_failure_links()
+
+    def _insert(self, tokens: tuple, canonical: str) -> None:
+        state = 0
+        for token in tokens:
+            nxt = self._goto[state].get(token)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[state][token] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append([])
+            state = nxt
+        self._out[state].append((len(tokens), canonical))
+
+    def _build_failure_links(self) -> None:
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for token, nxt in self._goto[state].items():
+                queue.append(nxt)
+                fail = self._fail[state]
+                while fail and token not in self._goto[fail]:
+                    fail = self._fail[fail]
+                target = self._goto[fail].get(token, 0)
+                self._fail[nxt] = target if target != nxt else 0
+                self._out[nxt] = self._out[nxt] + self._out[self._fail[nxt]]
+
+    def __len__(self) -> int:
+        return len(self._goto)
+
+    def find(self, tokens: list[str]) -> list[tuple[int, int, str]]:
+        """
+        Semua kemunculan alias (start, end, nama kanonik), tanpa tumpang
+        tindih: yang paling kiri, lalu yang terpanjang, menang.
+        """
+        goto, fail, out, vocabulary = self._goto, self._fail, self._out, self.vocabulary
+        matches = []
+        state = 0
+        for pos, token in enumerate(tokens):
+            if token not in vocabulary:
+                state = 0
+                continue
+            while state and token not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(token, 0)
+            for length, canonical in out[state]:
+                matches.append((pos - length + 1, pos + 1, canonical))
+
+        if not matches:
+            return matches
+        matches.sort(key=lambda m: (m[0], m[0] - m[1]))
+        selected, last_end = [], 0
+        for start, end, canonical in matches:
+            if start >= last_end:
+                selected.append((start, end, canonical))
+                last_end = end
+        return selected
+
+
+_index: EntityIndex | None = None
+_index_lock = threading.Lock()
+
+
+def get_entity_index() -> EntityIndex:
+    """Automaton dibangun sekali per proses (gazetteer bawaan + file tambahan)."""
+    global _index
+    if _index is None:
+        with _index_lock:
+            if _index is None:
+                entries = builtin_entries()
+                if GAZETTEER_PATH and os.path.exists(GAZETTEER_PATH):
+                    # Entri file didahulukan supaya bisa meng-override alias bawaan
+                    entries = load_gazetteer_file(GAZETTEER_PATH) + entries
+                _index = EntityIndex(entries)
+    return _index
+
+
+# ============================================================
+# BAGIAN 3: Tagging artikel
+# ============================================================
+
+def tag_entities(text: str) -> list[str]:
+    """Nama kanonik entitas di teks, urut dari yang paling sering disebut (lalu yang muncul lebih dulu)."""
+    counts = Counter(canonical for _, _, canonical in get_entity_index().find(tokenize(text)))
+    return [name for name, _ in counts.most_common(MAX_ENTITIES)]
+
+
+def entity_type(name: str) -> str:
+    """Jenis entitas ("provinsi", "kota", ...) dari nama kanonik."""
+    return get_entity_index().types.get(name, "lembaga")
+
+
+def split_entities(value) -> list[str]:
+    """Isi kolom/field `entities` → list nama."""
+    return [e for e in (value or "").split(ENTITY_SEPARATOR) if e]
+
+
+def article_entities(article) -> list[str]:
+    """
+    Entitas artikel (judul + konten). Dihitung sekali lalu disimpan di field
+    `entities`; artikel tanpa konten hanya ditag dari judulnya.
+    """
+    entities = article.get("entities")
+    if entities is None:
+        text = f"{article.get('title', '')}\n{article.get('content', '')}"
+        entities = ENTITY_SEPARATOR.join(tag_entities(text))
+        article["entities"] = entities
+    return split_entities(entities)
+
+
+def tag_articles(articles: list) -> int:
+    """Tag semua artikel yang belum punya field `entities`. Return: jumlah artikel yang baru ditag."""
+    pending = [a for a in articles if a.get("entities") is None]
+    for article in pending:
+        article_entities(article)
+    return len(pending)
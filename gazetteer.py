@@ -0,0 +1,220 @@
+"""
+Gazetteer nama wilayah administratif dan organisasi Indonesia untuk
+entity_tagger.
+
+Format setiap entri: nama kanonik → daftar alias (penulisan lain yang
+dianggap entitas yang sama). Pencocokan case-sensitive, jadi tulis alias
+sesuai kapitalisasi di berita. Entri tambahan bisa ditaruh di file TSV
+(lihat entity_tagger.GAZETTEER_PATH).
+"""
+
+# ============================================================
+# Provinsi
+# ============================================================
+
+PROVINCES = {
+    "Aceh": ["Nanggroe Aceh Darussalam", "NAD"],
+    "Sumatera Utara": ["Sumut"],
+    "Sumatera Barat": ["Sumbar"],
+    "Riau": [],
+    "Kepulauan Riau": ["Kepri"],
+    "Jambi": [],
+    "Sumatera Selatan": ["Sumsel"],
+    "Kepulauan Bangka Belitung": ["Bangka Belitung", "Babel"],
+    "Bengkulu": [],
+    "Lampung": [],
+    "DKI Jakarta": ["Jakarta", "DKI"],
+    "Jawa Barat": ["Jabar"],
+    "Banten": [],
+    "Jawa Tengah": ["Jateng"],
+    "DI Yogyakarta": ["Daerah Istimewa Yogyakarta", "DIY"],
+    "Jawa Timur": ["Jatim"],
+    "Bali": [],
+    "Nusa Tenggara Barat": ["NTB"],
+    "Nusa Tenggara Timur": ["NTT"],
+    "Kalimantan Barat": ["Kalbar"],
+    "Kalimantan Tengah": ["Kalteng"],
+    "Kalimantan Selatan": ["Kalsel"],
+    "Kalimantan Timur": ["Kaltim"],
+    "Kalimantan Utara": ["Kaltara"],
+    "Sulawesi Utara": ["Sulut"],
+    "Gorontalo": [],
+    "Sulawesi Tengah": ["Sulteng"],
+    "Sulawesi Barat": ["Sulbar"],
+    "Sulawesi Selatan": ["Sulsel"],
+    "Sulawesi Tenggara": ["Sultra"],
+    "Maluku": [],
+    "Maluku Utara": ["Malut"],
+    "Papua": [],
+    "Papua Barat": [],
+    "Papua Barat Daya": [],
+    "Papua Selatan": [],
+    "Papua Tengah": [],
+    "Papua Pegunungan": [],
+}
+
+# ============================================================
+# Kota
+# ============================================================
+
+# Nama kota yang juga kata umum / nama provinsi: hanya cocok dengan awalan "Kota"
+AMBIGUOUS_CITIES = {"Batu", "Bima", "Banjar", "Metro", "Solok", "Tual", "Jambi", "Bengkulu", "Gorontalo"}
+
+CITIES = {
+    "Banda Aceh": [], "Langsa": [], "Lhokseumawe": [], "Sabang": [], "Subulussalam": [],
+    "Medan": [], "Binjai": [], "Pematangsiantar": ["Pematang Siantar", "Siantar"], "Tebing Tinggi": [],
+    "Tanjungbalai": ["Tanjung Balai"], "Sibolga": [], "Padangsidimpuan": ["Padang Sidempuan"],
+    "Gunungsitoli": [],
+    "Padang": [], "Bukittinggi": [], "Padang Panjang": [], "Pariaman": [], "Payakumbuh": [],
+    "Sawahlunto": [], "Solok": [],
+    "Pekanbaru": [], "Dumai": [], "Batam": [], "Tanjungpinang": ["Tanjung Pinang"],
+    "Jambi": [], "Sungai Penuh": [],
+    "Palembang": [], "Lubuklinggau": ["Lubuk Linggau"], "Pagar Alam": ["Pagaralam"], "Prabumulih": [],
+    "Pangkalpinang": ["Pangkal Pinang"], "Bengkulu": [], "Bandar Lampung": [], "Metro": [],
+    "Jakarta Pusat": ["Jakpus"], "Jakarta Utara": ["Jakut"], "Jakarta Barat": ["Jakbar"],
+    "Jakarta Selatan": ["Jaksel"], "Jakarta Timur": ["Jaktim"],
+    "Bandung": [], "Bekasi": [], "Bogor": [], "Cimahi": [], "Cirebon": [], "Depok": [],
+    "Sukabumi": [], "Tasikmalaya": [], "Banjar": [],
+    "Cilegon": [], "Serang": [], "Tangerang": [], "Tangerang Selatan": ["Tangsel"],
+    "Semarang": [], "Surakarta": ["Solo"], "Magelang": [], "Pekalongan": [], "Salatiga": [], "Tegal": [],
+    "Yogyakarta": ["Yogya", "Jogja"],
+    "Surabaya": [], "Malang": [], "Batu": [], "Blitar": [], "Kediri": [], "Madiun": [],
+    "Mojokerto": [], "Pasuruan": [], "Probolinggo": [],
+    "Denpasar": [], "Mataram": [], "Bima": [], "Kupang": [],
+    "Pontianak": [], "Singkawang": [], "Palangka Raya": ["Palangkaraya"], "Banjarmasin": [],
+    "Banjarbaru": [], "Balikpapan": [], "Samarinda": [], "Bontang": [], "Tarakan": [],
+    "Manado": [], "Bitung": [], "Tomohon": [], "Kotamobagu": [], "Gorontalo": [],
+    "Palu": [], "Makassar": [], "Parepare": ["Pare-Pare"], "Palopo": [], "Kendari": [], "Baubau": ["Bau-Bau"],
+    "Ambon": [], "Tual": [], "Ternate": [], "Tidore Kepulauan": ["Tidore"],
+    "Jayapura": [], "Sorong": [],
+}
+
+# ============================================================
+# Kabupaten
+# ============================================================
+
+# Kabupaten dengan nama yang sama dengan kota: hanya cocok dengan awalan "Kabupaten"/"Kab"
+REGENCIES_SAME_AS_CITY = [
+    "Bandung", "Bekasi", "Bogor", "Cirebon", "Sukabumi", "Tasikmalaya", "Serang", "Tangerang",
+    "Semarang", "Magelang", "Pekalongan", "Tegal", "Malang", "Blitar", "Kediri", "Madiun",
+    "Mojokerto", "Pasuruan", "Probolinggo", "Bima", "Kupang", "Jayapura", "Sorong", "Solok",
+]
+
+# Nama kabupaten yang juga kata umum / nama tempat lain: hanya cocok dengan awalan
+AMBIGUOUS_REGENCIES = {"Batang", "Toba", "Kapuas", "Karo", "Paser", "Bangka", "Belitung", "Kuningan", "Bone"}
+
+REGENCIES = {
+    # Jawa Barat & Banten
+    "Karawang": [], "Purwakarta": [], "Subang": [], "Indramayu": [], "Majalengka": [],
+    "Kuningan": [], "Garut": [], "Cianjur": [], "Sumedang": [], "Ciamis": [], "Pangandaran": [],
+    "Bandung Barat": ["KBB"], "Lebak": [], "Pandeglang": [],
+    # Jawa Tengah & DIY
+    "Klaten": [], "Boyolali": [], "Sragen": [], "Karanganyar": [], "Wonogiri": [], "Sukoharjo": [],
+    "Kudus": [], "Jepara": [], "Demak": [], "Pati": [], "Rembang": [], "Blora": [], "Grobogan": [],
+    "Kendal": [], "Batang": [], "Pemalang": [], "Brebes": [], "Banyumas": [], "Cilacap": [],
+    "Purbalingga": [], "Banjarnegara": [], "Kebumen": [], "Purworejo": [], "Wonosobo": [],
+    "Temanggung": [], "Sleman": [], "Bantul": [], "Kulon Progo": ["Kulonprogo"],
+    "Gunungkidul": ["Gunung Kidul"],
+    # Jawa Timur
+    "Sidoarjo": [], "Gresik": [], "Lamongan": [], "Tuban": [], "Bojonegoro": [], "Ngawi": [],
+    "Ponorogo": [], "Pacitan": [], "Trenggalek": [], "Tulungagung": [], "Lumajang": [], "Jember": [],
+    "Banyuwangi": [], "Bondowoso": [], "Situbondo": [], "Jombang": [], "Nganjuk": [], "Magetan": [],
+    "Sumenep": [], "Pamekasan": [], "Sampang": [], "Bangkalan": [],
+    # Bali & Nusa Tenggara
+    "Badung": [], "Gianyar": [], "Tabanan": [], "Buleleng": [], "Karangasem": [], "Klungkung": [],
+    "Bangli": [], "Jembrana": [], "Lombok Barat": [], "Lombok Tengah": [], "Lombok Timur": [],
+    "Lombok Utara": [], "Sumbawa": [], "Manggarai Barat": [],
+    # Sumatera
+    "Aceh Besar": [], "Deli Serdang": [], "Langkat": [], "Simalungun": [], "Karo": [],
+    "Toba": [], "Samosir": [], "Kampar": [], "Bengkalis": [], "Siak": [], "Rokan Hilir": [],
+    "Indragiri Hilir": [], "Muaro Jambi": [], "Ogan Komering Ilir": ["OKI"], "Musi Banyuasin": [],
+    "Banyuasin": [], "Lampung Selatan": [], "Lampung Tengah": [], "Bangka": [], "Belitung": [],
+    # Kalimantan, Sulawesi, Maluku, Papua
+    "Kutai Kartanegara": ["Kukar"], "Kutai Timur": ["Kutim"], "Berau": [], "Paser": [],
+    "Penajam Paser Utara": ["PPU"], "Kotawaringin Timur": ["Kotim"], "Kapuas": [], "Ketapang": [],
+    "Kubu Raya": [], "Tanah Bumbu": [], "Kotabaru": [], "Minahasa": [], "Bone": [], "Gowa": [],
+    "Maros": [], "Bulukumba": [], "Morowali": [], "Konawe": [], "Halmahera Tengah": [],
+    "Halmahera Selatan": [], "Maluku Tengah": [], "Mimika": [], "Merauke": [], "Nabire": [],
+    "Manokwari": [], "Raja Ampat": [],
+}
+
+# ============================================================
+# Organisasi: kementerian, lembaga, BUMN
+# ============================================================
+
+MINISTRIES = {
+    "Kementerian Keuangan": ["Kemenkeu"],
+    "Kementerian Dalam Negeri": ["Kemendagri"],
+    "Kementerian Luar Negeri": ["Kemenlu", "Kemlu"],
+    "Kementerian Pertahanan": ["Kemenhan", "Kemhan"],
+    "Kementerian Perdagangan": ["Kemendag"],
+    "Kementerian Perindustrian": ["Kemenperin"],
+    "Kementerian Pertanian": ["Kementan"],
+    "Kementerian Kesehatan": ["Kemenkes"],
+    "Kementerian Agama": ["Kemenag"],
+    "Kementerian Sosial": ["Kemensos"],
+    "Kementerian Ketenagakerjaan": ["Kemnaker", "Kemenaker"],
+    "Kementerian Perhubungan": ["Kemenhub"],
+    "Kementerian Pekerjaan Umum": ["Kementerian PUPR", "Kementerian PU", "Kemen PUPR", "PUPR"],
+    "Kementerian BUMN": ["Kemen BUMN"],
+    "Kementerian ESDM": ["Kementerian Energi dan Sumber Daya Mineral", "KESDM"],
+    "Kementerian Lingkungan Hidup": ["Kementerian Lingkungan Hidup dan Kehutanan", "KLHK", "KLH"],
+    "Kementerian Kehutanan": ["Kemenhut"],
+    "Kementerian Kelautan dan Perikanan": ["KKP"],
+    "Kementerian Koperasi": ["Kementerian Koperasi dan UKM", "Kemenkop", "Kemenkop UKM"],
+    "Kementerian UMKM": ["Kementerian Usaha Mikro, Kecil, dan Menengah"],
+    "Kementerian Pariwisata": ["Kemenpar", "Kemenparekraf"],
+    "Kementerian Komunikasi dan Digital": ["Komdigi", "Kementerian Komunikasi dan Informatika", "Kominfo"],
+    "Kementerian Pendidikan": [
+        "Kementerian Pendidikan Dasar dan Menengah", "Kemendikdasmen",
+        "Kementerian Pendidikan, Kebudayaan, Riset, dan Teknologi", "Kemendikbudristek", "Kemendikbud",
+    ],
+    "Kementerian Pendidikan Tinggi": ["Kemendiktisaintek"],
+    "Kementerian Desa": ["Kemendes", "Kemendes PDTT"],
+    "Kementerian Pemuda dan Olahraga": ["Kemenpora"],
+    "Kementerian PANRB": ["KemenPAN-RB", "KemenPANRB"],
+    "Kementerian ATR/BPN": ["Kementerian Agraria dan Tata Ruang", "ATR/BPN", "BPN"],
+    "Kementerian PPN/Bappenas": ["Bappenas"],
+    "Kementerian Investasi": ["BKPM", "Badan Koordinasi Penanaman Modal"],
+    "Kementerian Hukum": ["Kemenkum", "Kementerian Hukum dan HAM", "Kemenkumham"],
+    "Kementerian Sekretariat Negara": ["Kemensetneg", "Setneg"],
+}
+
+INSTITUTIONS = {
+    "Badan Pusat Statistik": ["BPS"],
+    "Bank Indonesia": ["BI"],
+    "Otoritas Jasa Keuangan": ["OJK"],
+    "Komisi Pemberantasan Korupsi": ["KPK"],
+    "Badan Pemeriksa Keuangan": ["BPK"],
+    "Badan Pengawasan Keuangan dan Pembangunan": ["BPKP"],
+    "Perum Bulog": ["Bulog"],
+    "Badan Pangan Nasional": ["Bapanas", "NFA"],
+    "BMKG": ["Badan Meteorologi, Klimatologi, dan Geofisika"],
+    "BNPB": ["Badan Nasional Penanggulangan Bencana"],
+    "BPBD": ["Badan Penanggulangan Bencana Daerah"],
+    "Basarnas": ["Badan SAR Nasional"],
+    "BPOM": ["Badan Pengawas Obat dan Makanan"],
+    "BRIN": ["Badan Riset dan Inovasi Nasional"],
+    "Polri": ["Kepolisian Negara Republik Indonesia", "Mabes Polri"],
+    "TNI": ["Tentara Nasional Indonesia"],
+    "Kejaksaan Agung": ["Kejagung"],
+    "DPR": ["Dewan Perwakilan Rakyat", "DPR RI"],
+    "DPRD": ["Dewan Perwakilan Rakyat Daerah"],
+    "DPD": ["Dewan Perwakilan Daerah", "DPD RI"],
+    "MPR": ["Majelis Permusyawaratan Rakyat", "MPR RI"],
+    "Mahkamah Agung": ["MA"],
+    "Mahkamah Konstitusi": ["MK"],
+    "Komisi Pemilihan Umum": ["KPU"],
+    "Bawaslu": ["Badan Pengawas Pemilu", "Badan Pengawas Pemilihan Umum"],
+    "Lembaga Penjamin Simpanan": ["LPS"],
+    "BPJS Kesehatan": [],
+    "BPJS Ketenagakerjaan": [],
+    "Pertamina": ["PT Pertamina"],
+    "PLN": ["PT PLN", "Perusahaan Listrik Negara"],
+    "Telkom Indonesia": ["Telkom", "PT Telkom"],
+    "Garuda Indonesia": [],
+    "Bank Mandiri": [],
+    "Bank Rakyat Indonesia": ["BRI"],
+    "Bank Negara Indonesia": ["BNI"],
+    "Bank Tabungan Negara": ["BTN"],
+}
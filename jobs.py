@@ -0,0 +1,386 @@
+"""
+Job runner background untuk pencarian berita (fetch → scrape → NLP).
+
+Sebelumnya seluruh pencarian berjalan sinkron di dalam script run Streamlit:
+interaksi widget atau browser reconnect di tengah proses beberapa menit bisa
+menghilangkan hasil, dan setiap user memakan satu script thread. Di sini:
+
+- Pencarian di-submit ke thread pool dan mendapat `job_id`.
+- Status, progress, log, dan hasil (termasuk hasil parsial saat scraping)
+  disimpan ke SQLite, jadi UI cukup polling `get_job(job_id)`.
+- `job_id` disimpan di URL (?job=...), jadi setelah reload user bisa
+  reattach ke job yang masih berjalan.
+- Job yang terputus karena proses server mati ditandai "interrupted".
+"""
+
+import atexit
+import json
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+from article_record import ArticleRecord, is_scraped
+
+
+JOBS_DB_PATH = os.environ.get("JOBS_DB_PATH", os.path.join(".cache", "jobs.sqlite3"))
+JOB_WORKERS = int(os.environ.get("JOB_WORKERS", "2"))
+JOB_RETENTION_DAYS = float(os.environ.get("JOB_RETENTION_DAYS", "7"))
+
+JOB_STATUSES = ("queued", "running", "done", "error", "interrupted")
+ACTIVE_STATUSES = ("queued", "running")
+
+
+# ============================================================
+# BAGIAN 1: Serialisasi Artikel
+# ============================================================
+
+def encode_article(article: ArticleRecord | dict) -> str:
+    """Artikel → JSON (tanggal disimpan sebagai ISO string)."""
+    data = article.to_dict() if isinstance(article, ArticleRecord) else dict(article)
+    if isinstance(data.get("date"), datetime):
+        data["date"] = data["date"].isoformat()
+    return json.dumps(data, ensure_ascii=False, default=float)
+
+
+def decode_article(raw: str) -> ArticleRecord:
+    """Kebalikan encode_article (JSON lama tanpa status juga bisa dibaca)."""
+    article = json.loads(raw)
+    if article.get("date"):
+        article["date"] = datetime.fromisoformat(article["date"])
+    return ArticleRecord.from_dict(article)
+
+
+# ============================================================
+# BAGIAN 2: Penyimpanan Job (SQLite)
+# ============================================================
+
+class JobStore:
+    """Status, progress, log, dan hasil job, persisten lintas rerun/reload."""
+
+    def __init__(self, path: str = JOBS_DB_PATH):
+        self.path = path
+        self._lock = threading.Lock()
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._conn = sqlite3.connect(path, check_same_thread=False, timeout=30)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS jobs (
+                job_id   TEXT PRIMARY KEY,
+                params   TEXT NOT NULL,
+                status   TEXT NOT NULL,
+                stage    TEXT NOT NULL,
+                progress REAL NOT NULL,
+                message  TEXT NOT NULL,
+                info     TEXT NOT NULL,
+                created  REAL NOT NULL,
+                updated  REAL NOT NULL
+            )
+        """)
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS job_articles (
+                job_id   TEXT NOT NULL,
+                position INTEGER NOT NULL,
+                article  TEXT NOT NULL,
+                PRIMARY KEY (job_id, position)
+            )
+        """)
+
+        # Thread job mati bersama proses lama → tandai supaya UI tidak polling selamanya
+        self._conn.execute(
+            "UPDATE jobs SET status = 'interrupted', message = 'Proses server berhenti sebelum job selesai.' "
+            "WHERE status IN ('queued', 'running')"
+        )
+        self._prune()
+        self._conn.commit()
+
+    def _prune(self) -> None:
+        cutoff = time.time() - JOB_RETENTION_DAYS * 86400
+        old = [row[0] for row in self._conn.execute("SELECT job_id FROM jobs WHERE updated < ?", (cutoff,))]
+        if old:
+            from result_store import delete_results
+        for job_id in old:
+            delete_results(job_id)
+            self._conn.execute("DELETE FROM job_articles WHERE job_id = ?", (job_id,))
+            self._conn.execute("DELETE FROM jobs WHERE job_id = ?", (job_id,))
+
+    def create(self, params: dict) -> str:
+        job_id = uuid.uuid4().hex[:12]
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO jobs VALUES (?, ?, 'queued', 'queued', 0.0, 'Menunggu giliran...', ?, ?, ?)",
+                (job_id, json.dumps(params, ensure_ascii=False), json.dumps({"log": []}), now, now)
+            )
+            self._conn.commit()
+        return job_id
+
+    def update(self, job_id: str, **fields) -> None:
+        """Update kolom status/stage/progress/message; `log` ditambahkan ke info["log"]."""
+        with self._lock:
+            row = self._conn.execute("SELECT info FROM jobs WHERE job_id = ?", (job_id,)).fetchone()
+            if row is None:
+                return
+            info = json.loads(row[0])
+            if "log" in fields:
+                info["log"].append(fields.pop("log"))
+            info.update(fields.pop("info", {}))
+
+            columns = {k: v for k, v in fields.items() if k in ("status", "stage", "progress", "message")}
+            columns["info"] = json.dumps(info, ensure_ascii=False, default=float)
+            columns["updated"] = time.time()
+            assignments = ", ".join(f"{k} = ?" for k in columns)
+            self._conn.execute(f"UPDATE jobs SET {assignments} WHERE job_id = ?", (*columns.values(), job_id))
+            self._conn.commit()
+
+    def get(self, job_id: str) -> dict | None:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT job_id, params, status, stage, progress, message, info, created, updated "
+                "FROM jobs WHERE job_id = ?", (job_id,)
+            ).fetchone()
+        if row is None:
+            return None
+        return {
+            "job_id": row[0],
+            "params": json.loads(row[1]),
+            "status": row[2],
+            "stage": row[3],
+            "progress": row[4],
+            "message": row[5],
+            "info": json.loads(row[6]),
+            "created": row[7],
+            "updated": row[8],
+        }
+
+    def put_article(self, job_id: str, position: int, article: dict) -> None:
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO job_articles VALUES (?, ?, ?)",
+                (job_id, position, encode_article(article))
+            )
+            self._conn.commit()
+
+    def put_articles(self, job_id: str, articles: list[dict]) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM job_articles WHERE job_id = ?", (job_id,))
+            self._conn.executemany(
+                "INSERT INTO job_articles VALUES (?, ?, ?)",
+                [(job_id, i, encode_article(a)) for i, a in enumerate(articles)]
+            )
+            self._conn.commit()
+
+    def clear_articles(self, job_id: str) -> None:
+        """Hapus hasil parsial job (setelah hasil akhir tersimpan di Parquet)."""
+        with self._lock:
+            self._conn.execute("DELETE FROM job_articles WHERE job_id = ?", (job_id,))
+            self._conn.commit()
+
+    def articles(self, job_id: str) -> list[dict]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT article FROM job_articles WHERE job_id = ? ORDER BY position", (job_id,)
+            ).fetchall()
+        return [decode_article(row[0]) for row in rows]
+
+
+# ============================================================
+# BAGIAN 3: Eksekusi Job Pencarian
+# ============================================================
+
+class _JobProgress:
+    """Adapter progress (duck-typing st.progress) yang menulis ke JobStore."""
+
+    def __init__(self, store: JobStore, job_id: str, start: float, end: float):
+        self.store = store
+        self.job_id = job_id
+        self.start = start
+        self.end = end
+
+    def progress(self, value: float, text: str = ""):
+        self.store.update(self.job_id, progress=self.start + value * (self.end - self.start), message=text)
+
+
+def run_search_job(job_id: str, params: dict) -> None:
+    """
+    Jalankan satu pencarian penuh. `params`: keyword, from_date, to_date (ISO),
+    nlp (bool), backend, summary_mode, workers, incremental (bool, default True),
+    top_n (0 = semua) dan min_relevance (0-1) untuk membatasi artikel yang di-scrape.
+    """
+    from article_store import save_articles
+    from relevance import rank_articles
+    from result_store import build_table, write_results
+    from scraper import fetch_rss, filter_by_date, scrape_all_articles
+    from watermarks import get_watermark_store, merge_results, needs_scrape, split_new_articles
+
+    store = get_job_store()
+    try:
+        # STEP 1: Fetch dari Google News RSS
+        store.update(job_id, status="running", stage="fetch", progress=0.0,
+                     message="Mengambil berita dari Google News...")
+        rss_result = fetch_rss(params["keyword"])
+        if rss_result["error"]:
+            store.update(job_id, status="error", message=rss_result["error"])
+            return
+        store.update(job_id, log=f"Ditemukan **{len(rss_result['articles'])} artikel** dari RSS.")
+
+        # STEP 2: Filter berdasarkan tanggal
+        articles = filter_by_date(
+            rss_result["articles"],
+            datetime.fromisoformat(params["from_date"]),
+            datetime.fromisoformat(params["to_date"])
+        )
+        store.update(job_id, log=f"Setelah filter tanggal: **{len(articles)} artikel**.")
+
+        # Ranking relevansi judul: yang paling relevan di-scrape duluan, sisanya dilewati
+        articles, skipped = rank_articles(articles, params["keyword"], top_n=params.get("top_n", 0),
+                                          min_relevance=params.get("min_relevance", 0.0))
+        if skipped:
+            store.update(job_id, log=f"**{len(articles)} artikel paling relevan** dipilih, "
+                                     f"{len(skipped)} artikel kurang relevan dilewati.")
+        if not articles:
+            store.update(job_id, status="done", stage="done", progress=1.0,
+                         message="Tidak ada berita yang sesuai dengan keyword dan filter tanggal.")
+            return
+
+        # Incremental: artikel yang sudah pernah diproses untuk keyword ini diambil dari store
+        watermark = get_watermark_store() if params.get("incremental", True) else None
+        config = None
+        if params["nlp"]:
+            from nlp_router import nlp_config
+            config = nlp_config(params["backend"], params["summary_mode"])
+        if watermark is not None:
+            new, known = split_new_articles(watermark, params["keyword"], articles,
+                                            need_nlp=params["nlp"], nlp_config=config)
+            store.update(job_id, log=f"**{len(new)} artikel baru**, {len(known)} diambil dari hasil sebelumnya.")
+        else:
+            new, known = articles, {}
+        store.put_articles(job_id, list(known.values()))
+
+        # STEP 3: Scraping full text; setiap artikel langsung disimpan sebagai hasil parsial
+        scrape_end = 0.6 if params["nlp"] else 1.0
+        to_scrape = [a for a in new if needs_scrape(a)]
+
+        def on_article(done, total, article):
+            store.put_article(job_id, len(known) + done - 1, article)
+            store.update(job_id, progress=0.05 + (scrape_end - 0.05) * done / total,
+                         message=f"Scraping artikel {done}/{total}...")
+
+        if to_scrape:
+            store.update(job_id, stage="scrape", progress=0.05, message="Scraping full text dari setiap artikel...")
+            scrape_all_articles(to_scrape, delay=1.0, on_article=on_article)
+            berhasil = sum(1 for a in to_scrape if is_scraped(a))
+            store.update(job_id, log=f"Full text berhasil di-extract dari **{berhasil}/{len(to_scrape)} artikel**.")
+
+        # STEP 4: NLP Pipeline (Opsional), hanya untuk artikel baru
+        if params["nlp"]:
+            from nlp_router import process_nlp
+            from topic_model import update_topic_clusters
+            from entity_tagger import tag_articles
+
+            if new:
+                store.update(job_id, stage="nlp", message="Mempersiapkan NLP pipeline...")
+                # Statistik per job (bukan state modul): JOB_WORKERS job bisa berjalan bersamaan
+                route_stats = {}
+                process_nlp(new, profile=params["backend"],
+                            streamlit_progress=_JobProgress(store, job_id, scrape_end, 0.97),
+                            summary_mode=params["summary_mode"], workers=params["workers"],
+                            stats=route_stats)
+                info = {"route_stats": route_stats}
+                if "compression" in route_stats:
+                    info["compression"] = route_stats.pop("compression")
+                store.update(job_id, info=info)
+
+                languages = info["route_stats"]["languages"]
+                if languages:
+                    rincian = ", ".join(f"{lang}: {n}" for lang, n in sorted(languages.items()))
+                    tindakan = ("dilewati (model lokal hanya Bahasa Indonesia)"
+                                if info["route_stats"]["skipped_language"] else "dianalisis dengan LLM")
+                    store.update(job_id, log=f"**{sum(languages.values())} artikel bukan Bahasa Indonesia** "
+                                             f"({rincian}) {tindakan}.")
+
+            articles = merge_results(articles, new, known)
+            # Artikel lama dari riwayat yang belum punya tag entitas ditag sekarang
+            tag_articles(articles)
+            # Update model topik korpus (incremental) dan tandai klaster isu tiap artikel
+            articles = update_topic_clusters(articles)
+            store.update(job_id, log="Analisis NLP selesai.")
+        else:
+            articles = merge_results(articles, new, known)
+
+        if watermark is not None and new:
+            watermark.record(params["keyword"], new, nlp_config=config)
+
+        # Simpan ke riwayat artikel (bisa dicari di halaman Riwayat Artikel)
+        save_articles(articles, keyword=params["keyword"])
+
+        # Hasil akhir disimpan kolumnar (Parquet); UI membaca kolom yang dibutuhkan saja
+        write_results(job_id, build_table(articles, with_nlp=params["nlp"]))
+
+        # Full text sudah ada di Parquet; hasil parsial di SQLite tidak dibutuhkan lagi
+        store.clear_articles(job_id)
+        store.update(job_id, status="done", stage="done", progress=1.0, message="Selesai.")
+
+    except Exception as e:
+        store.update(job_id, status="error", message=f"Job gagal: {str(e)}")
+
+
+# ============================================================
+# BAGIAN 4: Store & Pool di-reuse lintas rerun
+# ============================================================
+
+_store = None
+_executor = None
+_init_lock = threading.Lock()
+
+
+def get_job_store() -> JobStore:
+    global _store
+    with _init_lock:
+        if _store is None:
+            _store = JobStore()
+    return _store
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    with _init_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=JOB_WORKERS, thread_name_prefix="search-job")
+    return _executor
+
+
+def submit_search_job(params: dict) -> str:
+    """Daftarkan job pencarian dan jalankan di background. Return: job_id."""
+    job_id = get_job_store().create(params)
+    _get_executor().submit(run_search_job, job_id, params)
+    return job_id
+
+
+def get_job(job_id: str) -> dict | None:
+    """Status job (status, stage, progress, message, info), atau None kalau tidak ada."""
+    return get_job_store().get(job_id)
+
+
+def get_job_articles(job_id: str) -> list[dict]:
+    """Hasil scraping parsial job yang masih berjalan (hasil akhir dibaca dari result_store)."""
+    return get_job_store().articles(job_id)
+
+
+def shutdown_jobs():
+    """Matikan pool (dipanggil otomatis saat proses selesai)."""
+    global _executor
+    with _init_lock:
+        if _executor is not None:
+            _executor.shutdown(wait=False, cancel_futures=True)
+            _executor = None
+
+
+atexit.register(shutdown_jobs)
@@ -0,0 +1,160 @@
+"""
+Deteksi bahasa artikel dengan n-gram karakter (naive Bayes trigram).
+
+`fetch_rss` memakai language='id', tapi halaman berbahasa Inggris atau
+bahasa daerah tetap ikut. Model lokal (RoBERTa sentimen Indonesia, TF-IDF
+dengan stopword Indonesia) memberi hasil buruk untuk artikel seperti itu.
+
+Profil trigram setiap bahasa dibangun sekali dari teks contoh di bawah;
+artikel cukup diambil potongan awalnya (SAMPLE_CHARS), jadi deteksi hanya
+butuh sekitar satu milidetik per artikel. Hasil disimpan di field `language`
+artikel (kode ISO 639-1, "und" kalau teks terlalu pendek).
+"""
+
+import math
+import re
+from collections import Counter
+
+from article_record import is_scraped
+
+
+LOCAL_LANGUAGE = "id"
+UNDETERMINED = "und"
+LANGUAGE_NAMES = {
+    "id": "Indonesia",
+    "en": "Inggris",
+    "jv": "Jawa",
+    "su": "Sunda",
+    UNDETERMINED: "Tidak diketahui",
+}
+
+# Potongan awal teks yang dianalisis & panjang minimum teks
+SAMPLE_CHARS = 2000
+MIN_CHARS = 40
+
+_NON_LETTER_RE = re.compile(r"[^\w]+|[\d_]+", re.UNICODE)
+
+# Teks contoh per bahasa (gaya berita), sumber profil trigram
+_SAMPLES = {
+    "id": """
+        Pemerintah kota Surabaya menggelar operasi pasar untuk menekan harga beras yang terus naik
+        di sejumlah pasar tradisional. Warga yang datang sejak pagi sudah mengantre untuk membeli
+        beras dengan harga yang lebih murah. Menurut kepala dinas perdagangan, stok beras di gudang
+        Bulog masih cukup hingga akhir tahun sehingga masyarakat tidak perlu khawatir. Selain itu,
+        pemerintah juga akan memantau distribusi agar tidak terjadi penimbunan oleh pedagang.
+        Kepolisian daerah menyatakan telah menangkap tersangka kasus korupsi dana desa yang
+        merugikan negara hingga miliaran rupiah. Pihaknya masih mendalami keterlibatan pihak lain
+        dan akan segera melimpahkan berkas perkara ke kejaksaan. Sementara itu, Badan Pusat
+        Statistik mencatat inflasi tahunan sebesar dua persen, lebih rendah dibandingkan bulan
+        sebelumnya. Bank Indonesia memperkirakan pertumbuhan ekonomi tetap kuat karena didorong
+        oleh konsumsi rumah tangga dan investasi. Presiden meminta para menteri untuk mempercepat
+        pembangunan infrastruktur di daerah yang masih tertinggal serta meningkatkan kualitas
+        pendidikan dan layanan kesehatan bagi masyarakat.
+    """,
+    "en": """
+        The city government held a market operation to curb rising rice prices in several
+        traditional markets. Residents who arrived early in the morning queued to buy rice at a
+        lower price. According to the head of the trade office, rice stocks in the warehouse are
+        sufficient until the end of the year, so people do not need to worry. In addition, the
+        government will monitor distribution to prevent hoarding by traders. The regional police
+        said they had arrested a suspect in the village fund corruption case that caused state
+        losses of billions of rupiah. They are still investigating the involvement of other parties
+        and will soon hand over the case files to the prosecutor. Meanwhile, the statistics agency
+        recorded annual inflation of two percent, lower than the previous month. The central bank
+        expects economic growth to remain strong, driven by household consumption and investment.
+        The president asked his ministers to accelerate infrastructure development in
+        underdeveloped regions and to improve the quality of education and health services.
+    """,
+    "jv": """
+        Pamarentah kutha Surabaya nganakake operasi pasar kanggo nyuda rega beras sing terus mundhak
+        ing sawetara pasar tradisional. Warga sing teka wiwit esuk wis padha antri arep tuku beras
+        kanthi rega sing luwih murah. Miturut kepala dinas perdagangan, stok beras ing gudhang isih
+        cukup nganti pungkasan taun saengga masyarakat ora perlu kuwatir. Saliyane iku, pamarentah
+        uga bakal ngawasi distribusi supaya ora ana sing nimbun. Polisi ngendika wis nyekel
+        tersangka kasus korupsi dana desa sing ngrugekake negara nganti pirang-pirang milyar.
+        Dheweke isih nliti apa ana wong liya sing melu lan bakal enggal ngirim berkas menyang
+        kejaksaan. Sauntara iku, inflasi taunan kacathet rong persen, luwih endhek tinimbang sasi
+        kepungkur. Bank Indonesia ngira-ira ekonomi tetep tuwuh amarga akeh wong sing tuku barang
+        lan nandur modal. Presiden njaluk para menteri supaya nyepetake pambangunan ing dhaerah sing
+        isih ketinggalan lan ndandani pendhidhikan uga pelayanan kesehatan kanggo rakyat.
+    """,
+    "su": """
+        Pamarentah kota Bandung ngayakeun operasi pasar pikeun nurunkeun harga beas anu terus naek
+        di sababaraha pasar tradisional. Warga anu datang ti isuk-isuk geus ngantri rek meuli beas
+        kalayan harga anu leuwih murah. Numutkeun kapala dinas perdagangan, stok beas di gudang
+        masih cukup nepi ka ahir taun sahingga masarakat teu kudu hariwang. Salian ti eta,
+        pamarentah ogé bakal ngawaskeun distribusi sangkan teu aya anu nimbun. Pulisi nyebutkeun
+        geus newak tersangka kasus korupsi dana desa anu ngarugikeun nagara nepi ka milyaran
+        rupia. Maranéhna masih mariksa naha aya jalma séjén anu milu sarta baris geura ngirimkeun
+        berkas ka kejaksaan. Samentara éta, inflasi taunan kacatet dua persen, leuwih handap batan
+        bulan kamari. Bank Indonesia ngira-ngira ékonomi tetep tumuwuh alatan loba jalma anu
+        balanja jeung investasi. Présidén ménta para menteri sangkan ngagancangkeun pangwangunan di
+        daérah anu masih tinggaleun sarta ngaronjatkeun kualitas atikan jeung layanan kaséhatan.
+    """,
+}
+
+
+def _normalize(text: str) -> str:
+    return " " + _NON_LETTER_RE.sub(" ", text.lower()).strip() + " "
+
+
+def _trigrams(text: str) -> Counter:
+    text = _normalize(text)
+    return Counter(text[i:i + 3] for i in range(len(text) - 2))
+
+
+def _build_profiles() -> dict:
+    """log P(trigram | bahasa) dengan add-one smoothing; trigram tak dikenal pakai nilai '_unseen'."""
+    counts = {lang: _trigrams(sample) for lang, sample in _SAMPLES.items()}
+    vocabulary = set().union(*counts.values())
+    profiles = {}
+    for lang, grams in counts.items():
+        total = sum(grams.values()) + len(vocabulary) + 1
+        profile = {g: math.log((grams.get(g, 0) + 1) / total) for g in vocabulary}
+        profile["_unseen"] = math.log(1 / total)
+        profiles[lang] = profile
+    return profiles
+
+
+_PROFILES = _build_profiles()
+
+
+def detect_language(text: str) -> dict:
+    """
+    Deteksi bahasa teks.
+    Return: language (kode ISO 639-1 atau "und") dan confidence (0-1, selisih
+    skor bahasa terbaik dengan bahasa kedua).
+    """
+    sample = (text or "")[:SAMPLE_CHARS]
+    if len(sample.strip()) < MIN_CHARS:
+        return {"language": UNDETERMINED, "confidence": 0.0}
+
+    grams = _trigrams(sample)
+    n = sum(grams.values())
+    scores = {}
+    for lang, profile in _PROFILES.items():
+        unseen = profile["_unseen"]
+        scores[lang] = sum(c * profile.get(g, unseen) for g, c in grams.items()) / n
+
+    ranked = sorted(scores, key=scores.get, reverse=True)
+    best, second = ranked[0], ranked[1]
+    # Selisih rata-rata log-prob per trigram; ~1.0 sudah sangat yakin
+    confidence = min(1.0, scores[best] - scores[second])
+    return {"language": best, "confidence": round(confidence, 3)}
+
+
+def article_language(article) -> str:
+    """
+    Bahasa artikel. Dihitung sekali lalu disimpan di field `language`
+    (scraper sudah mengisinya; artikel lama dihitung saat pertama diminta).
+    """
+    language = article.get("language")
+    if language is None:
+        language = detect_language(article.get("content", ""))["language"] if is_scraped(article) else UNDETERMINED
+        article["language"] = language
+    return language
+
+
+def is_local_language(article) -> bool:
+    """Artikel bisa dianalisis model lokal (Bahasa Indonesia, atau tidak terdeteksi)."""
+    return article_language(article) in (LOCAL_LANGUAGE, UNDETERMINED)
@@ -0,0 +1,160 @@
+"""
+Cache persisten untuk hasil NLP (summary, sentimen, score, topik).
+
+Key cache = hash SHA-256 dari konten yang sudah dinormalisasi + versi
+model/profil/prompt. Jadi artikel yang sama tidak perlu diproses ulang
+oleh BART/RoBERTa/TF-IDF atau dikirim ulang ke Groq saat pencarian diulang
+atau rentang tanggal diperlebar.
+
+- Disimpan di SQLite (satu file), aman dipakai lintas rerun Streamlit.
+- Ukuran dibatasi: entry yang paling lama tidak diakses dibuang (LRU).
+- Setiap namespace (mis. "local", "groq") punya versi sendiri. Kalau versi
+  berubah (model/prompt diganti), entry lama di namespace itu dihapus.
+"""
+
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+
+
+CACHE_PATH = os.environ.get("NLP_CACHE_PATH", os.path.join(".cache", "nlp_cache.sqlite3"))
+CACHE_MAX_ENTRIES = int(os.environ.get("NLP_CACHE_MAX_ENTRIES", "20000"))
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def normalize_content(content: str) -> str:
+    """Normalisasi konten sebelum di-hash (whitespace berlebih dihapus)."""
+    return _WHITESPACE_RE.sub(" ", content or "").strip()
+
+
+def content_key(content: str, version: str, normalized: bool = False) -> str:
+    """
+    Hash konten ternormalisasi + versi model/profil/prompt.
+    `normalized=True` kalau content sudah dinormalisasi (mis. PreparedText.text).
+    """
+    if not normalized:
+        content = normalize_content(content)
+    h = hashlib.sha256()
+    h.update(version.encode("utf-8"))
+    h.update(b"\x00")
+    h.update(content.encode("utf-8"))
+    return h.hexdigest()
+
+
+class NLPCache:
+    """Cache hasil NLP berbasis SQLite dengan eviction LRU."""
+
+    def __init__(self, namespace: str, version: str, path: str = CACHE_PATH,
+                 max_entries: int = CACHE_MAX_ENTRIES):
+        self.namespace = namespace
+        self.version = version
+        self.path = path
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._conn = sqlite3.connect(path, check_same_thread=False, timeout=30)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS nlp_cache (
+                key         TEXT PRIMARY KEY,
+                namespace   TEXT NOT NULL,
+                version     TEXT NOT NULL,
+                result      TEXT NOT NULL,
+                created     REAL NOT NULL,
+                last_access REAL NOT NULL
+            )
+        """)
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_nlp_cache_lru ON nlp_cache (namespace, last_access)"
+        )
+
+        # Invalidasi: model/prompt berubah → entry versi lama tidak berguna lagi
+        self._conn.execute(
+            "DELETE FROM nlp_cache WHERE namespace = ? AND version != ?",
+            (namespace, version)
+        )
+        self._conn.commit()
+
+    def get(self, content: str, normalized: bool = False) -> dict | None:
+        """Ambil hasil dari cache, atau None kalau belum ada."""
+        key = content_key(content, self.version, normalized)
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT result FROM nlp_cache WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            self._conn.execute(
+                "UPDATE nlp_cache SET last_access = ? WHERE key = ?", (time.time(), key)
+            )
+            self._conn.commit()
+        return json.loads(row[0])
+
+    def put(self, content: str, result: dict, normalized: bool = False) -> None:
+        """Simpan hasil ke cache, lalu buang entry terlama kalau melebihi batas."""
+        key = content_key(content, self.version, normalized)
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                """
+                INSERT INTO nlp_cache (key, namespace, version, result, created, last_access)
+                VALUES (?, ?, ?, ?, ?, ?)
+                ON CONFLICT(key) DO UPDATE SET result = excluded.result,
+                                               last_access = excluded.last_access
+                """,
+                (key, self.namespace, self.version, json.dumps(result, ensure_ascii=False), now, now)
+            )
+            self._evict()
+            self._conn.commit()
+
+    def _evict(self) -> None:
+        count = self._conn.execute(
+            "SELECT COUNT(*) FROM nlp_cache WHERE namespace = ?", (self.namespace,)
+        ).fetchone()[0]
+        excess = count - self.max_entries
+        if excess > 0:
+            self._conn.execute(
+                """
+                DELETE FROM nlp_cache WHERE key IN (
+                    SELECT key FROM nlp_cache WHERE namespace = ?
+                    ORDER BY last_access ASC LIMIT ?
+                )
+                """,
+                (self.namespace, excess)
+            )
+
+    def clear(self) -> None:
+        """Hapus semua entry di namespace ini."""
+        with self._lock:
+            self._conn.execute("DELETE FROM nlp_cache WHERE namespace = ?", (self.namespace,))
+            self._conn.commit()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute(
+                "SELECT COUNT(*) FROM nlp_cache WHERE namespace = ?", (self.namespace,)
+            ).fetchone()[0]
+
+
+# ============================================================
+# Instance cache di-reuse (satu per namespace + versi)
+# ============================================================
+
+_caches = {}
+
+
+def get_cache(namespace: str, version: str) -> NLPCache:
+    """Get or create cache untuk namespace + versi tertentu."""
+    key = (namespace, version)
+    if key not in _caches:
+        _caches[key] = NLPCache(namespace, version)
+    return _caches[key]
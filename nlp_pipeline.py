@@ -1,7 +1,12 @@
-from transformers import pipeline
+from sklearn.feature_extraction.text import TfidfVectorizer
+import numpy as np
 import re
 import warnings
 
+from article_record import ArticleRecord
+from content_validation import is_usable
+from nlp_cache import get_cache
+
 warnings.filterwarnings("ignore")
 
 
@@ -9,17 +14,29 @@ warnings.filterwarnings("ignore")
 # BAGIAN 1: Load Model (di-cache supaya tidak berulang kali load)
 # ============================================================
 
+# transformers/torch di-import saat model di-load saja, supaya bagian TF-IDF
+# modul ini tetap bisa dipakai tanpa dependency model lokal (mis. mode LLM).
+
+SUMMARIZER_MODEL = "facebook/bart-large-cnn"
+SENTIMENT_MODEL = "w11wo/indonesian-roberta-base-sentiment-classifier"
+SENTIMENT_FALLBACK_MODEL = "distilbert-base-uncased-finetuned-sst-2-english"
+
+# Versi hasil NLP untuk cache. Ganti kalau model atau logika preprocessing berubah
+# supaya hasil lama di cache otomatis di-invalidate.
+CACHE_VERSION = f"{SUMMARIZER_MODEL}|{SENTIMENT_MODEL}|tfidf-corpus-v2"
+
 _summarizer = None
 _sentiment_analyzer = None
+_sentiment_model = None  # model sentimen yang benar-benar ter-load (bisa fallback)
 
 
 def load_summarizer():
     global _summarizer
     if _summarizer is None:
         # Import explicit untuk avoid task name issues
-        from transformers import BartForConditionalGeneration, BartTokenizer
+        from transformers import BartForConditionalGeneration, BartTokenizer, pipeline
         
-        model_name = "facebook/bart-large-cnn"
+        model_name = SUMMARIZER_MODEL
         
         # Load model dan tokenizer secara manual
         tokenizer = BartTokenizer.from_pretrained(model_name)
@@ -37,52 +54,90 @@ def load_summarizer():
 
 def load_sentiment_analyzer():
     """Load model sentiment analysis bahasa Indonesia."""
-    global _sentiment_analyzer
+    global _sentiment_analyzer, _sentiment_model
     if _sentiment_analyzer is None:
+        from transformers import pipeline
+
         try:
             # Coba model Indonesia dulu
             _sentiment_analyzer = pipeline(
                 "sentiment-analysis",
-                model="w11wo/indonesian-roberta-base-sentiment-classifier",
+                model=SENTIMENT_MODEL,
                 device=-1
             )
+            _sentiment_model = SENTIMENT_MODEL
         except Exception:
             # Fallback ke model Inggris kalau gagal
             _sentiment_analyzer = pipeline(
                 "sentiment-analysis",
-                model="distilbert-base-uncased-finetuned-sst-2-english",
+                model=SENTIMENT_FALLBACK_MODEL,
                 device=-1
             )
+            _sentiment_model = SENTIMENT_FALLBACK_MODEL
     return _sentiment_analyzer
 
 
+# ============================================================
+# BAGIAN 1B: Preprocessing Bersama (sekali per artikel)
+# ============================================================
+
+TOPIC_TOKEN_PATTERN = r"\b[a-zA-Z]{3,}\b"  # Cuma kata huruf, min 3 karakter
+
+# Pattern di-compile sekali, dipakai semua tahap NLP
+_WHITESPACE_RE = re.compile(r"\s+")
+_SENTENCE_SPLIT_RE = re.compile(r"[.!?]")
+_TOKEN_RE = re.compile(TOPIC_TOKEN_PATTERN)
+_ERROR_MARKER_RE = re.compile(r"gagal|error|not found|failed")
+
+
+class PreparedText:
+    """
+    Hasil preprocessing satu artikel, dihitung sekali lalu dipakai oleh
+    summarize_text, analyze_sentiment, dan extract_topics.
+    """
+
+    __slots__ = ("raw", "text", "lower", "sentences", "tokens", "markers", "is_valid")
+
+    def __init__(self, raw: str):
+        self.raw = raw or ""
+        self.text = _WHITESPACE_RE.sub(" ", self.raw).strip()
+        self.lower = self.text.lower()
+        self.sentences = [s.strip() for s in _SENTENCE_SPLIT_RE.split(self.lower)]
+        self.tokens = _TOKEN_RE.findall(self.lower)
+        # Penanda pesan error yang muncul di text (gagal, error, not found, failed)
+        self.markers = frozenset(_ERROR_MARKER_RE.findall(self.lower))
+        # Layak dianalisis: cukup panjang (gagal scraping sudah ditandai status artikel)
+        self.is_valid = len(self.raw) >= 100
+
+    @property
+    def starts_with_bracket(self) -> bool:
+        return self.raw.startswith("[")
+
+
+def prepare_text(text) -> PreparedText:
+    """Buat PreparedText dari string (atau kembalikan apa adanya kalau sudah PreparedText)."""
+    if isinstance(text, PreparedText):
+        return text
+    return PreparedText(text)
+
+
 # ============================================================
 # BAGIAN 2: Text Summarization
 # ============================================================
 
-def summarize_text(text: str, max_length: int = 130, min_length: int = 30) -> str:
+def summarize_text(text, max_length: int = 130, min_length: int = 30) -> str:
     """
     Summarize text menggunakan BART.
+    `text` boleh string atau PreparedText (hasil prepare_text).
     Kalau text terlalu pendek, kosong, atau error message, return text asli atau placeholder.
     """
-    # Skip kalau text kosong atau error message
-    if not text or len(text.strip()) < 100:
-        return "-"
-    
-    # Deteksi error message
-    if text.startswith("[") and "]" in text:
-        return "-"
-    
-    if "gagal" in text.lower() or "error" in text.lower() or "not found" in text.lower():
+    doc = prepare_text(text)
+    if not _is_summary_candidate(doc):
         return "-"
 
-    # Clean text: hapus whitespace berlebihan
-    text_clean = re.sub(r"\s+", " ", text).strip()
-    
     # BART max input ~1024 tokens, potong kalau terlalu panjang
     # Estimasi: 1 token ≈ 4 karakter
-    if len(text_clean) > 3000:
-        text_clean = text_clean[:3000]
+    text_clean = doc.text[:3000]
 
     try:
         summarizer = load_summarizer()
@@ -98,58 +153,158 @@ def summarize_text(text: str, max_length: int = 130, min_length: int = 30) -> st
         return f"[Gagal summarize: {str(e)[:100]}]"
 
 
+def _is_summary_candidate(doc: PreparedText) -> bool:
+    """Cek apakah text layak diringkas (tidak kosong, bukan pesan error)."""
+    # Skip kalau text kosong atau error message
+    if len(doc.text) < 100:
+        return False
+    
+    # Deteksi error message
+    if doc.starts_with_bracket and "]" in doc.raw:
+        return False
+    
+    return not doc.markers & {"gagal", "error", "not found"}
+
+
+SUMMARY_MODES = ("abstractive", "extractive")
+
+# Split kalimat yang mempertahankan tanda baca & huruf besar (untuk ringkasan ekstraktif).
+# Split hanya di spasi setelah . ! ? supaya angka seperti "2.8" tidak terpotong.
+_SENTENCE_BOUNDARY_RE = re.compile(r"(?<=[.!?])\s+")
+
+
+def _textrank_scores(similarity: np.ndarray, damping: float = 0.85,
+                     max_iter: int = 100, tol: float = 1e-6) -> np.ndarray:
+    """PageRank (power iteration) di atas graf kemiripan antar kalimat."""
+    n = similarity.shape[0]
+    row_sums = similarity.sum(axis=1, keepdims=True)
+    # Kalimat tanpa kemiripan dengan kalimat lain → distribusi merata
+    transition = np.divide(similarity, row_sums, out=np.full_like(similarity, 1.0 / n), where=row_sums > 0)
+
+    scores = np.full(n, 1.0 / n)
+    for _ in range(max_iter):
+        new_scores = (1 - damping) / n + damping * (transition.T @ scores)
+        if np.abs(new_scores - scores).sum() < tol:
+            return new_scores
+        scores = new_scores
+    return scores
+
+
+def summarize_extractive(text, n_sentences: int = 3) -> str:
+    """
+    Ringkasan ekstraktif (TextRank): ambil 2-3 kalimat paling sentral dari artikel.
+    Kemiripan antar kalimat = cosine similarity vektor TF-IDF, lalu kalimat
+    di-ranking dengan PageRank. Jauh lebih murah dari BART (milidetik per artikel di CPU).
+    `text` boleh string atau PreparedText.
+    """
+    doc = prepare_text(text)
+    if not _is_summary_candidate(doc):
+        return "-"
+
+    # Kalimat duplikat (mis. caption/paragraf berulang) cukup dihitung sekali
+    sentences = list(dict.fromkeys(s for s in _SENTENCE_BOUNDARY_RE.split(doc.text) if len(s) > 30))
+    if not sentences:
+        return "-"
+    if len(sentences) <= n_sentences:
+        return " ".join(sentences)
+
+    try:
+        vectorizer = TfidfVectorizer(
+            stop_words=list(STOPWORDS_ID),
+            token_pattern=TOPIC_TOKEN_PATTERN
+        )
+        tfidf_matrix = vectorizer.fit_transform(sentences)
+    except ValueError:
+        # Semua kata stopword → ambil kalimat awal (lead)
+        return " ".join(sentences[:n_sentences])
+
+    # Baris TF-IDF sudah ter-normalisasi L2 → dot product = cosine similarity
+    similarity = (tfidf_matrix @ tfidf_matrix.T).toarray()
+    np.fill_diagonal(similarity, 0.0)
+
+    scores = _textrank_scores(similarity)
+    top = np.argpartition(-scores, n_sentences - 1)[:n_sentences]
+
+    # Tampilkan sesuai urutan asli di artikel supaya ringkasan tetap runtut
+    return " ".join(sentences[i] for i in sorted(top))
+
+
 # ============================================================
 # BAGIAN 3: Sentiment Analysis
 # ============================================================
 
-def analyze_sentiment(text: str) -> dict:
+def analyze_sentiment(text) -> dict:
     """
-    Analisis sentimen dari text.
+    Analisis sentimen dari text (string atau PreparedText).
     Return: dict berisi 'label' dan 'score'.
     """
-    # Skip kalau text kosong atau error message
-    if not text or len(text.strip()) < 20:
-        return {"label": "Netral", "score": 0.0}
-    
-    if text.startswith("[") or "error" in text.lower() or "gagal" in text.lower():
-        return {"label": "Netral", "score": 0.0}
+    doc = prepare_text(text)
 
-    # Potong text (model sentiment limit: 512 tokens)
-    text_clean = re.sub(r"\s+", " ", text).strip()
-    if len(text_clean) > 512:
-        text_clean = text_clean[:512]
+    if not _is_sentiment_candidate(doc):
+        return {"label": "Netral", "score": 0.0}
 
     try:
         analyzer = load_sentiment_analyzer()
-        result = analyzer(text_clean, truncation=True)[0]
-
-        label_raw = result["label"].upper()
-        score = round(result["score"], 3)
-
-        # Normalize label
-        # Model Indonesia biasanya: positive, negative, neutral
-        # Model Inggris: POSITIVE, NEGATIVE
-        if "POS" in label_raw:
-            label = "Positif"
-        elif "NEG" in label_raw:
-            label = "Negatif"
-        else:
-            label = "Netral"
-
-        return {"label": label, "score": score}
+        # Potong text (model sentiment limit: 512 tokens)
+        result = analyzer(doc.text[:512], truncation=True)[0]
+        return _normalize_sentiment(result)
 
     except Exception as e:
         return {"label": "Netral", "score": 0.0}
 
 
+def _is_sentiment_candidate(doc: PreparedText) -> bool:
+    # Skip kalau text kosong atau error message
+    if len(doc.text) < 20:
+        return False
+    return not (doc.starts_with_bracket or doc.markers & {"error", "gagal"})
+
+
+def _normalize_sentiment(result: dict) -> dict:
+    """Ubah output pipeline HF jadi label Positif/Negatif/Netral + score."""
+    label_raw = result["label"].upper()
+    score = round(result["score"], 3)
+
+    # Normalize label
+    # Model Indonesia biasanya: positive, negative, neutral
+    # Model Inggris: POSITIVE, NEGATIVE
+    if "POS" in label_raw:
+        label = "Positif"
+    elif "NEG" in label_raw:
+        label = "Negatif"
+    else:
+        label = "Netral"
+
+    return {"label": label, "score": score}
+
+
+def analyze_sentiment_batch(texts: list, batch_size: int = 16) -> list[dict]:
+    """
+    Analisis sentimen banyak artikel sekaligus (string atau PreparedText).
+    Text dikirim ke model dalam batch, jauh lebih efisien daripada satu per satu.
+    Return: list dict 'label' dan 'score' (urutan sama dengan input).
+    """
+    results = [{"label": "Netral", "score": 0.0} for _ in texts]
+    docs = [prepare_text(t) for t in texts]
+    positions = [i for i, doc in enumerate(docs) if _is_sentiment_candidate(doc)]
+    if not positions:
+        return results
+
+    try:
+        analyzer = load_sentiment_analyzer()
+        outputs = analyzer([docs[i].text[:512] for i in positions], truncation=True, batch_size=batch_size)
+        for i, output in zip(positions, outputs):
+            results[i] = _normalize_sentiment(output)
+    except Exception:
+        pass
+
+    return results
+
+
 # ============================================================
 # BAGIAN 4: Topic Modelling (Keyword Extraction)
 # ============================================================
 
-from sklearn.feature_extraction.text import TfidfVectorizer
-import numpy as np
-
-
 # Stopwords Bahasa Indonesia (extended list)
 STOPWORDS_ID = {
     "yang", "dan", "di", "ke", "dari", "adalah", "untuk", "pada", "dengan",
@@ -175,37 +330,52 @@ STOPWORDS_ID = {
 }
 
 
-def extract_topics(text: str, n_topics: int = 3) -> str:
+# Kata yang mencurigakan (sisa URL, pesan error) tidak boleh jadi topik
+BAD_TOPIC_WORDS = ["http", "www", "url", "com", "html", "error"]
+
+
+def _is_topic_candidate(doc: PreparedText) -> bool:
+    """Cek apakah text layak untuk topic extraction."""
+    # Skip kalau text kosong, error, atau terlalu pendek
+    if len(doc.text) < 100:
+        return False
+
+    # Deteksi error message
+    return not (doc.starts_with_bracket or doc.markers)
+
+
+def _topic_words(doc: PreparedText) -> list[str]:
+    """Token yang sudah dibuang stopwords dan kata pendeknya."""
+    return [w for w in doc.tokens if w not in STOPWORDS_ID and len(w) > 3]
+
+
+def _doc_ngrams(doc: PreparedText) -> list[str]:
+    """
+    Unigram + bigram dari token yang sudah dihitung di PreparedText
+    (sama seperti analyzer TfidfVectorizer dengan stop_words + ngram_range=(1, 2)),
+    jadi text tidak perlu di-tokenize ulang oleh vectorizer.
+    """
+    tokens = [w for w in doc.tokens if w not in STOPWORDS_ID]
+    return tokens + [f"{a} {b}" for a, b in zip(tokens, tokens[1:])]
+
+
+def extract_topics(text, n_topics: int = 3) -> str:
     """
     Extract keyword/topik utama dari artikel menggunakan TF-IDF.
+    `text` boleh string atau PreparedText.
     Return: string berisi topik, dipisahkan koma.
     """
-    # Skip kalau text kosong, error, atau terlalu pendek
-    if not text or len(text.strip()) < 100:
-        return "-"
-    
-    # Deteksi error message
-    if text.startswith("[") or "error" in text.lower() or "gagal" in text.lower():
-        return "-"
-    
-    if "not found" in text.lower() or "failed" in text.lower():
+    doc = prepare_text(text)
+    if not _is_topic_candidate(doc):
         return "-"
 
-    text_clean = re.sub(r"\s+", " ", text).strip().lower()
-
-    # Tokenize sederhana: ambil kata alfanumerik
-    words = re.findall(r"\b[a-zA-Z]{3,}\b", text_clean)  # Min 3 huruf, cuma huruf
-    
-    # Filter stopwords dan kata pendek
-    words_filtered = [w for w in words if w not in STOPWORDS_ID and len(w) > 3]
-
+    words_filtered = _topic_words(doc)
     if len(words_filtered) < 5:
         return "-"
 
     try:
         # Buat kalimat dari text untuk TF-IDF
-        sentences = re.split(r"[.!?]", text_clean)
-        sentences = [s.strip() for s in sentences if len(s.strip()) > 30]
+        sentences = [s for s in doc.sentences if len(s) > 30]
 
         if len(sentences) < 2:
             # Kalau cuma 1 kalimat, ambil kata paling sering
@@ -220,7 +390,7 @@ def extract_topics(text: str, n_topics: int = 3) -> str:
             max_features=50,
             ngram_range=(1, 2),  # unigram dan bigram
             min_df=1,
-            token_pattern=r"\b[a-zA-Z]{3,}\b"  # Cuma kata huruf, min 3 karakter
+            token_pattern=TOPIC_TOKEN_PATTERN
         )
 
         tfidf_matrix = vectorizer.fit_transform(sentences)
@@ -235,7 +405,7 @@ def extract_topics(text: str, n_topics: int = 3) -> str:
         # Filter out kata yang masih mencurigakan (URL remnants, dll)
         topics_clean = []
         for topic in topics:
-            if not any(bad_word in topic.lower() for bad_word in ["http", "www", "url", "com", "html", "error"]):
+            if not any(bad_word in topic.lower() for bad_word in BAD_TOPIC_WORDS):
                 topics_clean.append(topic)
         
         return ", ".join(topics_clean[:n_topics]) if topics_clean else "-"
@@ -244,51 +414,217 @@ def extract_topics(text: str, n_topics: int = 3) -> str:
         return "-"
 
 
+def extract_topics_batch(texts: list, n_topics: int = 3) -> list[str]:
+    """
+    Extract topik untuk banyak artikel sekaligus (input string atau PreparedText).
+    Satu TfidfVectorizer di-fit ke seluruh korpus (satu dokumen = satu artikel),
+    jadi IDF mencerminkan korpus hasil pencarian, bukan kalimat dalam satu artikel.
+    Top-k per artikel diambil dari baris matrix sparse (argpartition atas
+    potongan CSR), bukan loop vectorizer per artikel.
+    Return: list string topik (urutan sama dengan input), "-" kalau tidak layak.
+    """
+    results = ["-"] * len(texts)
+
+    docs = []
+    doc_positions = []
+    for pos, text in enumerate(texts):
+        doc = prepare_text(text)
+        if not _is_topic_candidate(doc) or len(_topic_words(doc)) < 5:
+            continue
+        docs.append(doc)
+        doc_positions.append(pos)
+
+    if not docs:
+        return results
+
+    try:
+        # Analyzer memakai token dari PreparedText (tidak tokenize ulang)
+        vectorizer = TfidfVectorizer(analyzer=_doc_ngrams, min_df=1, sublinear_tf=True)
+        tfidf_matrix = vectorizer.fit_transform(docs).tocsr()
+        feature_names = vectorizer.get_feature_names_out()
+    except ValueError:
+        # Vocabulary kosong (semua kata stopword)
+        return results
+
+    # Buang kolom fitur yang mencurigakan sebelum ranking
+    bad_features = np.array(
+        [any(bad in name for bad in BAD_TOPIC_WORDS) for name in feature_names], dtype=bool
+    )
+    data = np.where(bad_features[tfidf_matrix.indices], 0.0, tfidf_matrix.data)
+
+    # Top-k per baris langsung dari potongan CSR (indptr), tanpa matrix padded:
+    # memori sebanding nnz satu artikel, bukan n_docs × artikel terpanjang.
+    # Skor sama diurutkan berdasarkan index fitur (urutan alfabet vocabulary).
+    indptr, indices = tfidf_matrix.indptr, tfidf_matrix.indices
+    for row, pos in enumerate(doc_positions):
+        start, end = indptr[row], indptr[row + 1]
+        row_scores = data[start:end]
+        candidates = np.flatnonzero(row_scores > 0)
+        if len(candidates) > n_topics:
+            # Semua kandidat dengan skor ≥ skor ke-k (termasuk yang seri di batas)
+            kth = np.partition(row_scores[candidates], -n_topics)[-n_topics]
+            candidates = candidates[row_scores[candidates] >= kth]
+        features = indices[start + candidates]
+        features = features[np.lexsort((features, -row_scores[candidates]))[:n_topics]]
+        topics = [feature_names[f].title() for f in features]
+        results[pos] = ", ".join(topics) if topics else "-"
+
+    return results
+
+
 # ============================================================
 # BAGIAN 5: Pipeline Utama — Proses Semua Artikel
 # ============================================================
 
-def process_nlp(articles: list[dict], streamlit_progress=None) -> list[dict]:
+def is_processable(content) -> bool:
+    """
+    Cek apakah content layak dianalisis. `content` bisa string, PreparedText,
+    atau artikel (record/dict; artikel yang gagal di-scrape atau garbage tidak layak).
+    """
+    if isinstance(content, PreparedText):
+        return content.is_valid
+    if isinstance(content, (ArticleRecord, dict)):
+        return is_usable(content) and is_processable(content["content"])
+    return bool(content) and len(content) >= 100
+
+
+ALL_TASKS = ("summary", "sentiment", "topics")
+
+
+def empty_result(tasks=ALL_TASKS) -> dict:
+    """Hasil default untuk artikel yang tidak bisa dianalisis."""
+    result = {}
+    if "summary" in tasks:
+        result["summary"] = "-"
+    if "sentiment" in tasks:
+        result["sentiment"] = "Netral"
+        result["sentiment_score"] = 0.0
+    if "topics" in tasks:
+        result["topics"] = "-"
+    return result
+
+
+def analyze_article(content, topics: str | None = None, summary_mode: str = "abstractive",
+                    tasks=ALL_TASKS, sentiment: dict | None = None) -> dict:
+    """
+    Jalankan summarization, sentiment, dan topic extraction untuk satu artikel.
+    Text di-preprocess sekali (PreparedText) lalu dipakai ketiga tahap.
+    Kalau `topics`/`sentiment` sudah dihitung dalam batch (extract_topics_batch,
+    analyze_sentiment_batch), pakai itu.
+    `summary_mode`: "abstractive" (BART) atau "extractive" (TextRank, cepat).
+    `tasks`: subset dari ALL_TASKS yang dijalankan (sisanya tidak diisi).
+    """
+    doc = prepare_text(content)
+    result = {}
+
+    # Summarization
+    if "summary" in tasks:
+        if summary_mode == "extractive":
+            result["summary"] = summarize_extractive(doc)
+        else:
+            result["summary"] = summarize_text(doc)
+
+    # Sentiment Analysis
+    if "sentiment" in tasks:
+        if sentiment is None:
+            sentiment = analyze_sentiment(doc)
+        result["sentiment"] = sentiment["label"]
+        result["sentiment_score"] = sentiment["score"]
+
+    # Topic Extraction
+    if "topics" in tasks:
+        result["topics"] = topics if topics is not None else extract_topics(doc)
+
+    return result
+
+
+def is_cacheable(result: dict) -> bool:
+    """
+    Jangan cache hasil gagal supaya dicoba lagi di run berikutnya. Sentimen dari
+    model fallback juga tidak di-cache: CACHE_VERSION menyebut SENTIMENT_MODEL,
+    jadi hasilnya akan terus dipakai walaupun model Indonesia sudah bisa di-load.
+    """
+    if "sentiment" in result and _sentiment_model == SENTIMENT_FALLBACK_MODEL:
+        return False
+    return not result.get("summary", "").startswith("[Gagal")
+
+
+def cache_version(summary_mode: str = "abstractive", tasks=ALL_TASKS) -> str:
+    """
+    Versi cache per mode ringkasan (hasil abstraktif & ekstraktif disimpan terpisah)
+    dan per subset task (hasil parsial tidak tercampur dengan hasil lengkap).
+    """
+    version = f"{CACHE_VERSION}|summary-{summary_mode}"
+    if set(tasks) != set(ALL_TASKS):
+        version += "|tasks-" + ",".join(sorted(tasks))
+    return version
+
+
+def process_nlp(articles: list[dict], streamlit_progress=None, use_cache: bool = True,
+                summary_mode: str = "abstractive", tasks=ALL_TASKS) -> list[dict]:
     """
     Jalankan full NLP pipeline pada list artikel.
+    Hasil per artikel di-cache berdasarkan hash konten + versi model,
+    jadi artikel yang sudah pernah dianalisis tidak diproses ulang.
+    `summary_mode`: "abstractive" (BART) atau "extractive" (TextRank, cepat).
+    `tasks`: subset dari ALL_TASKS; hanya field task tersebut yang diisi.
     Return: list artikel dengan tambahan fields summary, sentiment, topics.
     """
+    if summary_mode not in SUMMARY_MODES:
+        raise ValueError(f"summary_mode harus salah satu dari {SUMMARY_MODES}")
+
     total = len(articles)
     processed = []
+    cache = get_cache("local", cache_version(summary_mode, tasks)) if use_cache else None
 
+    # Preprocess sekali per artikel; hasilnya dipakai cache, topik, dan semua tahap NLP
+    docs = {}
     for i, article in enumerate(articles):
-        content = article.get("content", "")
+        if not is_usable(article):
+            continue
+        doc = PreparedText(article["content"])
+        if doc.is_valid:
+            docs[i] = doc
+
+    # Cek cache dulu; topik untuk artikel yang belum ada di cache dihitung
+    # sekaligus dengan IDF dari seluruh artikel yang layak di hasil pencarian,
+    # sentimen dihitung dalam batch untuk artikel yang belum ada di cache
+    cached_results = {}
+    corpus_topics = {}
+    batch_sentiments = {}
+    if cache is not None:
+        for i, doc in docs.items():
+            cached = cache.get(doc.text, normalized=True)
+            if cached is not None:
+                cached_results[i] = cached
+    uncached = [i for i in docs if i not in cached_results]
+    if uncached and "topics" in tasks:
+        corpus_topics = dict(zip(docs.keys(), extract_topics_batch(list(docs.values()))))
+    if uncached and "sentiment" in tasks:
+        batch_sentiments = dict(zip(uncached, analyze_sentiment_batch([docs[i] for i in uncached])))
+
+    for i, article in enumerate(articles):
+        doc = docs.get(i)
 
         # Skip kalau content kosong atau error
-        if (not content or 
-            content.startswith("[Gagal") or 
-            content.startswith("[Error") or
-            content.startswith("[newspaper3k") or
-            content.startswith("[Konten tidak") or
-            len(content) < 100):
-            
-            article["summary"] = "-"
-            article["sentiment"] = "Netral"
-            article["sentiment_score"] = 0.0
-            article["topics"] = "-"
-            processed.append(article)
+        if doc is None:
+            article.update(empty_result(tasks))
 
-        else:
-            # Summarization
-            article["summary"] = summarize_text(content)
+        elif i in cached_results:
+            article.update(cached_results[i])
 
-            # Sentiment Analysis
-            sentiment_result = analyze_sentiment(content)
-            article["sentiment"] = sentiment_result["label"]
-            article["sentiment_score"] = sentiment_result["score"]
+        else:
+            result = analyze_article(doc, topics=corpus_topics.get(i), summary_mode=summary_mode,
+                                     tasks=tasks, sentiment=batch_sentiments.get(i))
+            article.update(result)
 
-            # Topic Extraction
-            article["topics"] = extract_topics(content)
+            if cache is not None and is_cacheable(result):
+                cache.put(doc.text, result, normalized=True)
 
-            processed.append(article)
+        processed.append(article)
 
         # Update progress bar
         if streamlit_progress is not None:
             streamlit_progress.progress((i + 1) / total, text=f"Processing artikel {i+1}/{total}...")
 
-    return processed
\ No newline at end of file
+    return processed
@@ -1,13 +1,56 @@
 import os
 import json
-import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dotenv import load_dotenv
-from groq import Groq
+from groq import APIConnectionError, Groq, InternalServerError, RateLimitError
+
+from content_validation import is_usable
+from nlp_cache import get_cache
+from rate_limiter import RateLimiter
+from text_compress import CompressionStats, compress_content, count_tokens
 
 # Memuat environment variables dari file .env
 load_dotenv()
 
+GROQ_MODEL = "llama-3.3-70b-versatile"
+
+# Versi prompt untuk cache. Naikkan kalau isi prompt diubah supaya hasil lama
+# di cache otomatis di-invalidate.
+PROMPT_VERSION = "v2"
+CACHE_VERSION = f"{GROQ_MODEL}|prompt-{PROMPT_VERSION}"
+
+# Batas rate API (default: free tier). Bisa di-override lewat .env sesuai tier akun.
+GROQ_RPM = int(os.environ.get("GROQ_RPM", "30"))
+GROQ_TPM = int(os.environ.get("GROQ_TPM", "12000"))
+# Jumlah request paralel ke Groq; laju sebenarnya tetap dibatasi oleh rate limiter
+GROQ_CONCURRENCY = int(os.environ.get("GROQ_CONCURRENCY", "4"))
+GROQ_MAX_RETRIES = int(os.environ.get("GROQ_MAX_RETRIES", "5"))
+# Perkiraan token output (JSON summary + sentiment + topic)
+MAX_OUTPUT_TOKENS = 400
+# Budget token isi artikel setelah kompresi (boilerplate & duplikat dibuang, kalimat di-ranking)
+CONTENT_TOKEN_BUDGET = int(os.environ.get("GROQ_CONTENT_TOKEN_BUDGET", "1500"))
+# Mode batch: beberapa artikel dikemas dalam satu request sampai budget token input ini
+GROQ_BATCH_MODE = os.environ.get("GROQ_BATCH_MODE", "0") == "1"
+BATCH_TOKEN_BUDGET = int(os.environ.get("GROQ_BATCH_TOKEN_BUDGET", "6000"))
+BATCH_MAX_ITEMS = int(os.environ.get("GROQ_BATCH_MAX_ITEMS", "8"))
+# Token output per artikel di mode batch
+BATCH_OUTPUT_TOKENS_PER_ITEM = 250
+
+SYSTEM_PROMPT = "You are a specialized JSON AI assistant for news analysis."
+VALID_SENTIMENTS = {"Positif", "Negatif", "Netral"}
+
+# Task yang bisa diminta ke LLM. Router (nlp_router.py) bisa meminta sebagian
+# saja, mis. hanya summary, supaya prompt & output lebih pendek.
+ALL_TASKS = ("summary", "sentiment", "topics")
+TASK_INSTRUCTIONS = {
+    "summary": '- "summary": Ringkas berita ini dalam 2-3 kalimat yang padat dan informatif.',
+    "sentiment": '- "sentiment": Tentukan sentimen dari isi berita, pilih salah satu persis hurufnya: "Positif", "Negatif", atau "Netral".',
+    "topics": '- "topic": Ekstrak topik atau isu utama dari teks dalam wujud satu kalimat pendek atau frasa singkat (maksimal 10 kata), contoh: "Pertumbuhan ekonomi Surabaya 2025" atau "Evaluasi dana bantuan sosial".',
+}
+TASK_KEYS = {"summary": "summary", "sentiment": "sentiment", "topics": "topic"}
+
 _client = None
+_rate_limiter = None
 
 def get_groq_client():
     global _client
@@ -15,129 +58,327 @@ def get_groq_client():
         api_key = os.environ.get("GROQ_API_KEY")
         if not api_key or api_key == "masukkan_api_key_disini":
             raise ValueError("GROQ_API_KEY belum di-set di file .env")
-        _client = Groq(api_key=api_key)
+        # Retry (429, 5xx, timeout, koneksi putus) ditangani sendiri di _chat_json
+        # (backoff + rate limiter bersama), bukan oleh SDK.
+        # Base URL bisa diarahkan ke server lokal lewat env GROQ_BASE_URL.
+        _client = Groq(api_key=api_key, max_retries=0)
     return _client
 
-# Pattern konten tidak valid (halaman error, sosial media, dsb.)
-GARBAGE_CONTENT_PATTERNS = [
-    'javascript is not available',
-    'javascript is disabled',
-    'please enable javascript',
-    'switch to a supported browser',
-    'continue using x.com',
-    'continue using twitter.com',
-    'access denied',
-    '403 forbidden',
-    'halaman tidak ditemukan',
-    'page not found',
-    'cookies are disabled',
-]
-
-
-def _is_garbage_content(content: str) -> bool:
-    """Cek apakah content adalah garbage (error page, sosmed, dsb.)."""
-    content_lower = content.lower()
-    return any(p in content_lower for p in GARBAGE_CONTENT_PATTERNS)
-
-
-def process_single_article(content: str) -> dict:
-    """Mengirim satu teks artikel ke Groq untuk Summarization, Sentiment, dan Topic."""
-    if not content or len(content.strip()) < 100 or content.startswith("["):
-        return {"summary": "-", "sentiment": "Netral", "topic": "-"}
+
+def get_rate_limiter() -> RateLimiter:
+    """Rate limiter dipakai bersama semua thread (satu kuota API)."""
+    global _rate_limiter
+    if _rate_limiter is None:
+        _rate_limiter = RateLimiter(GROQ_RPM, GROQ_TPM)
+    return _rate_limiter
+
+
+def _task_instructions(tasks) -> str:
+    return "\n    ".join(TASK_INSTRUCTIONS[t] for t in ALL_TASKS if t in tasks)
+
+
+def _default_ai_result() -> dict:
+    return {"summary": "-", "sentiment": "Netral", "topic": "-"}
+
+
+def cache_version(tasks=ALL_TASKS) -> str:
+    """Versi cache; hasil subset task disimpan terpisah dari hasil lengkap."""
+    if set(tasks) == set(ALL_TASKS):
+        return CACHE_VERSION
+    return CACHE_VERSION + "|tasks-" + ",".join(sorted(tasks))
+
+
+def _chat_json(messages: list[dict], max_tokens: int = MAX_OUTPUT_TOKENS) -> dict:
+    """
+    Kirim request chat ke Groq lewat rate limiter. 429, error 5xx, timeout, dan
+    koneksi putus di-retry dengan jittered backoff (maksimal GROQ_MAX_RETRIES).
+    Return: dict hasil parse JSON dari jawaban model.
+    """
+    client = get_groq_client()
+    limiter = get_rate_limiter()
+    estimated = sum(count_tokens(m["content"]) for m in messages) + max_tokens
+
+    for attempt in range(GROQ_MAX_RETRIES + 1):
+        limiter.acquire(estimated)
+        try:
+            raw = client.chat.completions.with_raw_response.create(
+                model=GROQ_MODEL,  # Model terpadu JSON LLaMA 3.3
+                messages=messages,
+                temperature=0.1,  # Rendah untuk jawaban analisis deterministik
+                max_tokens=max_tokens,
+                response_format={"type": "json_object"},
+            )
+        except (RateLimitError, InternalServerError) as e:
+            if attempt == GROQ_MAX_RETRIES:
+                raise
+            limiter.backoff(attempt, e.response.headers)
+            continue
+        except APIConnectionError:
+            # Termasuk APITimeoutError; tidak ada response, jadi tanpa retry-after
+            if attempt == GROQ_MAX_RETRIES:
+                raise
+            limiter.backoff(attempt)
+            continue
+
+        limiter.update_from_headers(raw.headers)
+        completion = raw.parse()
+        return json.loads(completion.choices[0].message.content)
+
+
+def process_single_article(content: str, compress: bool = True, tasks=ALL_TASKS) -> dict:
+    """
+    Mengirim satu teks artikel ke Groq untuk Summarization, Sentiment, dan Topic.
+    `compress=False` kalau content sudah dikompres (lihat compress_content).
+    `tasks`: subset ALL_TASKS yang diminta; kunci lain diisi nilai default.
+    """
+    # Garbage (halaman error JavaScript, cookie notice, dll.) sudah disaring
+    # process_nlp lewat content_validation; di sini cukup cek panjang
+    if not content or len(content.strip()) < 100:
+        return _default_ai_result()
     
-    # Cek garbage content (halaman error JavaScript, cookie notice, dll.)
-    if _is_garbage_content(content):
-        return {"summary": "-", "sentiment": "Netral", "topic": "-"}
-        
     try:
-        client = get_groq_client()
+        get_groq_client()
     except ValueError as e:
-        return {"summary": f"[Error: {str(e)}]", "sentiment": "Netral", "topic": "-"}
+        return {**_default_ai_result(), "summary": f"[Error: {str(e)}]"}
     
-    # Potong content jika terlalu panjang (menghemat token context window)
-    if len(content) > 6000:
-        content = content[:6000]
+    if compress:
+        content = compress_content(content, CONTENT_TOKEN_BUDGET)["text"]
         
     prompt = f"""
     Kamu adalah asisten pengolah berita AI Bahasa Indonesia. Analisis teks berita berikut.
     Berikan output strictly DALAM FORMAT JSON tanpa teks pengantar tambahan apapun. 
     Kunci JSON yang harus digunakan:
-    - "summary": Ringkas berita ini dalam 2-3 kalimat yang padat dan informatif.
-    - "sentiment": Tentukan sentimen dari isi berita, pilih salah satu persis hurufnya: "Positif", "Negatif", atau "Netral".
-    - "topic": Ekstrak topik atau isu utama dari teks dalam wujud satu kalimat pendek atau frasa singkat (maksimal 10 kata), contoh: "Pertumbuhan ekonomi Surabaya 2025" atau "Evaluasi dana bantuan sosial".
+    {_task_instructions(tasks)}
     
     Teks Berita:
     {content}
     """
     
     try:
-        completion = client.chat.completions.create(
-            model="llama-3.3-70b-versatile",  # Model terpadu JSON LLaMA 3.3
-            messages=[
-                {"role": "system", "content": "You are a specialized JSON AI assistant for news analysis."},
-                {"role": "user", "content": prompt}
-            ],
-            temperature=0.1,  # Rendah untuk jawaban analisis deterministik
-            response_format={"type": "json_object"},
-        )
+        data = _chat_json([
+            {"role": "system", "content": SYSTEM_PROMPT},
+            {"role": "user", "content": prompt}
+        ])
         
-        result_text = completion.choices[0].message.content
-        data = json.loads(result_text)
-        
-        return {
-            "summary": data.get("summary", "-"),
-            "sentiment": data.get("sentiment", "Netral"),
-            "topic": data.get("topic", "-")
-        }
+        result = _default_ai_result()
+        for task in tasks:
+            key = TASK_KEYS[task]
+            result[key] = data.get(key, result[key])
+        return result
     except Exception as e:
-        return {"summary": f"[API Error: {str(e)[:50]}]", "sentiment": "Netral", "topic": "-"}
+        return {**_default_ai_result(), "summary": f"[API Error: {str(e)[:50]}]"}
+
+
+# ============================================================
+# Mode Batch: beberapa artikel dalam satu prompt
+# ============================================================
+
+def _build_batch_prompt(items: list[tuple[str, str]], tasks=ALL_TASKS) -> str:
+    """Prompt untuk sekumpulan artikel; artikel dikirim sebagai JSON array {id, text}."""
+    payload = json.dumps([{"id": item_id, "text": text} for item_id, text in items], ensure_ascii=False)
+    shape = ", ".join(['"id": "<id artikel>"'] + [f'"{TASK_KEYS[t]}": "..."' for t in ALL_TASKS if t in tasks])
+    return f"""
+    Kamu adalah asisten pengolah berita AI Bahasa Indonesia. Analisis SETIAP teks berita di daftar berikut secara terpisah.
+    Berikan output strictly DALAM FORMAT JSON tanpa teks pengantar tambahan apapun, dengan bentuk:
+    {{"results": [{{{shape}}}, ...]}}
+    Satu objek per artikel, gunakan "id" persis seperti di input. Kunci per artikel:
+    {_task_instructions(tasks)}
+
+    Daftar Artikel (JSON):
+    {payload}
+    """
 
 
-def process_nlp(articles: list[dict], streamlit_progress=None) -> list[dict]:
+def _validate_item(item, tasks=ALL_TASKS) -> dict | None:
+    """Validasi satu hasil dari jawaban batch (hanya kunci task yang diminta). Return None kalau tidak valid."""
+    if not isinstance(item, dict):
+        return None
+    result = _default_ai_result()
+    if "summary" in tasks:
+        summary = item.get("summary")
+        if not isinstance(summary, str) or not summary.strip():
+            return None
+        result["summary"] = summary.strip()
+    if "sentiment" in tasks:
+        sentiment = item.get("sentiment")
+        if sentiment not in VALID_SENTIMENTS:
+            return None
+        result["sentiment"] = sentiment
+    if "topics" in tasks:
+        topic = item.get("topic")
+        if not isinstance(topic, str):
+            return None
+        result["topic"] = topic.strip() or "-"
+    return result
+
+
+def pack_batches(items: list[tuple[str, str]], token_budget: int = BATCH_TOKEN_BUDGET,
+                 max_items: int = BATCH_MAX_ITEMS) -> list[list[tuple[str, str]]]:
+    """Kemas (id, text) ke batch berurutan selama estimasi token input masih di bawah budget."""
+    batches = []
+    current = []
+    current_tokens = 0
+    for item_id, text in items:
+        tokens = count_tokens(text)
+        if current and (current_tokens + tokens > token_budget or len(current) >= max_items):
+            batches.append(current)
+            current = []
+            current_tokens = 0
+        current.append((item_id, text))
+        current_tokens += tokens
+    if current:
+        batches.append(current)
+    return batches
+
+
+def process_batch(items: list[tuple[str, str]], compress: bool = True, tasks=ALL_TASKS) -> dict[str, dict]:
+    """
+    Analisis beberapa artikel dalam satu request.
+    `items`: list (id, content). Return: dict id → {"summary", "sentiment", "topic"}.
+    Item yang jawabannya hilang/tidak valid dicoba ulang dengan membelah batch jadi dua;
+    item tunggal yang gagal dikirim lewat process_single_article.
+    `compress=False` kalau content sudah dikompres (lihat compress_content).
+    """
+    if compress:
+        items = [(item_id, compress_content(content, CONTENT_TOKEN_BUDGET)["text"]) for item_id, content in items]
+
+    if len(items) == 1:
+        item_id, content = items[0]
+        return {item_id: process_single_article(content, compress=False, tasks=tasks)}
+
+    results = {}
+    try:
+        data = _chat_json(
+            [
+                {"role": "system", "content": SYSTEM_PROMPT},
+                {"role": "user", "content": _build_batch_prompt(items, tasks)}
+            ],
+            max_tokens=BATCH_OUTPUT_TOKENS_PER_ITEM * len(items)
+        )
+        expected_ids = {item_id for item_id, _ in items}
+        for item in data.get("results", []) if isinstance(data, dict) else []:
+            item_id = str(item.get("id")) if isinstance(item, dict) else None
+            if item_id in expected_ids and item_id not in results:
+                valid = _validate_item(item, tasks)
+                if valid is not None:
+                    results[item_id] = valid
+    except Exception:
+        # JSON rusak / error API → semua item dianggap gagal lalu dibelah
+        pass
+
+    failed = [item for item in items if item[0] not in results]
+    if failed:
+        if len(failed) == len(items):
+            # Tidak ada yang berhasil: belah jadi dua supaya batch mengecil
+            middle = len(failed) // 2
+            halves = [failed[:middle], failed[middle:]]
+        else:
+            halves = [failed]
+        for half in halves:
+            results.update(process_batch(half, compress=False, tasks=tasks))
+
+    return results
+
+
+def _is_skipped(article) -> bool:
+    """Gagal di-scrape, halaman garbage, atau konten terlalu pendek → tidak dikirim ke API."""
+    return not is_usable(article) or len(article["content"]) < 100
+
+
+def _to_article_fields(ai_result: dict, tasks=ALL_TASKS) -> dict:
+    fields = {}
+    if "summary" in tasks:
+        fields["summary"] = ai_result["summary"]
+    if "sentiment" in tasks:
+        fields["sentiment"] = ai_result["sentiment"]
+        fields["sentiment_score"] = 0.0  # Groq tidak membalas score akurat
+    if "topics" in tasks:
+        fields["topics"] = ai_result["topic"]
+    return fields
+
+
+def process_nlp(articles: list[dict], streamlit_progress=None, use_cache: bool = True,
+                concurrency: int = GROQ_CONCURRENCY, batch_mode: bool = GROQ_BATCH_MODE,
+                tasks=ALL_TASKS, stats: CompressionStats | None = None) -> list[dict]:
     """
     Jalankan full NLP pipeline pada list artikel menggunakan API Groq.
+    Artikel yang hasilnya sudah ada di cache tidak dikirim ulang ke API.
+    Request dikirim paralel (`concurrency` thread); lajunya diatur token bucket
+    RPM/TPM yang menyesuaikan diri dengan header rate limit dari API.
+    `batch_mode=True`: beberapa artikel dikemas dalam satu prompt (hemat token
+    system prompt/instruksi dan latency per request).
+    Sebelum dikirim, konten dikompres ke CONTENT_TOKEN_BUDGET token; token yang
+    dihemat diakumulasi ke `stats` (CompressionStats milik pemanggil, bukan state
+    modul, supaya job yang berjalan bersamaan tidak saling menimpa).
+    `tasks`: subset ALL_TASKS yang diminta ke LLM; hanya field task tersebut yang diisi.
     Return: list artikel dengan tambahan fields summary, sentiment, topics.
     """
+    if not articles:
+        return articles
+
     total = len(articles)
-    processed = []
+    cache = get_cache("groq", cache_version(tasks)) if use_cache else None
+    done = 0
+
+    def report():
+        # Update progress bar interface Streamlit
+        if streamlit_progress is not None:
+            streamlit_progress.progress(done / total, text=f"Processing AI artikel {done}/{total} dengan Groq...")
 
+    pending = {}
     for i, article in enumerate(articles):
-        content = article.get("content", "")
-
-        # Skip kalau content kosong atau error scraping
-        if (not content or 
-            content.startswith("[Gagal") or 
-            content.startswith("[Error") or
-            content.startswith("[newspaper3k") or
-            content.startswith("[Konten tidak") or
-            content.startswith("[Konten dari") or
-            content.startswith("[URL tidak") or
-            _is_garbage_content(content) or
-            len(content) < 100):
-            
-            article["summary"] = "-"
-            article["sentiment"] = "Netral"
-            # Nilai score default agar visualisasi di app.py tetap tidak rusak
-            article["sentiment_score"] = 0.0 
-            article["topics"] = "-"
-            processed.append(article)
+        # Skip kalau gagal scraping atau konten tidak layak
+        if _is_skipped(article):
+            # Nilai default (sentiment_score 0.0) agar visualisasi di app.py tetap tidak rusak
+            article.update(_to_article_fields(_default_ai_result(), tasks))
+            done += 1
+            continue
 
-        else:
-            # Panggil Groq AI untuk melakukan semua task NLP sekaligus
-            ai_result = process_single_article(content)
-            
-            article["summary"] = ai_result["summary"]
-            article["sentiment"] = ai_result["sentiment"]
-            article["sentiment_score"] = 0.0  # Groq tidak membalas score akurat
-            article["topics"] = ai_result["topic"]
+        content = article["content"]
+        cached = cache.get(content) if cache is not None else None
+        if cached is not None:
+            article.update(cached)
+            done += 1
+            continue
 
-            processed.append(article)
+        pending[i] = content
 
-        # Update progress bar interface Streamlit
-        if streamlit_progress is not None:
-            streamlit_progress.progress((i + 1) / total, text=f"Processing AI artikel {i+1}/{total} dengan Groq...")
-            
-        # Sleep kecil mencegah Rate Limit dari tier API gratisan jika banyak artikel
-        time.sleep(1)
+    report()
+
+    def finish(i: int, ai_result: dict):
+        nonlocal done
+        result = _to_article_fields(ai_result, tasks)
+        articles[i].update(result)
+
+        # Jangan cache hasil error supaya dicoba lagi di run berikutnya
+        if cache is not None and not ai_result["summary"].startswith("["):
+            cache.put(pending[i], result)
+
+        done += 1
+        report()
+
+    # Kompres konten sekali di sini (boilerplate, duplikat, budget token) dan catat token yang dihemat
+    compressed = {}
+    for i, content in pending.items():
+        result = compress_content(content, CONTENT_TOKEN_BUDGET)
+        if stats is not None:
+            stats.add(result)
+        compressed[i] = result["text"]
+
+    if pending:
+        with ThreadPoolExecutor(max_workers=max(1, concurrency)) as executor:
+            if batch_mode:
+                batches = pack_batches([(str(i), text) for i, text in compressed.items()])
+                futures = [executor.submit(process_batch, batch, False, tasks) for batch in batches]
+                for future in as_completed(futures):
+                    for item_id, ai_result in future.result().items():
+                        finish(int(item_id), ai_result)
+            else:
+                futures = {
+                    executor.submit(process_single_article, text, False, tasks): i
+                    for i, text in compressed.items()
+                }
+                for future in as_completed(futures):
+                    finish(futures[future], future.result())
 
-    return processed
+    return articles
@@ -0,0 +1,303 @@
+"""
+Routing NLP per task antara backend lokal (nlp_pipeline) dan LLM (nlp_pipelinev2).
+
+Sebelumnya harus pilih salah satu: semua lokal (BART/RoBERTa/TF-IDF) atau
+semua lewat Groq. Di sini setiap task (summary, sentiment, topics) punya
+rute sendiri:
+
+- "local": selalu pakai model lokal.
+- "llm":   selalu pakai Groq (kalau API key tidak ada → fallback lokal).
+- "auto":  pakai Groq hanya untuk artikel yang cukup panjang dan selama budget
+           (jumlah call & estimasi token) belum habis; sisanya lokal.
+
+Profil default "hybrid": sentimen & topik lokal (murah, di-batch), ringkasan
+artikel panjang ke LLM. Artikel dikelompokkan per backend + subset task, lalu
+`process_nlp` backend dipanggil sekali per kelompok dengan argumen `tasks`.
+
+Model lokal hanya untuk Bahasa Indonesia: artikel berbahasa lain (lihat
+language_detect) dikirim ke LLM untuk semua task kalau Groq tersedia, kalau
+tidak dilewati dengan hasil default.
+
+Setelah semua task, artikel ditag entitas wilayah/organisasi dari gazetteer
+(entity_tagger); murah, jadi selalu lokal dan tidak ikut routing.
+"""
+
+import os
+
+
+ALL_TASKS = ("summary", "sentiment", "topics")
+ROUTES = ("local", "llm", "auto")
+
+ROUTE_PROFILES = {
+    "local": {"summary": "local", "sentiment": "local", "topics": "local"},
+    "llm": {"summary": "llm", "sentiment": "llm", "topics": "llm"},
+    "hybrid": {"summary": "auto", "sentiment": "local", "topics": "local"},
+}
+
+# Aturan rute "auto" (bisa di-override lewat .env)
+LLM_MIN_CHARS = int(os.environ.get("NLP_ROUTER_LLM_MIN_CHARS", "1500"))
+LLM_MAX_CALLS = int(os.environ.get("NLP_ROUTER_LLM_MAX_CALLS", "40"))
+LLM_MAX_TOKENS = int(os.environ.get("NLP_ROUTER_LLM_MAX_TOKENS", "60000"))
+
+
+# ============================================================
+# BAGIAN 1: Backend
+# ============================================================
+
+def llm_available() -> bool:
+    """Groq bisa dipakai kalau library terpasang dan GROQ_API_KEY sudah di-set."""
+    try:
+        from nlp_pipelinev2 import get_groq_client
+        get_groq_client()
+    except (ImportError, ValueError):
+        return False
+    return True
+
+
+def nlp_config(profile: str = "hybrid", summary_mode: str = "abstractive") -> str:
+    """
+    Identitas konfigurasi NLP (profil routing, summary_mode, versi model lokal
+    & LLM, LLM tersedia atau tidak). Hasil NLP tersimpan hanya di-reuse kalau
+    identitasnya sama (lihat watermarks.split_new_articles).
+    """
+    from nlp_pipeline import CACHE_VERSION as local_version
+
+    parts = [profile, f"summary-{summary_mode}", local_version]
+    if any(route != "local" for route in ROUTE_PROFILES[profile].values()):
+        if llm_available():
+            from nlp_pipelinev2 import CACHE_VERSION as llm_version
+            parts.append(llm_version)
+        else:
+            parts.append("llm-unavailable")
+    return "|".join(parts)
+
+
+def _estimate_llm_tokens(content: str) -> int:
+    """Estimasi token satu request LLM (konten setelah kompresi + output)."""
+    from nlp_pipelinev2 import CONTENT_TOKEN_BUDGET, MAX_OUTPUT_TOKENS
+    from text_compress import count_tokens
+    return min(count_tokens(content), CONTENT_TOKEN_BUDGET) + MAX_OUTPUT_TOKENS
+
+
+def _run_local(articles: list[dict], progress, use_cache: bool, summary_mode: str,
+               workers: int, tasks: tuple):
+    if workers > 1:
+        from nlp_workers import process_nlp_parallel
+        process_nlp_parallel(articles, workers=workers, streamlit_progress=progress,
+                             use_cache=use_cache, summary_mode=summary_mode, tasks=tasks)
+    else:
+        from nlp_pipeline import process_nlp as process_local
+        process_local(articles, streamlit_progress=progress, use_cache=use_cache,
+                      summary_mode=summary_mode, tasks=tasks)
+
+
+class _ProgressSlice:
+    """Adapter progress bar: petakan progress 0..1 sebuah kelompok ke potongan bar utama."""
+
+    def __init__(self, progress, start: float, end: float, label: str):
+        self.target = progress
+        self.start = start
+        self.end = end
+        self.label = label
+
+    def progress(self, value: float, text: str = ""):
+        self.target.progress(self.start + value * (self.end - self.start), text=f"[{self.label}] {text}")
+
+
+# ============================================================
+# BAGIAN 2: Perencanaan Rute
+# ============================================================
+
+def plan_routes(articles: list[dict], routes: dict, use_llm: bool,
+                min_llm_chars: int = LLM_MIN_CHARS, max_llm_calls: int = LLM_MAX_CALLS,
+                max_llm_tokens: int = LLM_MAX_TOKENS) -> dict:
+    """
+    Tentukan backend per artikel per task.
+    Return: {"local": {task: [index]}, "llm": {task: [index]}, "skipped": [index],
+    "languages": {bahasa: jumlah artikel non-Indonesia}, "llm_calls": int, "llm_tokens": int}
+    """
+    from language_detect import article_language, is_local_language
+    from nlp_pipeline import is_processable
+
+    plan = {"local": {t: [] for t in ALL_TASKS}, "llm": {t: [] for t in ALL_TASKS},
+            "skipped": [], "languages": {}, "llm_calls": 0, "llm_tokens": 0}
+
+    # Artikel bukan Bahasa Indonesia: semua task ke LLM, atau dilewati kalau LLM tidak ada
+    foreign = set()
+    for i, a in enumerate(articles):
+        if is_processable(a) and not is_local_language(a):
+            foreign.add(i)
+            language = article_language(a)
+            plan["languages"][language] = plan["languages"].get(language, 0) + 1
+
+    # Artikel "auto" yang lolos syarat panjang; yang terpanjang dapat jatah LLM duluan
+    auto_llm = set()
+    if use_llm and "auto" in routes.values():
+        candidates = [
+            i for i, a in enumerate(articles)
+            if i not in foreign and is_processable(a) and len(a["content"]) >= min_llm_chars
+        ]
+        candidates.sort(key=lambda i: len(articles[i]["content"]), reverse=True)
+        calls, tokens = 0, 0
+        for i in candidates:
+            estimate = _estimate_llm_tokens(articles[i]["content"])
+            if calls + 1 > max_llm_calls or tokens + estimate > max_llm_tokens:
+                break
+            auto_llm.add(i)
+            calls += 1
+            tokens += estimate
+
+    # Rute "llm" eksplisit tidak dibatasi budget (pilihan pengguna)
+    for i in range(len(articles)):
+        if i in foreign:
+            if use_llm:
+                for task in ALL_TASKS:
+                    plan["llm"][task].append(i)
+            else:
+                plan["skipped"].append(i)
+            continue
+        for task in ALL_TASKS:
+            route = routes[task]
+            if (route == "llm" and use_llm) or (route == "auto" and i in auto_llm):
+                plan["llm"][task].append(i)
+            else:
+                plan["local"][task].append(i)
+
+    # Satu request LLM per artikel (semua task LLM artikel itu dalam satu prompt)
+    llm_indices = {i for indices in plan["llm"].values() for i in indices}
+    for i in llm_indices:
+        if is_processable(articles[i]):
+            plan["llm_calls"] += 1
+            plan["llm_tokens"] += _estimate_llm_tokens(articles[i]["content"])
+
+    return plan
+
+
+def _group_by_article(per_task: dict) -> list[tuple[tuple, list[int]]]:
+    """
+    Kelompok LLM: artikel dengan subset task yang sama dikirim bersama, jadi
+    setiap artikel cukup satu request (semua task LLM-nya dalam satu prompt).
+    """
+    article_tasks = {}
+    for task in ALL_TASKS:
+        for i in per_task[task]:
+            article_tasks.setdefault(i, []).append(task)
+    groups = {}
+    for i, tasks in sorted(article_tasks.items()):
+        groups.setdefault(tuple(tasks), []).append(i)
+    return list(groups.items())
+
+
+def _group_calls(per_task: dict) -> list[tuple[tuple, list[int]]]:
+    """
+    Kelompok lokal: gabungkan task yang mengenai kumpulan artikel yang sama jadi
+    satu panggilan backend. Mis. sentimen & topik lokal untuk semua artikel → satu
+    panggilan, jadi topik tetap dihitung dengan IDF dari seluruh korpus.
+    """
+    groups = {}
+    for task in ALL_TASKS:
+        indices = per_task[task]
+        if indices:
+            groups.setdefault(tuple(indices), []).append(task)
+    return [(tuple(tasks), list(indices)) for indices, tasks in groups.items()]
+
+
+# ============================================================
+# BAGIAN 3: Pipeline dengan Routing
+# ============================================================
+
+def process_nlp(articles: list[dict], profile: str = "hybrid", routes: dict | None = None,
+                streamlit_progress=None, use_cache: bool = True,
+                summary_mode: str = "abstractive", workers: int = 1,
+                min_llm_chars: int = LLM_MIN_CHARS, max_llm_calls: int = LLM_MAX_CALLS,
+                max_llm_tokens: int = LLM_MAX_TOKENS, stats: dict | None = None) -> list[dict]:
+    """
+    Jalankan NLP dengan backend per task.
+    `profile`: "local", "llm", atau "hybrid" (lihat ROUTE_PROFILES); `routes`
+    meng-override rute per task, mis. {"sentiment": "llm"}.
+    `summary_mode` & `workers` berlaku untuk backend lokal.
+    Ringkasan LLM yang gagal (error API) diulang di backend lokal.
+    `stats`: dict milik pemanggil yang diisi ringkasan routing (jumlah artikel
+    per backend, estimasi call & token LLM) dan, kalau ada artikel ke LLM,
+    "compression" (token sebelum/sesudah kompresi).
+    Return: list artikel dengan tambahan fields summary, sentiment, topics, entities.
+    """
+    if profile not in ROUTE_PROFILES:
+        raise ValueError(f"profile harus salah satu dari {tuple(ROUTE_PROFILES)}")
+    routes = {**ROUTE_PROFILES[profile], **(routes or {})}
+    for task, route in routes.items():
+        if task not in ALL_TASKS or route not in ROUTES:
+            raise ValueError(f"Rute tidak valid: {task}={route}")
+
+    wants_llm = any(r != "local" for r in routes.values())
+    use_llm = wants_llm and llm_available()
+    plan = plan_routes(articles, routes, use_llm, min_llm_chars, max_llm_calls, max_llm_tokens)
+
+    calls = [("llm", tasks, idx) for tasks, idx in _group_by_article(plan["llm"])]
+    calls += [("local", tasks, idx) for tasks, idx in _group_calls(plan["local"])]
+
+    total_work = sum(len(tasks) * len(idx) for _, tasks, idx in calls) or 1
+    done_work = 0
+    fallback = 0
+    compression = None
+
+    if plan["skipped"]:
+        from nlp_pipeline import empty_result
+        for i in plan["skipped"]:
+            articles[i].update(empty_result())
+
+    for backend, tasks, indices in calls:
+        subset = [articles[i] for i in indices]
+        weight = len(tasks) * len(indices)
+        progress = None
+        if streamlit_progress is not None:
+            label = f"{'LLM' if backend == 'llm' else 'Lokal'}: {', '.join(tasks)}"
+            progress = _ProgressSlice(streamlit_progress, done_work / total_work,
+                                      (done_work + weight) / total_work, label)
+
+        if backend == "llm":
+            import nlp_pipelinev2
+            from text_compress import CompressionStats
+            compression = compression or CompressionStats()
+            nlp_pipelinev2.process_nlp(subset, streamlit_progress=progress, use_cache=use_cache, tasks=tasks,
+                                       stats=compression)
+
+            # Error API (mis. kuota habis) → jangan biarkan ringkasan kosong, ulang secara lokal
+            # (artikel bukan Bahasa Indonesia cukup diberi ringkasan default)
+            if "summary" in tasks:
+                from language_detect import is_local_language
+                failed = [a for a in subset if a.get("summary", "").startswith(("[Error", "[API Error"))]
+                retry = [a for a in failed if is_local_language(a)]
+                for a in failed:
+                    if not is_local_language(a):
+                        a["summary"] = "-"
+                if retry:
+                    fallback += len(retry)
+                    _run_local(retry, None, use_cache, summary_mode, workers, ("summary",))
+        else:
+            _run_local(subset, progress, use_cache, summary_mode, workers, tasks)
+
+        done_work += weight
+
+    from entity_tagger import tag_articles
+    tagged = tag_articles(articles)
+
+    if stats is None:
+        return articles
+    stats.update({
+        "profile": profile,
+        "llm_available": use_llm,
+        "llm_unavailable": wants_llm and not use_llm,
+        "llm_articles": len({i for idx in plan["llm"].values() for i in idx}),
+        "local_articles": len({i for idx in plan["local"].values() for i in idx}),
+        "llm_calls_est": plan["llm_calls"],
+        "llm_tokens_est": plan["llm_tokens"],
+        "llm_fallback": fallback,
+        "skipped_language": len(plan["skipped"]),
+        "languages": plan["languages"],
+        "entity_tagged": tagged,
+        "routes": {t: sorted(b for b in ("local", "llm") if plan[b][t]) for t in ALL_TASKS},
+    })
+    if compression is not None:
+        stats["compression"] = compression.as_dict()
+    return articles
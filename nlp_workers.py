@@ -0,0 +1,259 @@
+"""
+Mode multi-proses untuk NLP pipeline lokal.
+
+`process_nlp` di nlp_pipeline.py berjalan di satu thread Python dan hanya
+mengandalkan intra-op thread torch, yang tidak scale untuk input per-artikel
+yang kecil. Modul ini membagi artikel ke beberapa proses worker:
+
+- Setiap worker load model sekali (di initializer), bukan per artikel, dan
+  hanya model yang dibutuhkan task/summary_mode (mode extractive tanpa
+  sentimen tidak load BART maupun RoBERTa sama sekali).
+- Jumlah thread torch per worker di-pin supaya workers × threads ≈ jumlah core.
+- Pool di-reuse lintas rerun Streamlit (disimpan di level modul) dan hanya
+  dibuat ulang kalau konfigurasi worker/thread berubah. Pemakai pool
+  meminjamnya (lease) selama submit → kumpulkan hasil; pool lama yang
+  diganti baru dimatikan setelah semua peminjamnya selesai, jadi job lain
+  dengan konfigurasi berbeda tidak membatalkan pekerjaan yang sedang jalan.
+
+PENTING: modul ini sengaja tidak import torch/transformers di level atas,
+supaya env var thread bisa di-set di worker sebelum torch ter-import.
+"""
+
+import atexit
+import multiprocessing as mp
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import contextmanager
+
+
+# ============================================================
+# BAGIAN 1: Konfigurasi Worker & Thread
+# ============================================================
+
+def cpu_count() -> int:
+    """Jumlah core yang boleh dipakai proses ini."""
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+
+def plan_threads(workers: int) -> int:
+    """Thread torch per worker supaya workers × threads ≈ jumlah core."""
+    return max(1, cpu_count() // max(1, workers))
+
+
+def required_models(summary_mode: str = "abstractive", tasks: tuple = ("summary", "sentiment", "topics")) -> frozenset:
+    """Model yang perlu di-load worker (topik dihitung di proses utama)."""
+    models = set()
+    if "summary" in tasks and summary_mode == "abstractive":
+        models.add("summarizer")
+    if "sentiment" in tasks:
+        models.add("sentiment")
+    return frozenset(models)
+
+
+def _init_worker(threads: int, models: frozenset):
+    """Initializer worker: pin thread torch lalu load model yang dibutuhkan sekali."""
+    # Harus di-set sebelum torch ter-import di proses ini
+    for var in ("OMP_NUM_THREADS", "MKL_NUM_THREADS", "OPENBLAS_NUM_THREADS"):
+        os.environ[var] = str(threads)
+    os.environ["TOKENIZERS_PARALLELISM"] = "false"
+
+    import torch
+    torch.set_num_threads(threads)
+    try:
+        torch.set_num_interop_threads(1)
+    except RuntimeError:
+        # Sudah di-set sebelumnya (hanya boleh sekali per proses)
+        pass
+
+    import nlp_pipeline
+    if "summarizer" in models:
+        nlp_pipeline.load_summarizer()
+    if "sentiment" in models:
+        nlp_pipeline.load_sentiment_analyzer()
+
+
+def _analyze_in_worker(index: int, content: str, topics: str | None, summary_mode: str,
+                       tasks: tuple) -> tuple[int, dict, bool]:
+    """Return (index, hasil, boleh di-cache). Cacheable dicek di worker karena
+    hanya worker yang tahu model sentimen mana yang ter-load."""
+    import nlp_pipeline
+    result = nlp_pipeline.analyze_article(content, topics=topics, summary_mode=summary_mode, tasks=tasks)
+    return index, result, nlp_pipeline.is_cacheable(result)
+
+
+def _ping() -> int:
+    return os.getpid()
+
+
+# ============================================================
+# BAGIAN 2: Pool yang di-reuse lintas rerun
+# ============================================================
+
+_pool = None
+_pool_config = None
+_pool_leases = {}  # pool → jumlah pemakai yang sedang submit/kumpulkan hasil
+_pool_lock = threading.Lock()
+
+
+def _current_pool(workers: int, threads: int | None, models: frozenset) -> ProcessPoolExecutor:
+    """Pool untuk konfigurasi ini (dipanggil dengan _pool_lock dipegang)."""
+    global _pool, _pool_config
+
+    if threads is None:
+        threads = plan_threads(workers)
+    models = frozenset(models)
+
+    if _pool is not None:
+        pool_workers, pool_threads, pool_models = _pool_config
+        if (pool_workers, pool_threads) != (workers, threads) or not models <= pool_models:
+            # Pool yang masih dipinjam dimatikan oleh peminjam terakhir (lihat lease_worker_pool)
+            if not _pool_leases.get(_pool):
+                _pool.shutdown(wait=False)
+            _pool = None
+
+    if _pool is None:
+        # spawn, bukan fork: fork setelah torch membuat thread rawan deadlock
+        _pool = ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=mp.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(threads, models)
+        )
+        _pool_config = (workers, threads, models)
+
+    return _pool
+
+
+def get_worker_pool(workers: int, threads: int | None = None,
+                    models: frozenset = frozenset(("summarizer", "sentiment"))) -> ProcessPoolExecutor:
+    """
+    Get or create process pool. Pool yang sama dipakai selama (workers,
+    threads) tidak berubah dan model yang sudah di-load worker mencakup
+    `models`, jadi model tidak di-load ulang. Untuk submit, pakai
+    lease_worker_pool supaya pool tidak dimatikan selagi dipakai.
+    """
+    with _pool_lock:
+        return _current_pool(workers, threads, models)
+
+
+@contextmanager
+def lease_worker_pool(workers: int, threads: int | None = None,
+                      models: frozenset = frozenset(("summarizer", "sentiment"))):
+    """
+    Pinjam pool selama submit → kumpulkan hasil. Kalau pemakai lain mengganti
+    pool di tengah jalan, pool ini tetap hidup sampai peminjam terakhirnya selesai.
+    """
+    with _pool_lock:
+        pool = _current_pool(workers, threads, models)
+        _pool_leases[pool] = _pool_leases.get(pool, 0) + 1
+    try:
+        yield pool
+    finally:
+        with _pool_lock:
+            _pool_leases[pool] -= 1
+            retired = not _pool_leases[pool] and pool is not _pool
+            if not _pool_leases[pool]:
+                del _pool_leases[pool]
+        if retired:
+            pool.shutdown(wait=False)
+
+
+def warm_up_pool(workers: int, threads: int | None = None,
+                 models: frozenset = frozenset(("summarizer", "sentiment"))) -> None:
+    """Paksa semua worker start dan load model (dipakai sebelum benchmark)."""
+    with lease_worker_pool(workers, threads, models) as pool:
+        futures = [pool.submit(_ping) for _ in range(workers * 2)]
+        for future in futures:
+            future.result()
+
+
+def shutdown_worker_pool():
+    """Matikan pool (dipanggil otomatis saat proses utama selesai)."""
+    global _pool, _pool_config
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown(wait=True, cancel_futures=True)
+            _pool = None
+            _pool_config = None
+
+
+atexit.register(shutdown_worker_pool)
+
+
+# ============================================================
+# BAGIAN 3: Pipeline Paralel
+# ============================================================
+
+def process_nlp_parallel(articles: list[dict], workers: int = 2, threads: int | None = None,
+                         streamlit_progress=None, use_cache: bool = True,
+                         summary_mode: str = "abstractive", tasks: tuple | None = None) -> list[dict]:
+    """
+    Sama seperti nlp_pipeline.process_nlp, tapi artikel dibagi ke process pool.
+    Cache dicek di proses utama; hanya artikel yang belum ada di cache yang dikirim ke worker.
+    """
+    if not articles:
+        return articles
+
+    import nlp_pipeline
+    from nlp_cache import get_cache
+
+    tasks = tuple(tasks or nlp_pipeline.ALL_TASKS)
+    total = len(articles)
+    cache = get_cache("local", nlp_pipeline.cache_version(summary_mode, tasks)) if use_cache else None
+    done = 0
+
+    def report():
+        if streamlit_progress is not None:
+            streamlit_progress.progress(done / total, text=f"Processing artikel {done}/{total} ({workers} worker)...")
+
+    # Preprocess sekali di proses utama (cek validitas, key cache, topik korpus)
+    pending = {}
+    docs = {}
+    for i, article in enumerate(articles):
+        doc = nlp_pipeline.PreparedText(article["content"]) if nlp_pipeline.is_usable(article) else None
+
+        if doc is None or not doc.is_valid:
+            article.update(nlp_pipeline.empty_result(tasks))
+            done += 1
+            continue
+
+        docs[i] = doc
+
+        cached = cache.get(doc.text, normalized=True) if cache is not None else None
+        if cached is not None:
+            article.update(cached)
+            done += 1
+            continue
+
+        pending[i] = doc
+
+    report()
+
+    if pending:
+        # Topik dihitung di proses utama dengan IDF dari seluruh korpus hasil pencarian
+        corpus_topics = {}
+        if "topics" in tasks:
+            corpus_topics = dict(zip(docs.keys(), nlp_pipeline.extract_topics_batch(list(docs.values()))))
+
+        # Worker menerima text mentah (PreparedText di-build ulang di sisi worker)
+        with lease_worker_pool(workers, threads, required_models(summary_mode, tasks)) as pool:
+            futures = [
+                pool.submit(_analyze_in_worker, i, doc.raw, corpus_topics.get(i), summary_mode, tasks)
+                for i, doc in pending.items()
+            ]
+
+            for future in as_completed(futures):
+                i, result, cacheable = future.result()
+                articles[i].update(result)
+
+                if cache is not None and cacheable:
+                    cache.put(pending[i].text, result, normalized=True)
+
+                done += 1
+                report()
+
+    return articles
@@ -0,0 +1,119 @@
+import time
+import streamlit as st
+import pandas as pd
+from datetime import datetime, timedelta
+
+# Import modul lokal
+from article_store import get_article_store, search_articles
+
+
+# ============================================================
+# Konfigurasi Streamlit
+# ============================================================
+
+st.set_page_config(
+    page_title="🗄️ Riwayat Artikel",
+    layout="wide",
+    initial_sidebar_state="expanded"
+)
+
+
+# ============================================================
+# Sidebar — Filter Riwayat
+# ============================================================
+
+store = get_article_store()
+
+st.sidebar.title("🗄️ Filter Riwayat")
+st.sidebar.divider()
+
+teks = st.sidebar.text_input(
+    "🔤 Cari Teks",
+    placeholder="misal: inflasi beras",
+    help="Dicari di judul, isi berita, dan ringkasan (full-text search)."
+)
+
+keyword_pilihan = st.sidebar.selectbox(
+    "🏷️ Keyword Pencarian",
+    options=["Semua"] + store.keywords()
+)
+
+media_pilihan = st.sidebar.multiselect("🗞️ Media", options=store.sources())
+
+sentimen_pilihan = st.sidebar.multiselect("😊 Sentimen", options=["Positif", "Negatif", "Netral"])
+
+st.sidebar.subheader("📅 Rentang Tanggal")
+hari_ini = datetime.now()
+col_d1, col_d2 = st.sidebar.columns(2)
+from_date_input = col_d1.date_input("Dari", value=(hari_ini - timedelta(days=30)).date())
+to_date_input   = col_d2.date_input("Sampai", value=hari_ini.date())
+
+batas = st.sidebar.selectbox("Jumlah Maksimal", options=[100, 200, 500, 1000], index=1)
+
+
+# ============================================================
+# Main Area
+# ============================================================
+
+st.title("🗄️ Riwayat Artikel")
+st.caption(f"Semua artikel dari pencarian & crawl sebelumnya ({len(store):,} artikel tersimpan), tanpa scraping ulang.")
+
+t0 = time.perf_counter()
+articles = search_articles(
+    text=teks,
+    sources=media_pilihan or None,
+    sentiments=sentimen_pilihan or None,
+    keyword=None if keyword_pilihan == "Semua" else keyword_pilihan,
+    date_from=datetime.combine(from_date_input, datetime.min.time()),
+    date_to=datetime.combine(to_date_input, datetime.max.time()),
+    limit=batas
+)
+elapsed_ms = (time.perf_counter() - t0) * 1000
+
+if not articles:
+    st.info("ℹ️ Tidak ada artikel yang cocok dengan filter.")
+    st.stop()
+
+df = pd.DataFrame([
+    {
+        "Tanggal": a["date"].strftime("%d %b %Y, %H:%M") if a.get("date") else "-",
+        "Nama Media": a.get("source") or "-",
+        "Judul Berita": a.get("title") or "-",
+        "Ringkasan": a.get("summary") or "-",
+        "Topik/Isu": a.get("topics") or "-",
+        "Sentimen": a.get("sentiment") or "-",
+        "Keyword": ", ".join(a["keywords"]) or "-",
+        "URL": a.get("url") or "-",
+    }
+    for a in articles
+])
+
+col_info, col_dl = st.columns([4, 1])
+col_info.write(f"**{len(df)}** artikel ditemukan ({elapsed_ms:.1f} ms).")
+
+# CSV hanya di-encode saat diminta, lalu disimpan per kombinasi filter dan
+# versi store (bukan di setiap rerun halaman; upsert apa pun membuatnya basi)
+kunci_filter = (teks, keyword_pilihan, tuple(media_pilihan), tuple(sentimen_pilihan),
+                from_date_input, to_date_input, batas, store.revision())
+csv_siap = st.session_state.get("riwayat_csv")
+if csv_siap is not None and csv_siap[0] == kunci_filter:
+    col_dl.download_button(
+        label="⬇️ Download CSV",
+        data=csv_siap[1],
+        file_name="riwayat_berita.csv",
+        mime="text/csv",
+        use_container_width=True
+    )
+elif col_dl.button("📦 Siapkan CSV", use_container_width=True):
+    st.session_state["riwayat_csv"] = (kunci_filter, df.to_csv(index=False, encoding="utf-8-sig"))
+    st.rerun()
+
+st.dataframe(
+    df,
+    use_container_width=True,
+    hide_index=True,
+    column_config={
+        "URL": st.column_config.LinkColumn("URL", help="Klik untuk buka artikel"),
+        "Ringkasan": st.column_config.TextColumn("Ringkasan", width="large"),
+    }
+)
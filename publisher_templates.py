@@ -0,0 +1,311 @@
+"""
+Template ekstraksi per media (detik, kompas, tribunnews, cnnindonesia,
+liputan6, antaranews).
+
+Sebagian besar artikel datang dari segelintir media besar, tapi heuristik
+umum newspaper3k sering gagal di situs-situs itu (lalu jatuh ke Selenium)
+atau ikut mengambil "Baca juga: ..." di tengah teks. Di sini setiap media
+punya template: selector konten, elemen noise yang dibuang, selector penulis
+dan tanggal, serta cara mengambil artikel multi-halaman.
+
+- Template ditulis sebagai data (PUBLISHER_TEMPLATES) dan dikompilasi sekali
+  saat import (selector CSS → soupsieve), lalu dicari per hostname (termasuk
+  subdomain, mis. news.detik.com → detik.com).
+- HTML statis di-download dengan requests (session per thread, koneksi
+  di-reuse) dan di-parse sekali; browser tidak dipakai sama sekali.
+- Artikel multi-halaman: kalau media punya parameter "tampilkan semua"
+  (mis. `?page=all`), cukup satu request; kalau tidak, link halaman
+  berikutnya diikuti dan isinya disambung (paragraf duplikat dibuang).
+"""
+
+import re
+import threading
+from datetime import datetime
+from urllib.parse import parse_qsl, urlencode, urljoin, urlsplit, urlunsplit
+
+import requests as req_lib
+import soupsieve
+from bs4 import BeautifulSoup
+
+from content_validation import hostname
+
+
+USER_AGENT = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+    "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+)
+REQUEST_TIMEOUT = 15
+# Batas halaman yang diikuti untuk satu artikel
+MAX_PAGES = 10
+HTML_PARSER = "lxml"
+
+# Elemen yang tidak pernah jadi bagian isi berita (berlaku untuk semua template)
+COMMON_NOISE = "script, style, noscript, iframe, figure, figcaption, table, ins, .ads, [class*='ads-']"
+# Link halaman berikutnya standar HTML (dipakai kalau template tidak punya selector sendiri)
+COMMON_NEXT_PAGE = "link[rel='next'], a[rel='next']"
+COMMON_AUTHOR = "meta[name='author']"
+COMMON_DATE = "meta[property='article:published_time'], meta[name='publishdate'], time[datetime]"
+
+# Paragraf noise di dalam isi berita
+NOISE_PARAGRAPH_RE = re.compile(
+    r"^(baca juga|baca selengkapnya|simak juga|lihat juga|tonton juga|advertisement|"
+    r"scroll to continue|dapatkan update|ikuti (berita|kami|.{0,40}google news)|download aplikasi)",
+    re.IGNORECASE,
+)
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+DATE_FORMATS = ("%Y/%m/%d %H:%M:%S", "%Y-%m-%d %H:%M:%S", "%d/%m/%Y %H:%M", "%Y-%m-%d")
+
+
+# ============================================================
+# BAGIAN 1: Template per media
+# ============================================================
+
+# content:    selector kontainer isi berita (semua yang cocok disambung berurutan)
+# remove:     noise di dalam kontainer (selain COMMON_NOISE)
+# author:     selector penulis; author_pattern (regex, grup 1) membersihkan teksnya
+# date:       selector tanggal terbit (atribut content/datetime atau teks)
+# all_pages:  parameter query yang menampilkan seluruh halaman dalam satu request
+# next_page:  selector link halaman berikutnya (selain COMMON_NEXT_PAGE)
+PUBLISHER_TEMPLATES = {
+    "detik.com": {
+        "content": "div.detail__body-text",
+        "remove": ".parallaxindetail, .staticdetail_container, .lihatjg, .linksisip, .detail__body-tag, .noncontent",
+        "author": "div.detail__author",
+        "author_pattern": r"^(.+?)\s+-\s+detik",
+        "date": "meta[name='publishdate']",
+        "all_pages": {"single": "1"},
+        "next_page": ".detail__anchor-numb a.next",
+    },
+    "kompas.com": {
+        "content": "div.read__content",
+        "remove": ".inner-link-baca-juga, .kompasidRec, .read__tagging, .ads-on-body",
+        "author": ".credit-title-name, .read__credit__item",
+        "author_pattern": r"^(?:Penulis\s*:?\s*)?(.+)$",
+        "date": "meta[name='content_PublishedDate']",
+        "all_pages": {"page": "all"},
+        "next_page": ".paging__link--next",
+    },
+    "tribunnews.com": {
+        "content": "div.side-article.txt-article, div.txt-article",
+        "remove": ".baca, .bacajuga, .ads-placeholder",
+        "author": "div#penulis a, .penulis a",
+        "date": "meta[name='publishdate'], time[datetime]",
+        "all_pages": {"page": "all"},
+        "next_page": ".paging a.next, #paginga a[rel='next']",
+    },
+    "cnnindonesia.com": {
+        "content": "div.detail-text",
+        "remove": ".linksisip, .para_caption, .inbetween_ads, .embed",
+        "author": "meta[name='author'], .detail__author",
+        "date": "meta[name='publishdate']",
+    },
+    "liputan6.com": {
+        # Semua halaman artikel sudah ada di HTML yang sama (satu item per halaman)
+        "content": "div.article-content-body__item-content",
+        "remove": ".baca-juga-collections, .article-content-body__item-break, .advertisement-text",
+        "author": ".read-page--header--author__name",
+        "date": "time.read-page--header--author__datetime, meta[property='article:published_time']",
+    },
+    "antaranews.com": {
+        "content": "div.post-content, div.wrap__article-detail-content",
+        "remove": ".baca-juga, .text-muted, .quote",
+        "author": "p.text-muted",
+        "author_pattern": r"Pewarta\s*:\s*(.+?)(?:\s*Editor\s*:|$)",
+        "date": "meta[property='article:published_time']",
+    },
+}
+
+
+def _compile_in_order(*selectors) -> tuple:
+    """Selector template dulu, baru selector umum (soupsieve mengembalikan urutan dokumen, bukan prioritas)."""
+    return tuple(soupsieve.compile(s) for s in selectors if s)
+
+
+def _select_in_order(selectors: tuple, soup):
+    for selector in selectors:
+        yield from selector.select(soup)
+
+
+class PublisherTemplate:
+    """Template satu media dengan selector yang sudah dikompilasi."""
+
+    __slots__ = ("domain", "content", "remove", "author", "author_pattern", "date", "all_pages", "next_page")
+
+    def __init__(self, domain: str, spec: dict):
+        self.domain = domain
+        self.content = soupsieve.compile(spec["content"])
+        remove = ", ".join(filter(None, (COMMON_NOISE, spec.get("remove"))))
+        self.remove = soupsieve.compile(remove)
+        self.author = _compile_in_order(spec.get("author"), COMMON_AUTHOR)
+        pattern = spec.get("author_pattern")
+        self.author_pattern = re.compile(pattern, re.IGNORECASE) if pattern else None
+        self.date = _compile_in_order(spec.get("date"), COMMON_DATE)
+        self.all_pages = dict(spec.get("all_pages") or {})
+        self.next_page = _compile_in_order(spec.get("next_page"), COMMON_NEXT_PAGE)
+
+    def __repr__(self) -> str:
+        return f"PublisherTemplate({self.domain!r})"
+
+    # --------------------------------------------------------
+    # Ekstraksi dari satu halaman HTML
+    # --------------------------------------------------------
+
+    def paragraphs(self, soup) -> list[str]:
+        """Paragraf isi berita (noise dan "Baca juga" dibuang)."""
+        paragraphs = []
+        for node in self.content.select(soup):
+            for noise in self.remove.select(node):
+                noise.decompose()
+            blocks = node.find_all(["p", "h2", "h3", "li"]) or [node]
+            for block in blocks:
+                text = _WHITESPACE_RE.sub(" ", block.get_text()).strip()
+                if text and not NOISE_PARAGRAPH_RE.match(text):
+                    paragraphs.append(text)
+        return paragraphs
+
+    def journalist(self, soup) -> str:
+        # author_pattern hanya untuk elemen penulis milik template, bukan meta umum
+        for selector in self.author:
+            pattern = self.author_pattern if selector is not self.author[-1] else None
+            for node in selector.select(soup):
+                text = node.get("content") if node.name == "meta" else node.get_text()
+                text = _WHITESPACE_RE.sub(" ", text or "").strip()
+                if pattern is not None:
+                    match = pattern.search(text)
+                    text = match.group(1).strip() if match else ""
+                if text:
+                    return text
+        return ""
+
+    def published(self, soup) -> datetime | None:
+        for node in _select_in_order(self.date, soup):
+            value = node.get("content") or node.get("datetime") or node.get_text()
+            date = parse_date(value)
+            if date is not None:
+                return date
+        return None
+
+    def next_page_url(self, soup, url: str) -> str | None:
+        for link in _select_in_order(self.next_page, soup):
+            href = link.get("href")
+            if href:
+                return urljoin(url, href)
+        return None
+
+    def all_pages_url(self, url: str) -> str:
+        """URL versi "tampilkan semua halaman" (URL asli kalau media tidak mendukung)."""
+        if not self.all_pages:
+            return url
+        parts = urlsplit(url)
+        query = dict(parse_qsl(parts.query, keep_blank_values=True))
+        query.update(self.all_pages)
+        return urlunsplit((parts.scheme, parts.netloc, parts.path, urlencode(query), ""))
+
+
+def compile_templates(specs: dict) -> dict[str, PublisherTemplate]:
+    return {domain: PublisherTemplate(domain, spec) for domain, spec in specs.items()}
+
+
+_TEMPLATES = compile_templates(PUBLISHER_TEMPLATES)
+
+
+def find_template(url: str) -> PublisherTemplate | None:
+    """Template untuk hostname URL atau domain induknya (news.detik.com → detik.com)."""
+    labels = hostname(url).split(".")
+    for i in range(len(labels) - 1):
+        template = _TEMPLATES.get(".".join(labels[i:]))
+        if template is not None:
+            return template
+    return None
+
+
+def parse_date(value: str) -> datetime | None:
+    """Tanggal terbit dari ISO 8601 atau format umum media Indonesia (tanpa timezone)."""
+    value = (value or "").strip()
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value).replace(tzinfo=None)
+    except ValueError:
+        pass
+    for fmt in DATE_FORMATS:
+        try:
+            return datetime.strptime(value[:19], fmt)
+        except ValueError:
+            continue
+    return None
+
+
+# ============================================================
+# BAGIAN 2: Download & scraping
+# ============================================================
+
+_local = threading.local()
+
+
+def get_session() -> req_lib.Session:
+    """Satu requests.Session per thread (koneksi keep-alive di-reuse per media)."""
+    session = getattr(_local, "session", None)
+    if session is None:
+        session = req_lib.Session()
+        session.headers["User-Agent"] = USER_AGENT
+        _local.session = session
+    return session
+
+
+def fetch_html(url: str) -> str:
+    """Download HTML halaman; string kosong kalau gagal."""
+    try:
+        resp = get_session().get(url, timeout=REQUEST_TIMEOUT)
+        if resp.ok:
+            return resp.text
+    except req_lib.RequestException:
+        pass
+    return ""
+
+
+def scrape_with_template(url: str, template: PublisherTemplate | None = None) -> dict:
+    """
+    Scrape artikel dengan template media.
+    Return: content, journalist, published (datetime atau None), pages
+    (jumlah halaman yang disambung), dan html (halaman pertama, supaya
+    extractor berikutnya tidak perlu download ulang kalau template gagal).
+    """
+    result = {"content": "", "journalist": "", "published": None, "pages": 0, "html": ""}
+    template = template or find_template(url)
+    if template is None:
+        return result
+
+    page_url = template.all_pages_url(url)
+    html = fetch_html(page_url)
+    if not html and page_url != url:
+        page_url, html = url, fetch_html(url)
+    if not html:
+        return result
+    result["html"] = html
+
+    paragraphs, seen, visited = [], set(), {page_url, url}
+    soup = BeautifulSoup(html, HTML_PARSER)
+    result["journalist"] = template.journalist(soup)
+    result["published"] = template.published(soup)
+
+    while True:
+        result["pages"] += 1
+        for paragraph in template.paragraphs(soup):
+            if paragraph not in seen:
+                seen.add(paragraph)
+                paragraphs.append(paragraph)
+
+        next_url = template.next_page_url(soup, page_url)
+        if not next_url or next_url in visited or result["pages"] >= MAX_PAGES:
+            break
+        visited.add(next_url)
+        next_html = fetch_html(next_url)
+        if not next_html:
+            break
+        page_url, soup = next_url, BeautifulSoup(next_html, HTML_PARSER)
+
+    result["content"] = "\n\n".join(paragraphs)
+    return result
@@ -0,0 +1,149 @@
+"""
+Rate limiter token bucket untuk API LLM (Groq).
+
+Dua bucket berjalan bersamaan:
+- requests per minute (RPM)
+- tokens per minute (TPM)
+
+Setiap request harus mengambil 1 "request" + estimasi jumlah token dari kedua
+bucket sebelum dikirim. Limiter juga menyesuaikan diri dengan header rate limit
+dari response API (x-ratelimit-remaining-*, x-ratelimit-reset-*, retry-after),
+jadi kalau kuota di server lebih sedikit dari perkiraan lokal, request berikutnya
+otomatis diperlambat.
+"""
+
+import random
+import re
+import threading
+import time
+
+
+class TokenBucket:
+    """Token bucket sederhana yang thread-safe (refill kontinu per detik)."""
+
+    def __init__(self, capacity: float, refill_per_second: float):
+        self.capacity = float(capacity)
+        self.refill_per_second = float(refill_per_second)
+        self.tokens = float(capacity)
+        self.updated = time.monotonic()
+
+    def _refill(self, now: float):
+        elapsed = now - self.updated
+        if elapsed > 0:
+            self.tokens = min(self.capacity, self.tokens + elapsed * self.refill_per_second)
+            self.updated = now
+
+    def wait_time(self, amount: float, now: float) -> float:
+        """Berapa detik lagi sampai `amount` token tersedia (0 kalau sudah cukup)."""
+        self._refill(now)
+        # Request yang lebih besar dari kapasitas tetap boleh lewat saat bucket penuh
+        amount = min(amount, self.capacity)
+        if self.tokens >= amount:
+            return 0.0
+        return (amount - self.tokens) / self.refill_per_second
+
+    def take(self, amount: float):
+        self.tokens -= min(amount, self.capacity)
+
+    def clamp(self, remaining: float, now: float):
+        """Samakan isi bucket dengan sisa kuota yang dilaporkan server."""
+        self._refill(now)
+        self.tokens = min(self.tokens, float(remaining))
+
+
+_DURATION_RE = re.compile(r"(?:(\d+(?:\.\d+)?)h)?(?:(\d+(?:\.\d+)?)m(?!s))?(?:(\d+(?:\.\d+)?)s)?(?:(\d+(?:\.\d+)?)ms)?")
+
+
+def parse_duration(value: str | None) -> float | None:
+    """
+    Parse durasi format header Groq/OpenAI, mis. "7.66s", "2m59.56s", "120ms", "1h2m".
+    Angka tanpa satuan dianggap detik (format header retry-after).
+    """
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return float(value)
+    except ValueError:
+        pass
+    match = _DURATION_RE.fullmatch(value)
+    if not match or not any(match.groups()):
+        return None
+    hours, minutes, seconds, millis = (float(g) if g else 0.0 for g in match.groups())
+    return hours * 3600 + minutes * 60 + seconds + millis / 1000
+
+
+class RateLimiter:
+    """
+    Limiter RPM + TPM yang bisa dipakai bersama oleh banyak thread.
+
+    acquire(tokens) → blok sampai request boleh dikirim.
+    update_from_headers(headers) → sesuaikan dengan kuota sebenarnya di server.
+    backoff(attempt, headers) → jeda setelah 429 (retry-after atau exponential + jitter).
+    """
+
+    def __init__(self, requests_per_minute: int, tokens_per_minute: int):
+        self.requests = TokenBucket(requests_per_minute, requests_per_minute / 60.0)
+        self.tokens = TokenBucket(tokens_per_minute, tokens_per_minute / 60.0)
+        self._blocked_until = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self, tokens: int):
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                wait = max(
+                    self._blocked_until - now,
+                    self.requests.wait_time(1, now),
+                    self.tokens.wait_time(tokens, now),
+                )
+                if wait <= 0:
+                    self.requests.take(1)
+                    self.tokens.take(tokens)
+                    return
+            time.sleep(min(wait, 5.0))
+
+    def pause(self, seconds: float):
+        """Tahan semua request sampai `seconds` detik ke depan."""
+        with self._lock:
+            self._blocked_until = max(self._blocked_until, time.monotonic() + seconds)
+
+    def update_from_headers(self, headers) -> None:
+        """Adaptasi dari header x-ratelimit-* pada response API."""
+        if not headers:
+            return
+        with self._lock:
+            now = time.monotonic()
+
+            remaining_tokens = headers.get("x-ratelimit-remaining-tokens")
+            if remaining_tokens is not None:
+                try:
+                    self.tokens.clamp(float(remaining_tokens), now)
+                except ValueError:
+                    pass
+
+            remaining_requests = headers.get("x-ratelimit-remaining-requests")
+            if remaining_requests is not None:
+                try:
+                    self.requests.clamp(float(remaining_requests), now)
+                    # Kuota request habis → tunggu sampai reset
+                    if float(remaining_requests) <= 0:
+                        reset = parse_duration(headers.get("x-ratelimit-reset-requests"))
+                        if reset:
+                            self._blocked_until = max(self._blocked_until, now + reset)
+                except ValueError:
+                    pass
+
+    def backoff(self, attempt: int, headers=None, base: float = 1.0, cap: float = 60.0) -> float:
+        """
+        Hitung & terapkan jeda setelah 429. Pakai retry-after kalau ada,
+        kalau tidak exponential backoff dengan full jitter.
+        Return: jumlah detik jeda.
+        """
+        retry_after = parse_duration(headers.get("retry-after")) if headers else None
+        if retry_after is not None:
+            delay = retry_after + random.uniform(0, base)
+        else:
+            delay = random.uniform(0, min(cap, base * (2 ** attempt)))
+        self.pause(delay)
+        return delay
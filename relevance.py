@@ -0,0 +1,125 @@
+"""
+Ranking relevansi judul terhadap keyword, sebelum scraping.
+
+GNews mengembalikan hasil yang longgar untuk keyword multi-kata, tapi setiap
+artikel yang lolos filter tanggal tetap di-resolve, di-download, dan
+dianalisis NLP. Di sini setiap artikel diberi skor relevansi dari judul dan
+nama media:
+
+- BM25 atas judul (IDF dihitung dari hasil pencarian itu sendiri); kata
+  keyword juga cocok dengan bentuk berimbuhan di judul (mis. "harga" →
+  "harganya").
+- Bonus kalau seluruh frasa keyword muncul utuh di judul (stopword di
+  antaranya diabaikan), atau sebagian pasangan kata keyword berurutan.
+- Bonus kecil kalau kata keyword muncul di nama media.
+
+Skor dinormalisasi ke 0-1 (1 = artikel paling relevan di hasil ini), lalu
+artikel diurutkan dari yang paling relevan dan bisa dibatasi top-N dan/atau
+skor minimum, jadi artikel yang tidak relevan tidak pernah di-scrape.
+"""
+
+import math
+import re
+from collections import Counter
+
+from nlp_pipeline import STOPWORDS_ID
+
+
+BM25_K1 = 1.2
+BM25_B = 0.75
+# Bonus frasa/bigram dan media, relatif terhadap total IDF keyword
+PHRASE_WEIGHT = 1.0
+BIGRAM_WEIGHT = 0.5
+SOURCE_WEIGHT = 0.3
+# Kata keyword sependek ini harus sama persis (tidak dicocokkan sebagai awalan)
+MIN_PREFIX_LEN = 4
+
+_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+
+def tokenize(text: str) -> list[str]:
+    return _TOKEN_RE.findall((text or "").lower())
+
+
+def query_terms(keyword: str) -> list[str]:
+    """Kata keyword tanpa stopword (kalau semuanya stopword, pakai apa adanya)."""
+    tokens = tokenize(keyword)
+    terms = [t for t in tokens if t not in STOPWORDS_ID]
+    return list(dict.fromkeys(terms or tokens))
+
+
+def _matches(term: str, token: str) -> bool:
+    return token == term or (len(term) >= MIN_PREFIX_LEN and token.startswith(term))
+
+
+def _term_frequencies(terms: list[str], tokens: list[str]) -> Counter:
+    tf = Counter()
+    for token in tokens:
+        for term in terms:
+            if _matches(term, token):
+                tf[term] += 1
+    return tf
+
+
+def _has_sequence(terms: list[str], tokens: list[str]) -> bool:
+    n = len(terms)
+    return any(
+        all(_matches(term, token) for term, token in zip(terms, tokens[i:i + n]))
+        for i in range(len(tokens) - n + 1)
+    )
+
+
+def score_titles(keyword: str, articles: list[dict]) -> list[float]:
+    """Skor relevansi mentah (BM25 + bonus frasa/media) setiap artikel."""
+    terms = query_terms(keyword)
+    if not terms or not articles:
+        return [0.0] * len(articles)
+
+    titles = [tokenize(a.get("title", "")) for a in articles]
+    frequencies = [_term_frequencies(terms, tokens) for tokens in titles]
+
+    n_docs = len(titles)
+    avg_len = sum(len(t) for t in titles) / n_docs or 1.0
+    doc_freq = Counter(term for tf in frequencies for term in tf)
+    idf = {t: math.log(1 + (n_docs - doc_freq[t] + 0.5) / (doc_freq[t] + 0.5)) for t in terms}
+    total_idf = sum(idf.values())
+    bigrams = list(zip(terms, terms[1:]))
+
+    scores = []
+    for article, tokens, tf in zip(articles, titles, frequencies):
+        norm = BM25_K1 * (1 - BM25_B + BM25_B * len(tokens) / avg_len)
+        score = sum(idf[t] * tf[t] * (BM25_K1 + 1) / (tf[t] + norm) for t in tf)
+
+        # Frasa dicek tanpa stopword ("harga beras di Surabaya" cocok dengan "harga beras Surabaya")
+        content_tokens = [t for t in tokens if t not in STOPWORDS_ID]
+        if len(terms) > 1 and _has_sequence(terms, content_tokens):
+            score += PHRASE_WEIGHT * total_idf
+        elif bigrams:
+            found = sum(1 for pair in bigrams if _has_sequence(list(pair), content_tokens))
+            score += BIGRAM_WEIGHT * total_idf * found / len(bigrams)
+
+        source_tf = _term_frequencies(terms, tokenize(article.get("source", "")))
+        score += SOURCE_WEIGHT * sum(idf[t] for t in source_tf)
+        scores.append(score)
+    return scores
+
+
+def rank_articles(articles: list[dict], keyword: str, top_n: int = 0,
+                  min_relevance: float = 0.0) -> tuple[list[dict], list[dict]]:
+    """
+    Urutkan artikel dari yang paling relevan dan isi field 'relevance' (0-1).
+    `top_n` (0 = semua) dan `min_relevance` membatasi artikel yang dipilih.
+    Return: (artikel terpilih, artikel yang dilewati).
+    """
+    scores = score_titles(keyword, articles)
+    best = max(scores, default=0.0)
+    for article, score in zip(articles, scores):
+        article["relevance"] = round(score / best, 4) if best > 0 else 0.0
+
+    # sorted stabil: skor sama → urutan asli dari Google News
+    ranked = sorted(articles, key=lambda a: a["relevance"], reverse=True)
+    selected = [a for a in ranked if a["relevance"] >= min_relevance]
+    if top_n:
+        selected = selected[:top_n]
+    chosen = {id(a) for a in selected}
+    return selected, [a for a in ranked if id(a) not in chosen]
@@ -0,0 +1,237 @@
+"""
+Penyimpanan & ekspor hasil pencarian dalam format kolumnar (Parquet / Arrow).
+
+Sebelumnya app.py membangun DataFrame baris per baris di loop Python, lalu
+men-serialize seluruh frame (termasuk isi berita lengkap) ke CSV/Excel di
+memory pada setiap rerun. Di sini:
+
+- Tabel dibangun per kolom langsung sebagai Arrow table.
+- Kolom teks panjang (isi, ringkasan, judul) dikompres zstd; kolom dengan
+  sedikit nilai unik (media, sentimen, klaster) di-dictionary-encode dan
+  terbaca sebagai kategori di pandas.
+- Hasil setiap job disimpan sekali ke `.cache/results/<job_id>.parquet`; UI
+  hanya membaca kolom yang dibutuhkan (tabel ringkas tanpa isi berita, isi
+  berita hanya saat detail dibuka).
+- CSV/Excel dibuat on demand dari Parquet per batch (Excel lewat workbook
+  write-only openpyxl) dan disimpan di samping file Parquet job.
+"""
+
+import io
+import os
+from datetime import datetime
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+from openpyxl import Workbook
+from openpyxl.cell.cell import ILLEGAL_CHARACTERS_RE
+
+from article_record import ArticleStatus, status_message
+
+
+RESULTS_DIR = os.environ.get("RESULTS_DIR", os.path.join(".cache", "results"))
+
+# Kolom tabel hasil (nama kolom = yang ditampilkan di UI) → field artikel
+BASE_COLUMNS = {
+    "Tanggal": "date",
+    "Nama Media": "source",
+    "Judul Berita": "title",
+    "URL": "url",
+    "Jurnalis": "journalist",
+    "Isi Berita": "content",
+    "Relevansi": "relevance",
+    "Bahasa": "language",
+}
+NLP_COLUMNS = {
+    "Ringkasan": "summary",
+    "Topik/Isu": "topics",
+    "Klaster Isu": "topic_cluster",
+    "Sentimen": "sentiment",
+    "Entitas": "entities",
+}
+
+DICTIONARY_COLUMNS = ("Nama Media", "Sentimen", "Klaster Isu", "Bahasa")
+TEXT_COLUMNS = ("Isi Berita", "Ringkasan", "Judul Berita")
+# Kolom besar yang tidak dibaca untuk tabel ringkas
+HEAVY_COLUMNS = ("Isi Berita", "Jurnalis")
+# Row group kecil supaya satu artikel bisa dibaca tanpa decode seluruh kolom
+ROW_GROUP_SIZE = 256
+
+
+def build_table(articles: list[dict], with_nlp: bool) -> pa.Table:
+    """Bangun Arrow table hasil pencarian, kolom per kolom."""
+    columns = dict(BASE_COLUMNS)
+    if with_nlp:
+        columns.update(NLP_COLUMNS)
+
+    arrays = {}
+    for name, field in columns.items():
+        values = [article.get(field) for article in articles]
+        if field == "content":
+            # Artikel gagal di-scrape: tampilkan alasannya dari status
+            values = [
+                v or status_message(article.get("status", ArticleStatus.OK))
+                for v, article in zip(values, articles)
+            ]
+        if field == "date":
+            arrays[name] = pa.array(
+                [v if isinstance(v, datetime) else None for v in values], type=pa.timestamp("s")
+            )
+        elif field == "relevance":
+            arrays[name] = pa.array(values, type=pa.float32())
+        elif name in DICTIONARY_COLUMNS:
+            arrays[name] = pa.array([v or "-" for v in values], type=pa.string()).dictionary_encode()
+        else:
+            arrays[name] = pa.array([v or "-" for v in values], type=pa.string())
+    return pa.table(arrays)
+
+
+def write_parquet(table: pa.Table, where) -> None:
+    """Tulis table ke path/buffer: zstd untuk kolom teks panjang, dictionary untuk kolom kategori."""
+    pq.write_table(
+        table, where,
+        row_group_size=ROW_GROUP_SIZE,
+        compression={
+            name: ("zstd" if name in TEXT_COLUMNS else "snappy") for name in table.column_names
+        },
+        use_dictionary=[name for name in table.column_names if name in DICTIONARY_COLUMNS],
+    )
+
+
+def to_parquet_bytes(table: pa.Table) -> bytes:
+    buffer = io.BytesIO()
+    write_parquet(table, buffer)
+    return buffer.getvalue()
+
+
+# ============================================================
+# Hasil per job
+# ============================================================
+
+def results_path(job_id: str) -> str:
+    return os.path.join(RESULTS_DIR, f"{job_id}.parquet")
+
+
+def write_results(job_id: str, table: pa.Table) -> str:
+    """Simpan hasil job (atomic: tulis ke file sementara lalu rename)."""
+    os.makedirs(RESULTS_DIR, exist_ok=True)
+    path = results_path(job_id)
+    tmp_path = path + ".tmp"
+    write_parquet(table, tmp_path)
+    os.replace(tmp_path, path)
+    return path
+
+
+def has_results(job_id: str) -> bool:
+    return os.path.exists(results_path(job_id))
+
+
+def result_columns(job_id: str) -> list[str]:
+    """Nama kolom yang tersedia (dibaca dari metadata Parquet saja)."""
+    return pq.read_schema(results_path(job_id)).names
+
+
+def read_results(job_id: str, columns: list[str] | None = None) -> pd.DataFrame:
+    """Baca hasil job; hanya `columns` yang di-decode dari file (None = semua)."""
+    if columns is not None:
+        available = set(result_columns(job_id))
+        columns = [c for c in columns if c in available]
+    return pq.read_table(results_path(job_id), columns=columns).to_pandas()
+
+
+def read_result_row(job_id: str, index: int, columns: list[str] | None = None) -> dict:
+    """Baca satu baris hasil (misal isi berita untuk detail); hanya row group yang memuatnya di-decode."""
+    parquet_file = pq.ParquetFile(results_path(job_id))
+    if columns is not None:
+        available = set(parquet_file.schema_arrow.names)
+        columns = [c for c in columns if c in available]
+    offset = 0
+    for group in range(parquet_file.num_row_groups):
+        rows = parquet_file.metadata.row_group(group).num_rows
+        if index < offset + rows:
+            table = parquet_file.read_row_group(group, columns=columns)
+            return table.slice(index - offset, 1).to_pylist()[0]
+        offset += rows
+    raise IndexError(f"Baris {index} tidak ada di hasil job {job_id}")
+
+
+def read_results_bytes(job_id: str) -> bytes:
+    with open(results_path(job_id), "rb") as f:
+        return f.read()
+
+
+def delete_results(job_id: str) -> None:
+    for path in [results_path(job_id)] + [export_path(job_id, fmt) for fmt in EXPORT_FORMATS]:
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+
+# ============================================================
+# Ekspor CSV / Excel (on demand, streaming dari Parquet)
+# ============================================================
+
+EXPORT_FORMATS = ("csv", "xlsx")
+EXPORT_BATCH_SIZE = 500
+# Batas isi satu sel Excel
+EXCEL_MAX_CELL_CHARS = 32767
+
+
+def export_path(job_id: str, fmt: str) -> str:
+    return os.path.join(RESULTS_DIR, f"{job_id}.{fmt}")
+
+
+def has_export(job_id: str, fmt: str) -> bool:
+    return os.path.exists(export_path(job_id, fmt))
+
+
+def read_export_bytes(job_id: str, fmt: str) -> bytes:
+    with open(export_path(job_id, fmt), "rb") as f:
+        return f.read()
+
+
+def _write_csv(parquet_file: pq.ParquetFile, path: str) -> None:
+    # utf-8-sig agar Excel baca UTF-8 dengan benar
+    with open(path, "w", encoding="utf-8-sig", newline="") as f:
+        for i, batch in enumerate(parquet_file.iter_batches(batch_size=EXPORT_BATCH_SIZE)):
+            batch.to_pandas().to_csv(f, index=False, header=(i == 0))
+
+
+def _excel_value(value):
+    if isinstance(value, str):
+        value = ILLEGAL_CHARACTERS_RE.sub("", value)
+        return value[:EXCEL_MAX_CELL_CHARS]
+    return value
+
+
+def _write_xlsx(parquet_file: pq.ParquetFile, path: str) -> None:
+    # write_only: baris langsung di-stream ke file, memory konstan berapa pun jumlah artikel
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet("Sheet1")
+    sheet.append(parquet_file.schema_arrow.names)
+    for batch in parquet_file.iter_batches(batch_size=EXPORT_BATCH_SIZE):
+        columns = [column.to_pylist() for column in batch.columns]
+        for row in zip(*columns):
+            sheet.append([_excel_value(v) for v in row])
+    workbook.save(path)
+
+
+def export_results(job_id: str, fmt: str) -> str:
+    """
+    Buat file ekspor (csv/xlsx) dari Parquet hasil job kalau belum ada.
+    Dibaca per batch, jadi seluruh hasil tidak pernah ada di memory sekaligus.
+    Return: path file ekspor.
+    """
+    if fmt not in EXPORT_FORMATS:
+        raise ValueError(f"fmt harus salah satu dari {EXPORT_FORMATS}")
+    path = export_path(job_id, fmt)
+    if not os.path.exists(path):
+        tmp_path = f"{path}.tmp.{fmt}"
+        parquet_file = pq.ParquetFile(results_path(job_id))
+        if fmt == "csv":
+            _write_csv(parquet_file, tmp_path)
+        else:
+            _write_xlsx(parquet_file, tmp_path)
+        os.replace(tmp_path, path)
+    return path
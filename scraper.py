@@ -1,8 +1,10 @@
 from gnews import GNews
 from newspaper import Article
 from datetime import datetime
+import os
 import time
 import re
+import threading
 import requests as req_lib
 from bs4 import BeautifulSoup
 
@@ -14,22 +16,31 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 
+from article_record import ArticleRecord, ArticleStatus
+from content_validation import is_social_media_url, validate_content
+from language_detect import UNDETERMINED, detect_language
+from publisher_templates import find_template, scrape_with_template
+
 
 # ============================================================
-# Global Selenium Driver (reuse untuk efficiency)
+# Selenium Driver per Thread (reuse untuk efficiency)
 # ============================================================
 
-_driver = None
+# Fallback browser bisa dimatikan (server tanpa Chrome, benchmark offline):
+# URL yang gagal di-resolve/di-extract dengan requests langsung dianggap gagal.
+USE_SELENIUM = os.environ.get("SCRAPER_USE_SELENIUM", "1") != "0"
+
+# Satu driver per thread: job pencarian (jobs.py) bisa berjalan paralel di
+# thread berbeda, dan WebDriver tidak aman dipakai bersama antar thread.
+_local = threading.local()
 
 
 def get_selenium_driver():
     """
-    Get or create Selenium WebDriver instance.
-    Driver di-reuse untuk semua requests agar lebih efisien.
+    Get or create Selenium WebDriver instance untuk thread ini.
+    Driver di-reuse untuk semua requests di thread yang sama agar lebih efisien.
     """
-    global _driver
-    
-    if _driver is None:
+    if getattr(_local, 'driver', None) is None:
         chrome_options = Options()
         chrome_options.add_argument('--headless')  # Tanpa GUI
         chrome_options.add_argument('--no-sandbox')
@@ -42,56 +53,17 @@ def get_selenium_driver():
         prefs = {'profile.managed_default_content_settings.images': 2}
         chrome_options.add_experimental_option('prefs', prefs)
         
-        _driver = webdriver.Chrome(options=chrome_options)
+        _local.driver = webdriver.Chrome(options=chrome_options)
     
-    return _driver
+    return _local.driver
 
 
 def close_selenium_driver():
-    """Close Selenium driver saat selesai."""
-    global _driver
-    if _driver is not None:
-        _driver.quit()
-        _driver = None
-
-
-# ============================================================
-# Daftar Domain & Pattern untuk Validasi Konten
-# ============================================================
-
-SOCIAL_MEDIA_DOMAINS = [
-    'twitter.com', 'x.com', 'facebook.com', 'fb.com',
-    'instagram.com', 'tiktok.com',
-]
-
-GARBAGE_CONTENT_PATTERNS = [
-    'javascript is not available',
-    'javascript is disabled in this browser',
-    'please enable javascript',
-    'switch to a supported browser',
-    'continue using x.com',
-    'continue using twitter.com',
-    'cookies are disabled',
-    'access denied',
-    '403 forbidden',
-    'halaman tidak ditemukan',
-    'page not found',
-    '404 not found',
-]
-
-
-def is_social_media_url(url: str) -> bool:
-    """Cek apakah URL mengarah ke platform sosial media."""
-    url_lower = url.lower()
-    return any(domain in url_lower for domain in SOCIAL_MEDIA_DOMAINS)
-
-
-def is_garbage_content(content: str) -> bool:
-    """Cek apakah content hasil scrape adalah garbage/bukan berita."""
-    if not content or len(content.strip()) < 50:
-        return True
-    content_lower = content.lower()
-    return any(pattern in content_lower for pattern in GARBAGE_CONTENT_PATTERNS)
+    """Close Selenium driver milik thread ini saat selesai."""
+    driver = getattr(_local, 'driver', None)
+    if driver is not None:
+        driver.quit()
+        _local.driver = None
 
 
 # ============================================================
@@ -99,7 +71,7 @@ def is_garbage_content(content: str) -> bool:
 # ============================================================
 
 def fetch_rss(keyword: str, max_results: int = 100) -> dict:
-    """Fetch berita dari Google News menggunakan GNews."""
+    """Fetch berita dari Google News menggunakan GNews. Return: error dan list ArticleRecord."""
     try:
         google_news = GNews(
             language='id',
@@ -125,14 +97,12 @@ def fetch_rss(keyword: str, max_results: int = 100) -> dict:
             else:
                 nama_media = str(publisher_info) if publisher_info else 'Unknown'
             
-            articles.append({
-                'title': judul,
-                'date': tanggal,
-                'url': item.get('url', ''),
-                'source': nama_media,
-                'content': '',
-                'journalist': ''
-            })
+            articles.append(ArticleRecord(
+                title=judul,
+                date=tanggal,
+                url=item.get('url', ''),
+                source=nama_media
+            ))
         
         return {'error': None, 'articles': articles}
     
@@ -266,13 +236,13 @@ def filter_by_date(articles: list[dict], from_date: datetime, to_date: datetime)
 # BAGIAN 4: Scraping Full Text
 # ============================================================
 
-def scrape_with_newspaper(url: str) -> dict:
-    """Scrape artikel pakai newspaper3k."""
+def scrape_with_newspaper(url: str, html: str | None = None) -> dict:
+    """Scrape artikel pakai newspaper3k (`html`: halaman yang sudah di-download, tidak diunduh ulang)."""
     result = {'content': '', 'journalist': ''}
     
     try:
         article = Article(url, language='id')
-        article.download()
+        article.download(input_html=html)
         article.parse()
         
         if article.text and len(article.text.strip()) > 50:
@@ -281,8 +251,9 @@ def scrape_with_newspaper(url: str) -> dict:
         if article.authors:
             result['journalist'] = ', '.join(article.authors)
     
-    except Exception as e:
-        result['content'] = f'[newspaper3k: {str(e)}]'
+    except Exception:
+        # Gagal download/parse → konten kosong, fallback ke Selenium
+        pass
     
     return result
 
@@ -340,58 +311,91 @@ def scrape_with_selenium_direct(url: str) -> dict:
 
 
 def scrape_full_text(google_news_url: str) -> dict:
-    """Main scraping function."""
-    result = {'resolved_url': google_news_url, 'content': '', 'journalist': ''}
+    """
+    Main scraping function.
+    Return: resolved_url, content, journalist, status (ArticleStatus),
+    quality (skor validate_content), language, published (tanggal terbit
+    dari template media, kalau ada), dan extractor yang berhasil
+    ("template", "newspaper", "selenium"); kalau gagal, content kosong dan
+    alasannya ada di status.
+    """
+    result = {'resolved_url': google_news_url, 'content': '', 'journalist': '',
+              'status': ArticleStatus.OK, 'quality': 0.0, 'language': UNDETERMINED,
+              'published': None, 'extractor': None}
     
     # Step 1: Resolve URL — coba requests dulu (cepat), fallback ke Selenium
     real_url = resolve_with_requests(google_news_url)
     if not real_url:
-        real_url = resolve_google_news_url_selenium(google_news_url)
+        real_url = resolve_google_news_url_selenium(google_news_url) if USE_SELENIUM else google_news_url
     result['resolved_url'] = real_url
     
     # Kalau masih Google URL → gagal resolve
     if 'google.com' in real_url or 'gstatic.com' in real_url:
-        result['content'] = '[URL tidak berhasil di-resolve]'
+        result['status'] = ArticleStatus.UNRESOLVED
         return result
     
     # Skip social media URLs (Twitter/X, Facebook, dll.)
     if is_social_media_url(real_url):
-        result['content'] = '[Konten dari media sosial - tidak di-scrape]'
+        result['status'] = ArticleStatus.SOCIAL_MEDIA
         return result
     
-    # Coba newspaper3k dulu
-    newspaper_result = scrape_with_newspaper(real_url)
-    if (newspaper_result['content'] and 
-        len(newspaper_result['content']) > 100 and 
-        not newspaper_result['content'].startswith('[') and
-        not is_garbage_content(newspaper_result['content'])):
+    # Media dengan template (detik, kompas, dll.): HTML statis + selector khusus
+    html = None
+    template = find_template(real_url)
+    if template is not None:
+        template_result = scrape_with_template(real_url, template)
+        template_check = validate_content(template_result['content'])
+        if template_check['ok'] and len(template_result['content']) > 100:
+            result['content'] = template_result['content']
+            result['journalist'] = template_result['journalist']
+            result['published'] = template_result['published']
+            result['quality'] = template_check['score']
+            result['language'] = detect_language(result['content'])['language']
+            result['extractor'] = 'template'
+            return result
+        # Template gagal (layout berubah?): HTML yang sudah di-download dipakai newspaper3k
+        html = template_result['html'] or None
+    
+    # Heuristik umum newspaper3k
+    newspaper_result = scrape_with_newspaper(real_url, html=html)
+    newspaper_check = validate_content(newspaper_result['content'])
+    if newspaper_check['ok'] and len(newspaper_result['content']) > 100:
         result['content'] = newspaper_result['content']
         result['journalist'] = newspaper_result['journalist']
+        result['quality'] = newspaper_check['score']
+        result['language'] = detect_language(result['content'])['language']
+        result['extractor'] = 'newspaper'
         return result
     
     # Fallback: Selenium scraping
-    selenium_result = scrape_with_selenium_direct(real_url)
-    if (selenium_result['content'] and 
-        len(selenium_result['content']) > 100 and
-        not is_garbage_content(selenium_result['content'])):
+    selenium_result = scrape_with_selenium_direct(real_url) if USE_SELENIUM else {'content': '', 'journalist': ''}
+    selenium_check = validate_content(selenium_result['content'])
+    if selenium_check['ok'] and len(selenium_result['content']) > 100:
         result['content'] = selenium_result['content']
         result['journalist'] = selenium_result['journalist'] or newspaper_result['journalist']
+        result['quality'] = selenium_check['score']
+        result['language'] = detect_language(result['content'])['language']
+        result['extractor'] = 'selenium'
         return result
     
     # Semua gagal
-    if newspaper_result['content'] and not is_garbage_content(newspaper_result['content']):
+    if newspaper_check['ok']:
         result['content'] = newspaper_result['content']
         result['journalist'] = newspaper_result['journalist']
+        result['quality'] = newspaper_check['score']
+        result['language'] = detect_language(result['content'])['language']
+        result['extractor'] = 'newspaper'
     else:
-        result['content'] = '[Konten tidak berhasil di-extract]'
+        result['status'] = ArticleStatus.EXTRACT_FAILED
     
     return result
 
 
-def scrape_all_articles(articles: list[dict], delay: float = 1.0) -> list[dict]:
+def scrape_all_articles(articles: list[ArticleRecord], delay: float = 1.0, on_article=None) -> list[dict]:
     """
     Scrape semua artikel dengan delay.
     Selenium driver akan di-reuse untuk semua artikel.
+    `on_article(done, total, article)` dipanggil setiap satu artikel selesai (untuk progress).
     """
     scraped = []
     
@@ -402,9 +406,17 @@ def scrape_all_articles(articles: list[dict], delay: float = 1.0) -> list[dict]:
             article['content'] = result['content']
             article['journalist'] = result['journalist']
             article['url'] = result['resolved_url']
+            article['status'] = result['status']
+            article['quality'] = result['quality']
+            article['language'] = result['language']
+            if article.get('date') is None and result['published'] is not None:
+                article['date'] = result['published']
             
             scraped.append(article)
             
+            if on_article is not None:
+                on_article(i + 1, len(articles), article)
+            
             if i < len(articles) - 1:
                 time.sleep(delay)
     
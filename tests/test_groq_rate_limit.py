@@ -0,0 +1,234 @@
+"""
+Rate limiter & retry Groq, diuji terhadap MockGroqServer (tanpa API key/internet).
+
+Jam limiter diganti FakeClock: time.sleep di rate_limiter tidak benar-benar
+tidur tapi memajukan jam dan dicatat, jadi jeda yang dipaksakan limiter bisa
+diperiksa persis tanpa membuat test lambat.
+"""
+
+import pytest
+from groq import APIConnectionError, InternalServerError
+
+import nlp_pipelinev2
+import rate_limiter
+from benchmarks.mock_groq_server import MockGroqServer
+from rate_limiter import RateLimiter, parse_duration
+
+MESSAGES = [{"role": "user", "content": "Teks Berita: Harga beras naik di pasar tradisional."}]
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+        self.sleeps = []
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class ScriptedServer(MockGroqServer):
+    """Jawab request pertama sesuai `script` (status, header), sisanya normal."""
+
+    def __init__(self, script, **kwargs):
+        super().__init__(latency=0, **kwargs)
+        self.script = list(script)
+
+    def handle(self, handler, request):
+        with self.lock:
+            step = self.script.pop(0) if self.script else None
+            if step is not None:
+                self.stats["requests"] += 1
+        if step is None:
+            super().handle(handler, request)
+            return
+        status, headers = step
+        self._send(handler, status, {"error": {"message": f"mock {status}"}}, headers)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(rate_limiter, "time", clock)
+    return clock
+
+
+@pytest.fixture
+def groq_env(monkeypatch, clock):
+    """Arahkan client Groq ke server mock dan pakai limiter baru per test."""
+    servers = []
+
+    def start(server: MockGroqServer, rpm: int = 1000, tpm: int = 10 ** 7) -> RateLimiter:
+        servers.append(server.start())
+        monkeypatch.setenv("GROQ_BASE_URL", server.base_url)
+        monkeypatch.setenv("GROQ_API_KEY", "test")
+        monkeypatch.setattr(nlp_pipelinev2, "_client", None)
+        limiter = RateLimiter(rpm, tpm)
+        monkeypatch.setattr(nlp_pipelinev2, "_rate_limiter", limiter)
+        return limiter
+
+    yield start
+    for server in servers:
+        server.stop()
+
+
+def record_backoffs(monkeypatch, limiter: RateLimiter) -> list:
+    """Catat (attempt, ada header?, jeda) setiap kali limiter.backoff dipanggil."""
+    calls = []
+    original = limiter.backoff
+
+    def backoff(attempt, headers=None, **kwargs):
+        delay = original(attempt, headers, **kwargs)
+        calls.append((attempt, headers is not None, delay))
+        return delay
+
+    monkeypatch.setattr(limiter, "backoff", backoff)
+    return calls
+
+
+# ============================================================
+# parse_duration & RateLimiter
+# ============================================================
+
+@pytest.mark.parametrize("value, expected", [
+    ("7.66s", 7.66),
+    ("2m59.56s", 179.56),
+    ("120ms", 0.12),
+    ("1h2m", 3720.0),
+    ("3", 3.0),
+    ("0.5", 0.5),
+    ("", None),
+    (None, None),
+    ("besok", None),
+])
+def test_parse_duration(value, expected):
+    result = parse_duration(value)
+    if expected is None:
+        assert result is None
+    else:
+        assert result == pytest.approx(expected)
+
+
+def test_request_bucket_refills_at_rpm(clock):
+    limiter = RateLimiter(requests_per_minute=60, tokens_per_minute=10 ** 6)
+    for _ in range(60):
+        limiter.acquire(1)
+    assert clock.sleeps == []
+
+    # Bucket kosong: 60 RPM → 1 request per detik
+    limiter.acquire(1)
+    assert sum(clock.sleeps) == pytest.approx(1.0)
+
+
+def test_token_bucket_clamped_by_remaining_tokens_header(clock):
+    limiter = RateLimiter(requests_per_minute=1000, tokens_per_minute=6000)  # 100 token/detik
+    limiter.update_from_headers({"x-ratelimit-remaining-tokens": "100"})
+
+    limiter.acquire(300)
+    assert sum(clock.sleeps) == pytest.approx(2.0)
+
+
+def test_exhausted_requests_header_blocks_until_reset(clock):
+    limiter = RateLimiter(requests_per_minute=1000, tokens_per_minute=10 ** 6)
+    limiter.update_from_headers({
+        "x-ratelimit-remaining-requests": "0",
+        "x-ratelimit-reset-requests": "7.5s",
+    })
+
+    limiter.acquire(1)
+    assert sum(clock.sleeps) == pytest.approx(7.5)
+
+
+def test_backoff_uses_retry_after_plus_jitter(clock):
+    limiter = RateLimiter(requests_per_minute=1000, tokens_per_minute=10 ** 6)
+    delays = [limiter.backoff(0, {"retry-after": "2"}) for _ in range(50)]
+    assert all(2.0 <= d <= 3.0 for d in delays)
+    assert len(set(delays)) > 1
+
+
+def test_backoff_without_header_is_exponential_full_jitter(clock):
+    limiter = RateLimiter(requests_per_minute=1000, tokens_per_minute=10 ** 6)
+    for attempt in range(8):
+        cap = min(60.0, 2 ** attempt)
+        delays = [limiter.backoff(attempt) for _ in range(20)]
+        assert all(0.0 <= d <= cap for d in delays)
+
+
+# ============================================================
+# _chat_json terhadap MockGroqServer
+# ============================================================
+
+def test_429_is_retried_after_retry_after(groq_env, clock, monkeypatch):
+    server = ScriptedServer([(429, {"retry-after": "3"}), (429, {"retry-after": "3"})])
+    limiter = groq_env(server)
+    backoffs = record_backoffs(monkeypatch, limiter)
+
+    result = nlp_pipelinev2._chat_json(MESSAGES)
+
+    assert result["sentiment"] == "Netral"
+    assert server.stats["requests"] == 3
+    assert [(attempt, with_headers) for attempt, with_headers, _ in backoffs] == [(0, True), (1, True)]
+    assert all(3.0 <= delay <= 4.0 for _, _, delay in backoffs)
+    # Request berikutnya ditahan limiter selama jeda backoff
+    assert sum(clock.sleeps) == pytest.approx(sum(delay for _, _, delay in backoffs))
+
+
+@pytest.mark.parametrize("status", [500, 502, 503])
+def test_5xx_is_retried_with_jittered_backoff(groq_env, monkeypatch, status):
+    server = ScriptedServer([(status, {}), (status, {})])
+    limiter = groq_env(server)
+    backoffs = record_backoffs(monkeypatch, limiter)
+
+    result = nlp_pipelinev2._chat_json(MESSAGES)
+
+    assert result["sentiment"] == "Netral"
+    assert server.stats["requests"] == 3
+    assert [attempt for attempt, _, _ in backoffs] == [0, 1]
+    assert all(0.0 <= delay <= 2 ** attempt for attempt, _, delay in backoffs)
+
+
+def test_5xx_gives_up_after_max_retries(groq_env, monkeypatch):
+    monkeypatch.setattr(nlp_pipelinev2, "GROQ_MAX_RETRIES", 2)
+    server = ScriptedServer([(503, {})] * 10)
+    limiter = groq_env(server)
+    backoffs = record_backoffs(monkeypatch, limiter)
+
+    with pytest.raises(InternalServerError):
+        nlp_pipelinev2._chat_json(MESSAGES)
+
+    assert server.stats["requests"] == 3
+    assert len(backoffs) == 2
+
+
+def test_connection_error_is_retried_then_raised(groq_env, monkeypatch):
+    monkeypatch.setattr(nlp_pipelinev2, "GROQ_MAX_RETRIES", 2)
+    server = MockGroqServer(latency=0)
+    limiter = groq_env(server)
+    backoffs = record_backoffs(monkeypatch, limiter)
+    # Server dimatikan → koneksi ditolak
+    server.stop()
+
+    with pytest.raises(APIConnectionError):
+        nlp_pipelinev2._chat_json(MESSAGES)
+
+    assert [(attempt, with_headers) for attempt, with_headers, _ in backoffs] == [(0, False), (1, False)]
+
+
+def test_limiter_adapts_to_server_ratelimit_headers(groq_env, clock):
+    # Kuota server 2 RPM, perkiraan lokal jauh lebih longgar
+    server = MockGroqServer(rpm=2, latency=0)
+    groq_env(server, rpm=1000)
+
+    nlp_pipelinev2._chat_json(MESSAGES)
+    nlp_pipelinev2._chat_json(MESSAGES)
+    assert clock.sleeps == []
+
+    # Header remaining-requests=0 → request ketiga ditahan sampai reset (±60 detik),
+    # bukan dikirim lalu kena 429. Yang diuji jedanya saja: setelah jeda di jam
+    # palsu, jendela server (jam asli) belum benar-benar lewat.
+    nlp_pipelinev2.get_rate_limiter().acquire(1)
+    assert 55.0 <= sum(clock.sleeps) <= 60.0
+    assert server.stats["rate_limited"] == 0
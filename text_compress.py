@@ -0,0 +1,210 @@
+"""
+Kompresi konten artikel sebelum dikirim ke LLM, berdasarkan budget token.
+
+Sebelumnya konten dipotong di 6000 karakter: boilerplate ("Baca juga", caption
+foto, ajakan follow, dsb.) ikut terkirim sementara bagian akhir artikel hilang.
+Di sini:
+
+1. Baris boilerplate dibuang (satu regex ter-compile).
+2. Kalimat duplikat (paragraf/caption berulang) dibuang.
+3. Kalau masih melebihi budget, kalimat di-ranking (posisi + bobot kata
+   penting) lalu dipilih yang terbaik sampai budget penuh, ditampilkan
+   sesuai urutan asli.
+
+Jumlah token adalah perkiraan: model Llama di Groq memakai tokenizer sendiri,
+di sini dihitung dengan encoding tiktoken yang paling mirip (cl100k_base,
+basis vocabulary Llama 3; bisa diganti lewat TOKEN_ENCODING). Encoding di-load
+saat pertama dipakai, bukan saat import (file BPE bisa perlu di-download).
+Kalau tiktoken tidak terpasang atau encoding gagal di-load (offline), pakai
+estimasi berbasis kata yang dikalibrasi untuk teks Bahasa Indonesia.
+"""
+
+import math
+import os
+import re
+import threading
+from collections import Counter
+
+try:
+    import tiktoken
+except ImportError:
+    tiktoken = None
+
+# Kosongkan untuk selalu memakai estimasi per kata
+TOKEN_ENCODING = os.environ.get("TOKEN_ENCODING", "cl100k_base")
+
+
+# ============================================================
+# BAGIAN 1: Hitung Token
+# ============================================================
+
+_WORD_RE = re.compile(r"\w+|[^\w\s]", re.UNICODE)
+
+_encoding = None
+_encoding_loaded = False
+_encoding_lock = threading.Lock()
+
+
+def get_encoding():
+    """Encoding tiktoken (di-load sekali saat pertama dipakai), None kalau tidak tersedia."""
+    global _encoding, _encoding_loaded
+    if not _encoding_loaded:
+        with _encoding_lock:
+            if not _encoding_loaded:
+                if tiktoken is not None and TOKEN_ENCODING:
+                    try:
+                        _encoding = tiktoken.get_encoding(TOKEN_ENCODING)
+                    except Exception:
+                        # Encoding tidak bisa di-download/di-load (offline) → estimasi
+                        _encoding = None
+                _encoding_loaded = True
+    return _encoding
+
+
+def count_tokens(text: str) -> int:
+    """Perkiraan jumlah token text (tiktoken kalau ada, kalau tidak estimasi per kata)."""
+    if not text:
+        return 0
+    encoding = get_encoding()
+    if encoding is not None:
+        return len(encoding.encode(text, disallowed_special=()))
+    # Estimasi: kata pendek ≈ 1 token, kata panjang (imbuhan Bahasa Indonesia)
+    # terpecah jadi beberapa sub-token; tanda baca = 1 token
+    return sum(1 + len(piece) // 6 if piece[0].isalnum() else 1 for piece in _WORD_RE.findall(text))
+
+
+# ============================================================
+# BAGIAN 2: Boilerplate & Duplikat
+# ============================================================
+
+# Baris yang bukan isi berita: tautan artikel lain, caption, ajakan follow/download, kredit.
+# Judul blok yang juga kata biasa ("Populer di kalangan ...") hanya dianggap
+# boilerplate kalau diikuti pemisah (":", "-", "|", "»") atau berdiri sendiri.
+_BOILERPLATE_RE = re.compile(
+    r"^\s*(?:"
+    r"baca juga|baca selengkapnya|simak juga|lihat juga|tonton juga|cek juga|"
+    r"(?:artikel terkait|berita terkait|rekomendasi|populer|terpopuler)(?:\s*[:|»\-–]|\s*$)|"
+    r"copyright\s*(?:©|\(c\)|\d{4})|"
+    r"advertisement|scroll to continue|gambas:|"
+    r"\(?foto\s*:|\(?ilustrasi\s*:|\(?sumber foto|\(?dok\.|"
+    r"ikuti (?:kami|berita|kanal)|dapatkan (?:update|informasi|berita)|"
+    r"download aplikasi|unduh aplikasi|klik di sini|"
+    r"artikel ini telah tayang|halaman selanjutnya|"
+    r"editor\s*:|penulis\s*:|reporter\s*:|pewarta\s*:|©"
+    r")",
+    re.IGNORECASE
+)
+
+_SENTENCE_BOUNDARY_RE = re.compile(r"(?<=[.!?])\s+")
+_DEDUP_KEY_RE = re.compile(r"\W+")
+
+
+def _split_sentences(content: str) -> list[str]:
+    """Buang baris boilerplate lalu pecah jadi kalimat unik (urutan asli)."""
+    sentences = []
+    seen = set()
+    for line in content.splitlines():
+        line = line.strip()
+        if not line or _BOILERPLATE_RE.match(line):
+            continue
+        for sentence in _SENTENCE_BOUNDARY_RE.split(line):
+            sentence = sentence.strip()
+            if not sentence or _BOILERPLATE_RE.match(sentence):
+                continue
+            key = _DEDUP_KEY_RE.sub(" ", sentence.lower()).strip()
+            if key in seen:
+                continue
+            seen.add(key)
+            sentences.append(sentence)
+    return sentences
+
+
+# ============================================================
+# BAGIAN 3: Ranking Kalimat & Kompresi
+# ============================================================
+
+def _rank_sentences(sentences: list[str]) -> list[float]:
+    """
+    Skor kalimat: rata-rata frekuensi kata penting (kata > 3 huruf) di artikel,
+    ditambah bonus posisi (lead berita) dan sedikit bonus untuk penutup.
+    """
+    words_per_sentence = [[w for w in _WORD_RE.findall(s.lower()) if len(w) > 3] for s in sentences]
+    freq = Counter(w for words in words_per_sentence for w in set(words))
+    max_freq = max(freq.values(), default=1)
+
+    n = len(sentences)
+    scores = []
+    for pos, words in enumerate(words_per_sentence):
+        content_score = sum(freq[w] for w in words) / (len(words) * max_freq) if words else 0.0
+        position_score = 1.0 / math.sqrt(pos + 1)
+        closing_bonus = 0.2 if pos == n - 1 and n > 2 else 0.0
+        scores.append(content_score + position_score + closing_bonus)
+    return scores
+
+
+def compress_content(content: str, token_budget: int) -> dict:
+    """
+    Kompres konten ke dalam `token_budget` token.
+    Return: dict berisi 'text', 'tokens_before' (konten asli), 'tokens_after'.
+    """
+    tokens_before = count_tokens(content)
+    sentences = _split_sentences(content)
+
+    # Artikel pendek yang seluruhnya boilerplate → pakai aslinya saja
+    if not sentences:
+        text = content.strip()
+        return {"text": text, "tokens_before": tokens_before, "tokens_after": count_tokens(text)}
+
+    sentence_tokens = [count_tokens(s) + 1 for s in sentences]
+
+    if sum(sentence_tokens) <= token_budget:
+        selected = range(len(sentences))
+    else:
+        scores = _rank_sentences(sentences)
+        selected = []
+        used = 0
+        for idx in sorted(range(len(sentences)), key=lambda i: scores[i], reverse=True):
+            if used + sentence_tokens[idx] <= token_budget:
+                selected.append(idx)
+                used += sentence_tokens[idx]
+        if not selected:
+            # Satu kalimat saja sudah melebihi budget → potong kalimat terbaik
+            best = max(range(len(sentences)), key=lambda i: scores[i])
+            words = sentences[best].split()
+            ratio = token_budget / sentence_tokens[best]
+            sentences[best] = " ".join(words[:max(1, int(len(words) * ratio))])
+            selected = [best]
+        selected = sorted(selected)
+
+    text = " ".join(sentences[i] for i in selected)
+    return {"text": text, "tokens_before": tokens_before, "tokens_after": count_tokens(text)}
+
+
+class CompressionStats:
+    """Akumulasi token sebelum/sesudah kompresi untuk satu run (thread-safe)."""
+
+    def __init__(self):
+        self.articles = 0
+        self.tokens_before = 0
+        self.tokens_after = 0
+        self._lock = threading.Lock()
+
+    def add(self, result: dict):
+        with self._lock:
+            self.articles += 1
+            self.tokens_before += result["tokens_before"]
+            self.tokens_after += result["tokens_after"]
+
+    @property
+    def tokens_saved(self) -> int:
+        return self.tokens_before - self.tokens_after
+
+    def as_dict(self) -> dict:
+        saved_pct = 100.0 * self.tokens_saved / self.tokens_before if self.tokens_before else 0.0
+        return {
+            "articles": self.articles,
+            "tokens_before": self.tokens_before,
+            "tokens_after": self.tokens_after,
+            "tokens_saved": self.tokens_saved,
+            "saved_pct": round(saved_pct, 1),
+        }
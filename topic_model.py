@@ -0,0 +1,308 @@
+"""
+Topic modelling level korpus (klaster isu) yang di-update secara incremental.
+
+Berbeda dengan `extract_topics` (keyword per artikel), modul ini mempelajari
+sejumlah topik/isu dari seluruh artikel yang pernah diproses, lalu memberi
+setiap artikel sebuah `topic_id`. Dengan begitu analis bisa melihat isu mana
+yang mendominasi sebuah keyword dari waktu ke waktu.
+
+Desain supaya scale ke puluhan ribu artikel:
+- HashingVectorizer (stateless) → tidak perlu refit vocabulary saat artikel baru masuk.
+- IDF dihitung dari document-frequency yang diakumulasi secara incremental.
+- MiniBatchNMF.partial_fit → model di-update per batch artikel baru, bukan fit ulang.
+- Artikel yang sudah pernah dipakai untuk training (berdasarkan hash konten) dilewati;
+  daftar hash dibatasi MAX_SEEN_HASHES (yang paling lama dibuang duluan).
+- Yang disimpan ke disk hanya komponen NMF (float32), document-frequency, label
+  kata, dan konfigurasi vectorizer (npz, beberapa MB), bukan pickle seluruh
+  objek. Penyimpanan dilakukan setiap SAVE_EVERY update, di luar lock model.
+  Setelah load, komponen dipakai sebagai init "custom" untuk update berikutnya.
+"""
+
+import atexit
+import hashlib
+import os
+import threading
+
+import numpy as np
+from sklearn.decomposition import MiniBatchNMF, non_negative_factorization
+from sklearn.feature_extraction.text import HashingVectorizer
+from sklearn.preprocessing import normalize
+from sklearn.utils import murmurhash3_32
+
+from language_detect import is_local_language
+from nlp_pipeline import STOPWORDS_ID, TOPIC_TOKEN_PATTERN, is_processable
+
+
+MODEL_PATH = os.environ.get("TOPIC_MODEL_PATH", os.path.join(".cache", "topic_model.npz"))
+# Simpan ke disk setiap N update model (sisanya disimpan saat proses selesai)
+SAVE_EVERY = int(os.environ.get("TOPIC_MODEL_SAVE_EVERY", "5"))
+
+N_FEATURES = 2 ** 16
+N_TOPICS = 12
+MAX_SEEN_HASHES = 100_000  # Batas jumlah hash konten yang diingat (anti training ulang)
+DTYPE = np.float32
+
+
+def _content_hash(content: str) -> str:
+    return hashlib.sha1(content.encode("utf-8")).hexdigest()[:16]
+
+
+class CorpusTopicModel:
+    """NMF incremental di atas TF-IDF berbasis hashing."""
+
+    def __init__(self, n_topics: int = N_TOPICS, n_features: int = N_FEATURES):
+        self.n_topics = n_topics
+        self.n_features = n_features
+        self.doc_freq = np.zeros(n_features, dtype=DTYPE)
+        self.n_docs = 0
+        self.components = None  # (n_topics × n_features), yang dipersist
+        self.nmf = None         # MiniBatchNMF aktif (tidak dipersist)
+        self.term_labels = {}   # index hash → kata asli (untuk menampilkan label topik)
+        self.seen_hashes = {}   # hash konten → None (dict = set berurutan, untuk pruning FIFO)
+        self.updates_since_save = 0
+
+    # --------------------------------------------------------
+    # Vektorisasi
+    # --------------------------------------------------------
+
+    def vectorizer_config(self) -> dict:
+        return {
+            "n_features": self.n_features,
+            "alternate_sign": False,
+            "norm": None,
+            "lowercase": True,
+            "ngram_range": (1, 2),
+            "token_pattern": TOPIC_TOKEN_PATTERN,
+        }
+
+    def _vectorizer(self) -> HashingVectorizer:
+        return HashingVectorizer(stop_words=list(STOPWORDS_ID), dtype=DTYPE, **self.vectorizer_config())
+
+    def _idf(self) -> np.ndarray:
+        return (np.log((1 + self.n_docs) / (1 + self.doc_freq)) + 1.0).astype(DTYPE)
+
+    def _tfidf(self, counts):
+        tf = counts.copy()
+        tf.data = np.log1p(tf.data)  # sublinear tf
+        return normalize(tf.multiply(self._idf()).tocsr()).astype(DTYPE)
+
+    def _hash_index(self, term: str) -> int:
+        """Index fitur untuk sebuah kata (sama dengan yang dihitung HashingVectorizer)."""
+        h = murmurhash3_32(term, seed=0, positive=False)
+        if h == -2147483648:
+            return (2147483647 - (self.n_features - 1)) % self.n_features
+        return abs(h) % self.n_features
+
+    def _remember_terms(self, texts: list[str]):
+        """Simpan map index hash → kata supaya label topik bisa dibaca."""
+        analyzer = self._vectorizer().build_analyzer()
+        for text in texts:
+            # Setiap index hanya menyimpan satu kata, jadi map tidak lebih besar dari n_features
+            if len(self.term_labels) >= self.n_features:
+                break
+            for term in set(analyzer(text)):
+                self.term_labels.setdefault(self._hash_index(term), term)
+
+    def _remember_hash(self, h: str) -> bool:
+        """True kalau hash baru. Hash paling lama dibuang kalau melebihi MAX_SEEN_HASHES."""
+        if h in self.seen_hashes:
+            return False
+        self.seen_hashes[h] = None
+        if len(self.seen_hashes) > MAX_SEEN_HASHES:
+            del self.seen_hashes[next(iter(self.seen_hashes))]
+        return True
+
+    # --------------------------------------------------------
+    # Training & assignment
+    # --------------------------------------------------------
+
+    def partial_fit(self, texts: list[str]) -> int:
+        """
+        Update model dengan artikel baru (yang belum pernah dipakai training).
+        Return: jumlah artikel yang benar-benar dipakai untuk update.
+        """
+        new_texts = [text for text in texts if self._remember_hash(_content_hash(text))]
+        if not new_texts:
+            return 0
+
+        counts = self._vectorizer().transform(new_texts).tocsr()
+
+        # Document frequency: setiap fitur dihitung sekali per dokumen
+        np.add.at(self.doc_freq, counts.indices, 1.0)
+        self.n_docs += len(new_texts)
+
+        self._remember_terms(new_texts)
+
+        X = self._tfidf(counts)
+        if self.nmf is None and self.components is not None:
+            # Model hasil load: komponen tersimpan jadi init "custom" (W diabaikan
+            # oleh partial_fit, hanya dicek bentuknya)
+            self.nmf = MiniBatchNMF(n_components=self.n_topics, init="custom", batch_size=256, random_state=42)
+            self.nmf.partial_fit(X, W=np.ones((X.shape[0], self.n_topics), dtype=DTYPE),
+                                 H=self.components.astype(DTYPE))
+        else:
+            if self.nmf is None:
+                # NNDSVD menghasilkan komponen sparse (hanya fitur yang muncul);
+                # butuh minimal n_topics dokumen di batch pertama
+                self.nmf = MiniBatchNMF(
+                    n_components=self.n_topics,
+                    init="nndsvd" if X.shape[0] >= self.n_topics else "random",
+                    batch_size=256,
+                    random_state=42
+                )
+            self.nmf.partial_fit(X)
+        self.components = self.nmf.components_
+        self.updates_since_save += 1
+        return len(new_texts)
+
+    def assign(self, texts: list[str]) -> list[int]:
+        """Tentukan topic_id (komponen NMF dominan) untuk setiap text. -1 kalau tidak ada."""
+        if self.components is None or not texts:
+            return [-1] * len(texts)
+        X = self._tfidf(self._vectorizer().transform(texts))
+        # W dihitung dengan komponen tetap (sama seperti MiniBatchNMF.transform)
+        W, _, _ = non_negative_factorization(
+            X, H=self.components.astype(DTYPE), n_components=self.n_topics,
+            init="custom", update_H=False, solver="mu"
+        )
+        topic_ids = W.argmax(axis=1)
+        return [int(t) if W[i, t] > 0 else -1 for i, t in enumerate(topic_ids)]
+
+    def topic_labels(self, n_terms: int = 4) -> dict[int, str]:
+        """Label tiap topik dari kata-kata dengan bobot tertinggi di komponen NMF."""
+        if self.components is None:
+            return {}
+        labels = {}
+        # Hanya fitur yang pernah muncul di korpus (init random bisa mengisi fitur lain)
+        seen = self.doc_freq > 0
+        for topic_id, component in enumerate(self.components):
+            component = np.where(seen, component, 0.0)
+            # Kandidat cadangan (n_terms * 3) untuk mengganti term yang tumpang tindih
+            k = min(n_terms * 3, len(component))
+            top = np.argpartition(-component, k - 1)[:k]
+            top = top[np.argsort(-component[top])]
+            terms = []
+            for idx in top:
+                term = self.term_labels.get(int(idx))
+                if term and component[idx] > 0 and not any(term in t or t in term for t in terms):
+                    terms.append(term)
+                if len(terms) == n_terms:
+                    break
+            labels[topic_id] = ", ".join(t.title() for t in terms) if terms else f"Topik {topic_id + 1}"
+        return labels
+
+    # --------------------------------------------------------
+    # Persistensi
+    # --------------------------------------------------------
+
+    def config_key(self) -> str:
+        """Konfigurasi yang menentukan arti index fitur & komponen (harus sama saat load)."""
+        return repr(sorted({**self.vectorizer_config(), "n_topics": self.n_topics}.items()))
+
+    def snapshot(self) -> dict:
+        """Salinan state yang dipersist (dibuat di dalam lock, ditulis di luar lock)."""
+        self.updates_since_save = 0
+        keys = np.fromiter(self.term_labels.keys(), dtype=np.int32, count=len(self.term_labels))
+        return {
+            "config": np.array(self.config_key()),
+            "n_docs": np.array(self.n_docs),
+            "doc_freq": self.doc_freq.copy(),
+            "components": (self.components if self.components is not None
+                           else np.zeros((0, self.n_features))).astype(DTYPE),
+            "term_keys": keys,
+            "term_values": np.array(list(self.term_labels.values()), dtype=str),
+            "seen_hashes": np.array(list(self.seen_hashes), dtype=str),
+        }
+
+    @classmethod
+    def load(cls, path: str = MODEL_PATH) -> "CorpusTopicModel":
+        model = cls()
+        if not os.path.exists(path):
+            return model
+        try:
+            with np.load(path, allow_pickle=False) as data:
+                # Konfigurasi vectorizer/topik berubah → index fitur tidak cocok, mulai dari awal
+                if str(data["config"]) != model.config_key():
+                    return model
+                model.n_docs = int(data["n_docs"])
+                model.doc_freq = data["doc_freq"].astype(DTYPE)
+                if data["components"].size:
+                    model.components = data["components"].astype(DTYPE)
+                model.term_labels = dict(zip(data["term_keys"].tolist(), data["term_values"].tolist()))
+                model.seen_hashes = dict.fromkeys(data["seen_hashes"].tolist())
+        except Exception:
+            # File rusak / format lama → mulai dari awal
+            return cls()
+        return model
+
+
+def save_snapshot(snapshot: dict, path: str = MODEL_PATH):
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    tmp_path = path + ".tmp.npz"
+    np.savez_compressed(tmp_path, **snapshot)
+    os.replace(tmp_path, path)
+
+
+# ============================================================
+# Model global di-reuse lintas rerun Streamlit
+# ============================================================
+
+_model = None
+_model_lock = threading.Lock()
+# Penulisan file diserialisasi terpisah supaya update model tidak menunggu disk
+_save_lock = threading.Lock()
+
+
+def get_topic_model() -> CorpusTopicModel:
+    global _model
+    if _model is None:
+        _model = CorpusTopicModel.load()
+    return _model
+
+
+def flush_topic_model():
+    """Simpan model kalau ada update yang belum tersimpan (dipanggil otomatis saat proses selesai)."""
+    with _model_lock:
+        if _model is None or not _model.updates_since_save:
+            return
+        snapshot = _model.snapshot()
+    with _save_lock:
+        save_snapshot(snapshot)
+
+
+atexit.register(flush_topic_model)
+
+
+def update_topic_clusters(articles: list[dict]) -> list[dict]:
+    """
+    Update model topik dengan artikel baru lalu tandai setiap artikel dengan
+    `topic_id` dan `topic_cluster` (label). Artikel tanpa konten valid → -1 / "-".
+    """
+    snapshot = None
+    with _model_lock:
+        model = get_topic_model()
+
+        # Model topik memakai stopword Indonesia → artikel bahasa lain tidak ikut
+        valid = [a for a in articles if is_processable(a) and is_local_language(a)]
+        texts = [a["content"] for a in valid]
+
+        if model.partial_fit(texts) and model.updates_since_save >= SAVE_EVERY:
+            snapshot = model.snapshot()
+
+        topic_ids = model.assign(texts)
+        labels = model.topic_labels()
+
+    if snapshot is not None:
+        with _save_lock:
+            save_snapshot(snapshot)
+
+    for article in articles:
+        article["topic_id"] = -1
+        article["topic_cluster"] = "-"
+    for article, topic_id in zip(valid, topic_ids):
+        article["topic_id"] = topic_id
+        article["topic_cluster"] = labels.get(topic_id, "-")
+
+    return articles
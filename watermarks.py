@@ -0,0 +1,179 @@
+"""
+Crawl incremental dengan watermark per keyword.
+
+Monitoring harian biasanya mencari keyword yang sama dengan rentang tanggal
+yang tumpang tindih dengan kemarin, tapi setiap pencarian men-scrape dan
+menganalisis ulang seluruh rentang. Di sini setiap keyword menyimpan daftar
+URL RSS yang sudah diproses beserta hasil akhirnya (konten + NLP) dan
+konfigurasi NLP yang menghasilkannya (backend, summary_mode, versi model).
+
+`split_new_articles` memisahkan hasil fetch + filter menjadi artikel baru
+(perlu scrape + NLP) dan artikel lama (hasilnya diambil dari store), lalu
+`merge_results` menggabungkan keduanya kembali sesuai urutan RSS. Artikel
+lama yang hasil NLP-nya dibuat dengan konfigurasi lain dianalisis ulang
+(tanpa scrape ulang). Waktu proses jadi sebanding dengan jumlah artikel
+baru, bukan lebar rentang.
+"""
+
+import os
+import sqlite3
+import threading
+from datetime import datetime, timedelta
+
+from article_record import is_scraped
+from jobs import decode_article, encode_article
+
+
+WATERMARK_DB_PATH = os.environ.get("WATERMARK_DB_PATH", os.path.join(".cache", "watermarks.sqlite3"))
+# Artikel yang lebih tua dari ini dibuang dari store
+WATERMARK_RETENTION_DAYS = int(os.environ.get("WATERMARK_RETENTION_DAYS", "90"))
+
+NLP_FIELDS = ("summary", "sentiment", "topics")
+
+
+def normalize_keyword(keyword: str) -> str:
+    return " ".join(keyword.lower().split())
+
+
+def article_key(article: dict) -> str:
+    """Key artikel = URL dari RSS (sebelum di-resolve scraper, yang mengganti 'url')."""
+    return article.get("rss_url") or article.get("url", "")
+
+
+class WatermarkStore:
+    """Watermark + hasil artikel per keyword (SQLite)."""
+
+    def __init__(self, path: str = WATERMARK_DB_PATH):
+        self._lock = threading.Lock()
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._conn = sqlite3.connect(path, check_same_thread=False, timeout=30)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS seen_articles (
+                keyword    TEXT NOT NULL,
+                url        TEXT NOT NULL,
+                date       TEXT,
+                article    TEXT NOT NULL,
+                nlp_config TEXT,
+                PRIMARY KEY (keyword, url)
+            )
+        """)
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(seen_articles)")}
+        if "nlp_config" not in columns:
+            # Store lama: hasil tanpa konfigurasi dianggap tidak cocok dengan konfigurasi mana pun
+            self._conn.execute("ALTER TABLE seen_articles ADD COLUMN nlp_config TEXT")
+        cutoff = (datetime.now() - timedelta(days=WATERMARK_RETENTION_DAYS)).isoformat()
+        self._conn.execute("DELETE FROM seen_articles WHERE date < ?", (cutoff,))
+        self._conn.commit()
+
+    def seen(self, keyword: str, urls: list[str]) -> dict[str, tuple]:
+        """Hasil tersimpan untuk URL yang sudah pernah diproses. Return: {url: (artikel, nlp_config)}."""
+        if not urls:
+            return {}
+        keyword = normalize_keyword(keyword)
+        found = {}
+        with self._lock:
+            # Dicek per potongan supaya tidak melewati batas parameter SQLite
+            for start in range(0, len(urls), 500):
+                chunk = urls[start:start + 500]
+                placeholders = ", ".join("?" * len(chunk))
+                rows = self._conn.execute(
+                    f"SELECT url, article, nlp_config FROM seen_articles "
+                    f"WHERE keyword = ? AND url IN ({placeholders})",
+                    (keyword, *chunk)
+                ).fetchall()
+                found.update((url, (decode_article(raw), config)) for url, raw, config in rows)
+        return found
+
+    def record(self, keyword: str, articles: list[dict], nlp_config: str | None = None) -> None:
+        """Simpan hasil akhir artikel beserta konfigurasi NLP yang menghasilkannya (None = tanpa NLP)."""
+        keyword = normalize_keyword(keyword)
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO seen_articles VALUES (?, ?, ?, ?, ?)",
+                [
+                    (keyword, article_key(a),
+                     a["date"].isoformat() if isinstance(a.get("date"), datetime) else None,
+                     encode_article(a), nlp_config)
+                    for a in articles if article_key(a)
+                ]
+            )
+            self._conn.commit()
+
+    def clear(self, keyword: str) -> None:
+        keyword = normalize_keyword(keyword)
+        with self._lock:
+            self._conn.execute("DELETE FROM seen_articles WHERE keyword = ?", (keyword,))
+            self._conn.commit()
+
+
+# ============================================================
+# Helper untuk alur fetch → scrape → NLP
+# ============================================================
+
+def split_new_articles(store: WatermarkStore, keyword: str, articles: list[dict],
+                       need_nlp: bool = False, nlp_config: str | None = None) -> tuple[list[dict], dict[str, dict]]:
+    """
+    Pisahkan hasil fetch + filter jadi (artikel baru, {url: hasil tersimpan}).
+    Artikel tersimpan yang gagal di-scrape, atau padahal `need_nlp` belum punya
+    hasil NLP atau hasilnya dibuat dengan konfigurasi selain `nlp_config` (lihat
+    nlp_router.nlp_config), dianggap baru lagi (dua yang terakhir tanpa scrape
+    ulang, lihat `needs_scrape`).
+    Setiap artikel diberi field 'rss_url' supaya tetap bisa dicocokkan setelah
+    scraper mengganti 'url' dengan URL asli.
+    """
+    for article in articles:
+        article.setdefault("rss_url", article.get("url", ""))
+
+    seen = store.seen(keyword, [article_key(a) for a in articles])
+    new, known = [], {}
+    for article in articles:
+        key = article_key(article)
+        stored, stored_config = seen.get(key, (None, None))
+        if stored is None:
+            new.append(article)
+        elif not is_scraped(stored):
+            # Scraping sebelumnya gagal → coba lagi
+            new.append(article)
+        elif need_nlp and (any(field not in stored for field in NLP_FIELDS)
+                           or (nlp_config is not None and stored_config != nlp_config)):
+            new.append(stored)
+        else:
+            known[key] = stored
+    return new, known
+
+
+def needs_scrape(article: dict) -> bool:
+    """Artikel baru belum di-scrape; artikel lama tanpa NLP sudah punya konten."""
+    return not is_scraped(article)
+
+
+def merge_results(articles: list[dict], processed: list[dict], known: dict[str, dict]) -> list[dict]:
+    """
+    Gabungkan artikel baru yang sudah diproses dengan hasil tersimpan, urut
+    sesuai `articles`. Skor relevansi diambil dari pencarian saat ini.
+    """
+    by_key = {**known, **{article_key(a): a for a in processed}}
+    merged = []
+    for article in articles:
+        result = by_key.get(article_key(article), article)
+        if result is not article and "relevance" in article:
+            result["relevance"] = article["relevance"]
+        merged.append(result)
+    return merged
+
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def get_watermark_store() -> WatermarkStore:
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = WatermarkStore()
+    return _store